@@ -0,0 +1,78 @@
+"""
+bench_memory.py
+Comments: Bytes held per loaded model object,
+    run from the repository root with: PYTHONPATH=. python benchmarks/bench_memory.py
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import gc
+import tracemalloc
+
+from pyawx.models.inventories import Host
+from pyawx.models.jobs import Job, JobEvent
+
+OBJECTS = 100000
+
+
+class LegacyModel:
+    """The model layout before slots: an instance __dict__ holding three dicts"""
+    __deleted__ = False
+
+    def __init__(self, **kwargs):
+        self._data = kwargs
+        self._changes = dict()
+        self._cache = dict()
+
+
+PAYLOADS = {
+    Host: {
+        "id": 1, "type": "host", "url": "/api/v2/hosts/1/", "name": "web1", "description": "", "inventory": 1,
+        "enabled": True, "instance_id": "", "variables": "", "has_active_failures": False,
+        "has_inventory_sources": False, "last_job": 1, "last_job_host_summary": 1, "insights_system_id": None,
+        "ansible_facts_modified": None, "created": "2021-03-01T00:00:00Z", "modified": "2021-03-01T00:00:00Z"
+    },
+    Job: {
+        "id": 1, "type": "job", "url": "/api/v2/jobs/1/", "name": "Deploy", "description": "", "job_type": "run",
+        "inventory": 1, "project": 1, "playbook": "site.yml", "forks": 0, "limit": "", "verbosity": 0,
+        "extra_vars": "", "job_tags": "", "launch_type": "manual", "status": "successful", "failed": False,
+        "started": "2021-03-01T00:00:00Z", "finished": "2021-03-01T00:01:00Z", "elapsed": 60.0,
+        "job_template": 1, "created": "2021-03-01T00:00:00Z", "modified": "2021-03-01T00:00:00Z"
+    },
+    JobEvent: {
+        "id": 1, "type": "job_event", "url": "/api/v2/job_events/1/", "job": 1, "event": "runner_on_ok",
+        "counter": 1, "event_display": "Host OK", "event_level": 3, "failed": False, "changed": False, "uuid": "",
+        "parent_uuid": "", "host": 1, "host_name": "web1", "playbook": "site.yml", "play": "all", "task": "ping",
+        "role": "", "stdout": "ok: [web1]", "start_line": 1, "end_line": 2, "verbosity": 0,
+        "created": "2021-03-01T00:00:00Z", "modified": "2021-03-01T00:00:00Z"
+    }
+}
+
+
+def measure(factory, payload):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    objects = [factory(internal_=True, **payload) for _ in range(OBJECTS)]
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del objects
+    return (after - before) / OBJECTS
+
+
+def main():
+    print(f"{'model':>10} {'before':>10} {'after':>10}   bytes of overhead per object on top of the payload")
+
+    for model, payload in PAYLOADS.items():
+        data = measure(lambda internal_, **kwargs: kwargs, payload)
+        legacy = measure(LegacyModel, payload) - data
+        current = measure(model, payload) - data
+        print(f"{model.__name__:>10} {legacy:10.0f} {current:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
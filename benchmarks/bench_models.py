@@ -0,0 +1,84 @@
+"""
+bench_models.py
+Comments: Construction and export cost of a page of JobEvents,
+    run from the repository root with: PYTHONPATH=. python benchmarks/bench_models.py
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import json
+from copy import deepcopy
+from timeit import repeat
+
+from pyawx.models.jobs import JobEvent
+
+ROWS = 1000
+
+
+class LegacyJobEvent(JobEvent):
+    """JobEvent with the old construction and export, both deep copy the payload"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._data = deepcopy(self._data)
+
+    def __export__(self):
+        return deepcopy(self._data)
+
+
+def job_event(number):
+    return {
+        "id": number,
+        "type": "job_event",
+        "url": f"/api/v2/job_events/{number}/",
+        "related": {
+            "job": "/api/v2/jobs/1/",
+            "children": f"/api/v2/job_events/{number}/children/",
+            "host": "/api/v2/hosts/1/"
+        },
+        "summary_fields": {
+            "host": {"id": 1, "name": "web1", "description": ""},
+            "job": {"id": 1, "name": "Deploy", "status": "successful", "failed": False, "elapsed": 12.5},
+            "role": {}
+        },
+        "created": "2021-03-01T00:00:00.000000Z",
+        "modified": "2021-03-01T00:00:00.000000Z",
+        "job": 1,
+        "event": "runner_on_ok",
+        "counter": number,
+        "event_data": {
+            "play": "all",
+            "task": "Gather facts",
+            "res": {
+                "ansible_facts": {f"fact_{fact}": {"value": fact, "list": list(range(5))} for fact in range(20)},
+                "changed": False
+            },
+            "host": "web1",
+            "duration": 0.5
+        },
+        "host": 1,
+        "host_name": "web1",
+        "stdout": "ok: [web1]",
+        "start_line": number,
+        "end_line": number + 1,
+        "verbosity": 0
+    }
+
+
+def run(model, payload):
+    # Mirrors Client.get_data, every row is a fresh dict handed over by the JSON parser
+    for item in json.loads(payload):
+        model(internal_=True, **item).export()
+
+
+def main():
+    payload = json.dumps([job_event(number) for number in range(ROWS)])
+
+    for model in (LegacyJobEvent, JobEvent):
+        best = min(repeat(lambda: run(model, payload), number=5, repeat=5)) / 5
+        print(f"{model.__name__:>16}: {best * 1000:8.2f} ms per {ROWS} row page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+bench_pool.py
+Comments: Listing throughput against a local stub server for different pool sizes,
+    run from the repository root with: PYTHONPATH=. python benchmarks/bench_pool.py
+    Needs Python 3.7 or later for ThreadingHTTPServer
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Process, Queue
+from time import perf_counter, sleep
+from urllib.parse import urlparse, parse_qs
+
+from pyawx import Client
+from pyawx.models.jobs import Job
+
+PAGES = 320
+WORKERS = 32
+LATENCY = 0.1
+# Stands in for the TCP and TLS handshake a real AWX costs for every new connection
+HANDSHAKE = 0.2
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        sleep(HANDSHAKE)
+        super().setup()
+
+    def do_GET(self):
+        sleep(LATENCY)
+
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get("page", ["1"])[0])
+        body = json.dumps(
+            {
+                "count": PAGES,
+                "next": f"/api/v2/jobs/?page={page + 1}&page_size=1" if page < PAGES else None,
+                "results": [{"id": page, "status": "successful"}]
+            }
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port):
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    port.put(server.server_port)
+    server.serve_forever()
+
+
+def main():
+    # urllib3 warns about every discarded connection when the pool is too small, that is what is being measured
+    logging.getLogger("urllib3").setLevel(logging.ERROR)
+
+    # The stub runs in its own process so it does not compete with the client for the GIL
+    port = Queue()
+    server = Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{port.get()}"
+
+    print(
+        f"{PAGES} pages, {WORKERS} workers, {LATENCY * 1000:.0f} ms server latency, "
+        f"{HANDSHAKE * 1000:.0f} ms per new connection"
+    )
+
+    for pool_maxsize in (1, 4, 10, 32):
+        client = Client(url, token="123", pool_maxsize=pool_maxsize, timeout=10)
+
+        started = perf_counter()
+        client.get_data(Job, page_size=1, workers=WORKERS)
+        elapsed = perf_counter() - started
+
+        print(f"pool_maxsize={pool_maxsize:>3}: {PAGES / elapsed:8.1f} pages/s")
+
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
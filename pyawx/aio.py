@@ -0,0 +1,701 @@
+"""
+aio.py
+Comments: asyncio flavour of the client, requires the optional aiohttp dependency
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import asyncio
+import json
+from time import monotonic, perf_counter
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from pyawx.api import _BaseClient, _raise_for_status
+from pyawx.commit import CommitReport, CommitResult, get_action, plan_commit, blocked_by
+from pyawx.resultset import ResultSet
+from pyawx.fanout import FanoutResult, shard_hosts, shard_command, inventory_hosts_endpoint
+from pyawx.launch import LaunchReport, LaunchResult, get_launch_source, validate_launch, launch_body
+from pyawx.events import get_event_source, event_params, get_stdout_source, skip_bytes
+from pyawx.models.unified import UnifiedJob
+from pyawx.polling import PollInterval, pending_jobs, batches, finished_jobs, wait_interval
+from pyawx.store import stored_since, merge_stored
+from pyawx.sync import SyncResult, start_sync, modified_since, existing_ids_params, diff_sync, store_sync
+from pyawx.models.relations import group_by_related_model
+from pyawx.models.utils import get_endpoint, get_changes, update, refresh, flush
+from pyawx.exceptions import UnauthorizedAccess, UnknownEndpoint
+
+
+def _parse_body(body):
+    """
+    Parse a response body, error pages of proxies in front of AWX are not JSON and are kept as text
+    """
+    if not body:
+        return None
+
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body
+
+
+class AsyncClient(_BaseClient):
+    """
+    asyncio client object for connecting to an AWX instance
+    """
+
+    def __init__(self, url, username=None, password=None, token=None, limit=100, limit_per_host=0, retry=None,
+                 rate_limiter=None, identity_map=True, store=None):
+        """
+        Main asyncio client API object for connecting to an AWX instance. It mirrors :class:`pyawx.api.Client`
+        and uses the same models, but every call that talks to AWX is a coroutine.
+
+        The HTTP session is opened on :meth:`open` or when used as an async context manager::
+
+            async with AsyncClient("https://awx.mycompany.com", token="abc") as client:
+                jobs = await client.get_data(Job)
+
+        :param url: The base URL of the AWX instance
+        :type url: str, required
+        :param username: Your AWX username
+        :type username: str, optional if token not provided
+        :param password: Your AWX password
+        :type password: str, optional if token not provided
+        :param token: OAuth token
+        :type token: str, optional if username and password supplied
+        :param limit: Total number of connections kept open to AWX
+        :type limit: int, optional
+        :param limit_per_host: Number of connections kept open per host, ``0`` for no limit
+        :type limit_per_host: int, optional
+        :param retry: Retry requests that fail with a transient error, see :class:`pyawx.retry.RetryPolicy`
+        :type retry: :class:`pyawx.retry.RetryPolicy`, optional
+        :param rate_limiter: Limits the requests per second and in flight, can be shared with other clients
+        :type rate_limiter: :class:`pyawx.ratelimit.RateLimiter`, optional
+        :param identity_map: Hand out the same object every time a record is loaded, see :class:`pyawx.api.Client`
+        :type identity_map: bool, optional, default True
+        :param store: Keep loaded records on disk for :meth:`get_stored`
+        :type store: :class:`pyawx.store.ModelStore`, optional
+        """
+
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp, install it with: pip install pyawx-client[async]")
+
+        super().__init__(url, username=username, password=password, token=token, identity_map=identity_map,
+                         store=store)
+
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self._session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self):
+        """
+        Open the HTTP session and validate the credentials against AWX
+
+        :return: None
+        """
+        if self._session is not None:
+            return
+
+        self._session = aiohttp.ClientSession(
+            headers=self._headers,
+            connector=aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host)
+        )
+
+        status_code, _ = await self._request("get", self.url.endpoint("/api/v2/me"))
+
+        if status_code in [401, 403]:
+            await self.close()
+            raise UnauthorizedAccess
+        elif status_code == 404:
+            await self.close()
+            raise UnknownEndpoint
+
+    async def close(self):
+        """
+        Close the HTTP session and release its connections
+
+        :return: None
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(self, method, url, **kwargs):
+        if self._session is None:
+            raise RuntimeError("AsyncClient is not open, use open() or 'async with'")
+
+        attempt = 0
+
+        while True:
+            self.stats.record_request()
+            token = await self.rate_limiter.acquire_async(url) if self.rate_limiter else None
+
+            try:
+                async with self._session.request(method.upper(), url, **kwargs) as response:
+                    body = await response.text()
+                    status_code, retry_after = response.status, response.headers.get("Retry-After")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                if self.retry is None or not self.retry.should_retry(method, attempt, error=error):
+                    raise
+                wait = self.retry.delay(attempt)
+            else:
+                if self.retry is None or not self.retry.should_retry(method, attempt, status_code=status_code):
+                    return status_code, _parse_body(body)
+                wait = self.retry.delay(attempt, retry_after)
+            finally:
+                if token is not None:
+                    self.rate_limiter.release(token)
+
+            self.stats.record_retry()
+            attempt += 1
+            await asyncio.sleep(wait)
+
+    async def _post(self, model):
+        status_code, result = await self._request(
+            "post",
+            self.url.endpoint(f"{model.__endpoint__}"),
+            json=model.export()
+        )
+        _raise_for_status(status_code, result)
+
+        if status_code == 201:
+            update(model, result)
+            self._remember(model)
+
+    async def _patch(self, model):
+        status_code, result = await self._request(
+            "patch",
+            self.url.endpoint(get_endpoint(model)),
+            json=get_changes(model)
+        )
+        _raise_for_status(status_code, result)
+
+        if status_code == 200:
+            update(model, result)
+
+    async def _delete(self, model):
+        status_code, result = await self._request("delete", self.url.endpoint(get_endpoint(model)))
+        _raise_for_status(status_code, result)
+        self._forget(model)
+
+    async def _get_page(self, url, params=None):
+        started = perf_counter()
+        status_code, page = await self._request("get", url, params=params)
+        _raise_for_status(status_code, page)
+
+        self.stats.record_page(url, params, perf_counter() - started)
+
+        return page
+
+    async def _iter_pages(self, endpoint, params=None):
+        url = self.url.endpoint(endpoint)
+        params = params or None
+
+        while url:
+            page = await self._get_page(url, params=params)
+            yield page
+
+            url = self.url.resolve(page["next"]) if page.get("next") else None
+            params = None
+
+    async def _fetch_pages(self, endpoint, params=None, workers=4):
+        url = self.url.endpoint(endpoint)
+        params = params or dict()
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(number):
+            async with semaphore:
+                return await self._get_page(url, params={**params, "page": number})
+
+        first = await self._get_page(url, params=params or None)
+        pages = await asyncio.gather(*[fetch(number) for number in self._page_numbers(first)])
+
+        return [first] + list(pages)
+
+    async def iter_data(self, model, page_size=None, filters=None):
+        """
+        Lazily load model objects one at a time, see :meth:`pyawx.api.Client.iter_data`
+
+        :param model: The model object that is being requested
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :param filters: AWX query filters, :attr:`pyawx.query.Query.params` can be used here
+        :type filters: dict, optional
+        :return: async generator of requested objects
+        """
+
+        async for page in self._iter_pages(model.__endpoint__, self._list_params(page_size, filters)):
+            for item in page["results"]:
+                yield self._load(model, item)
+
+    async def get_data(self, model, page_size=None, workers=None, as_columns=False, fields=None, filters=None,
+                       prefetch=None):
+        """
+        Load model object, see :meth:`pyawx.api.Client.get_data`
+
+        :param model: The model object that is being requested
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :param workers: Fetch the pages concurrently with up to this many requests in flight
+        :type workers: int, optional
+        :param as_columns: Return a column oriented :class:`pyawx.resultset.ResultSet` instead of model objects
+        :type as_columns: bool, optional
+        :param fields: Fields kept in the result set, all fields when not set. Only used with ``as_columns``
+        :type fields: list, optional
+        :param filters: AWX query filters, :attr:`pyawx.query.Query.params` can be used here
+        :type filters: dict, optional
+        :param prefetch: Foreign key fields whose objects are loaded along with the results, see :meth:`prefetch`
+        :type prefetch: list, optional
+        :return: List of requested objects
+        """
+
+        params = self._list_params(page_size, filters)
+
+        if workers:
+            pages = await self._fetch_pages(model.__endpoint__, params, workers=workers)
+        else:
+            pages = [page async for page in self._iter_pages(model.__endpoint__, params)]
+
+        if as_columns:
+            return ResultSet.from_pages(model, pages, fields=fields)
+
+        items = [self._load(model, item) for page in pages for item in page["results"]]
+
+        if prefetch:
+            await self.prefetch(items, prefetch, workers=workers or 4)
+
+        return items
+
+    async def prefetch(self, models, fields, batch_size=100, workers=4):
+        """
+        Load the objects behind foreign key fields for a list of models in bulk, see
+        :meth:`pyawx.api.Client.prefetch`
+
+        :param models: The models to load related objects for
+        :type models: list
+        :param fields: Foreign key fields, e.g. ``["job_template", "inventory"]``
+        :type fields: list
+        :param batch_size: Number of ids per request
+        :type batch_size: int, optional, default 100
+        :param workers: Batches requested at the same time
+        :type workers: int, optional, default 4
+        :return: None
+        """
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(related_model, batch):
+            async with semaphore:
+                return await self.get_data(related_model, page_size=len(batch), filters={"id__in": batch})
+
+        for field in fields:
+            for related_model, owners in group_by_related_model(models, field).items():
+                id_batches = self._prefetch_batches(owners, field, batch_size)
+                results = await asyncio.gather(*[fetch(related_model, batch) for batch in id_batches])
+
+                self._attach_related(owners, field, [item for result in results for item in result])
+
+    async def get_stored(self, model, page_size=None, workers=None):
+        """
+        Load every record of a model from the client's store and only request the ones modified since, see
+        :meth:`pyawx.api.Client.get_stored`
+
+        :param model: The model object that is being requested
+        :type model: class of
+            | :class:`pyawx.models.inventories.Host`
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :param workers: Fetch the pages concurrently
+        :type workers: int, optional
+        :return: List of requested objects ordered by id
+        """
+        stored, filters = stored_since(self.store, model)
+        params = self._list_params(page_size, filters)
+
+        if workers:
+            pages = await self._fetch_pages(model.__endpoint__, params, workers=workers)
+        else:
+            pages = [page async for page in self._iter_pages(model.__endpoint__, params)]
+
+        fresh = [item for page in pages for item in page["results"]]
+
+        return [self._load(model, item) for item in merge_stored(self.store, model, stored, fresh)]
+
+    async def sync(self, model, since=None, page_size=None):
+        """
+        Load only the records created or changed since the previous sync, see :meth:`pyawx.api.Client.sync`
+
+        :param model: The model object that is being synced, it needs a ``modified`` field
+        :type model: class of
+            | :class:`pyawx.models.inventories.Host`
+        :param since: Cursor of the previous sync, all records are loaded when not set
+        :type since: :class:`pyawx.sync.SyncCursor`, optional
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :return: :class:`pyawx.sync.SyncResult`
+        """
+        since = start_sync(model, since)
+        params = self._list_params(page_size, modified_since(since.modified))
+
+        pages = self._iter_pages(model.__endpoint__, params)
+        fresh, added, changed, cursor = diff_sync(since, [item async for page in pages for item in page["results"]])
+        removed = set()
+
+        if await self.count(model) != len(cursor.ids):
+            pages = self._iter_pages(model.__endpoint__, existing_ids_params())
+            removed = cursor.ids - {item["id"] async for page in pages for item in page["results"]}
+            cursor.ids -= removed
+
+        store_sync(self.store, model, fresh, removed)
+
+        return SyncResult([self._load(model, item) for item in fresh], added, changed, removed, cursor)
+
+    async def refresh(self, model):
+        """
+        Load the current state of a saved model from AWX, values with pending changes are kept
+
+        :param model: The model
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :return: The same model
+        """
+        refresh(model, await self._get_page(self.url.endpoint(get_endpoint(model))))
+        return model
+
+    async def stream_events(self, job, since_counter=0, page_size=200, min_interval=0.5, max_interval=5.0):
+        """
+        Follow the events of a running job as they come in, see :meth:`pyawx.api.Client.stream_events`::
+
+            async for event in client.stream_events(job):
+                print(event.stdout)
+
+        :param job: The job to follow
+        :type job: :class:`pyawx.models.jobs.Job` or :class:`pyawx.models.adhoc.AdHocCommand`
+        :param since_counter: Skip the events up to and including this counter
+        :type since_counter: int, optional
+        :param page_size: Number of events per request
+        :type page_size: int, optional, default 200
+        :param min_interval: Shortest wait in seconds between polls
+        :type min_interval: float, optional, default 0.5
+        :param max_interval: Longest wait in seconds between polls
+        :type max_interval: float, optional, default 5.0
+        :return: async generator of events
+        """
+        endpoint, event_model = get_event_source(job)
+        interval = PollInterval(min_interval, max_interval)
+        counter = since_counter
+
+        while True:
+            finished = (await self.refresh(job)).event_processing_finished
+            found = 0
+
+            async for page in self._iter_pages(endpoint, event_params(counter, page_size)):
+                for item in page["results"]:
+                    counter = max(counter, item["counter"])
+                    found += 1
+                    yield self._load(event_model, item)
+
+            if finished:
+                return
+
+            await asyncio.sleep(interval.next(found > 0))
+
+    async def stdout(self, job, fmt="txt", chunk_size=65536, max_resumes=3):
+        """
+        Download the output of a job in chunks, see :meth:`pyawx.api.Client.stdout`::
+
+            with open("job-42.log", "wb") as log_fp:
+                async for chunk in client.stdout(job):
+                    log_fp.write(chunk)
+
+        :param job: The job
+        :type job: :class:`pyawx.models.jobs.Job`, :class:`pyawx.models.adhoc.AdHocCommand`,
+            :class:`pyawx.models.projects.ProjectUpdate`, :class:`pyawx.models.inventories.InventoryUpdate` or
+            :class:`pyawx.models.jobs.SystemJob`
+        :param fmt: ``txt`` for plain text or ``ansi`` to keep the colors
+        :type fmt: str, optional, default "txt"
+        :param chunk_size: Bytes read at a time
+        :type chunk_size: int, optional, default 65536
+        :param max_resumes: Number of times a broken download is resumed before the error is raised
+        :type max_resumes: int, optional, default 3
+        :return: async generator of bytes
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncClient is not open, use open() or 'async with'")
+
+        endpoint, params = get_stdout_source(job, fmt)
+        url = self.url.endpoint(endpoint)
+        offset = 0
+        resumes = 0
+
+        while True:
+            headers = {"Range": f"bytes={offset}-"} if offset else dict()
+            self.stats.record_request()
+            token = await self.rate_limiter.acquire_async(url) if self.rate_limiter else None
+
+            try:
+                try:
+                    response = await self._session.get(url, params=params, headers=headers)
+                finally:
+                    # Like Client._stream the slot is given back once the headers arrived, a slow consumer of the
+                    # output must not hold up other requests
+                    if token is not None:
+                        self.rate_limiter.release(token)
+
+                async with response:
+                    if offset and response.status == 416:
+                        return
+
+                    if response.status >= 300:
+                        body = await response.text()
+                        _raise_for_status(response.status, _parse_body(body))
+
+                    skip = offset if offset and response.status != 206 else 0
+
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        if skip:
+                            chunk, skip = skip_bytes(chunk, skip)
+
+                        if chunk:
+                            offset += len(chunk)
+                            yield chunk
+
+                return
+            except (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if resumes >= max_resumes:
+                    raise
+                resumes += 1
+
+    async def wait(self, jobs, timeout=None, min_interval=1.0, max_interval=30.0, batch_size=100):
+        """
+        Wait for jobs to finish and yield them as they do, see :meth:`pyawx.api.Client.wait`::
+
+            async for job in client.wait(jobs, timeout=3600):
+                print(job.id, job.status)
+
+        :param jobs: The jobs
+        :type jobs: list
+        :param timeout: Seconds to wait before :class:`pyawx.exceptions.WaitTimeout` is raised with the jobs still
+            running, waits forever when not set
+        :type timeout: float, optional
+        :param min_interval: Shortest wait in seconds between polls
+        :type min_interval: float, optional, default 1.0
+        :param max_interval: Longest wait in seconds between polls
+        :type max_interval: float, optional, default 30.0
+        :param batch_size: Number of ids per request
+        :type batch_size: int, optional, default 100
+        :return: async generator of finished jobs
+        """
+        pending = pending_jobs(jobs)
+        started = monotonic()
+        deadline = None if timeout is None else started + timeout
+
+        while pending:
+            for batch in batches(pending, batch_size):
+                params = self._list_params(len(batch), {"id__in": batch})
+
+                async for page in self._iter_pages(UnifiedJob.__endpoint__, params):
+                    for job in finished_jobs(pending, page):
+                        yield job
+
+            if pending:
+                await asyncio.sleep(
+                    wait_interval(pending, monotonic() - started, min_interval, max_interval, deadline)
+                )
+
+    async def launch_many(self, template, payloads, concurrency=4):
+        """
+        Launch a template once per payload, see :meth:`pyawx.api.Client.launch_many`
+
+        :param template: The template to launch
+        :type template: :class:`pyawx.models.jobs.JobTemplate` or :class:`pyawx.models.workflows.WorkflowJobTemplate`
+        :param payloads: Launch payloads, e.g. ``{"limit": "site1", "extra_vars": {"version": "1.2"}}``
+        :type payloads: list
+        :param concurrency: Launches sent at the same time
+        :type concurrency: int, optional, default 4
+        :return: :class:`pyawx.launch.LaunchReport`
+        """
+        endpoint, job_model = get_launch_source(template)
+        url = self.url.endpoint(endpoint)
+        requirements = await self._get_page(url)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def launch(payload):
+            try:
+                validate_launch(requirements, payload)
+
+                async with semaphore:
+                    status_code, result = await self._request("post", url, json=launch_body(payload))
+                _raise_for_status(status_code, result)
+            except Exception as error:
+                return LaunchResult(payload, error=error)
+
+            return LaunchResult(payload, self._load(job_model, result))
+
+        return LaunchReport(await asyncio.gather(*[launch(payload) for payload in payloads]))
+
+    async def adhoc_fanout(self, module_name, module_args, inventory, shard_size=50, concurrency=4, credential=None,
+                           timeout=None, **options):
+        """
+        Run an ad hoc command on every host of an inventory in shards, see :meth:`pyawx.api.Client.adhoc_fanout`
+
+        :param module_name: The Ansible module, e.g. ``ping``
+        :type module_name: str
+        :param module_args: Arguments of the module
+        :type module_args: str
+        :param inventory: The inventory or its id
+        :type inventory: :class:`pyawx.models.inventories.Inventory` or int
+        :param shard_size: Hosts per command
+        :type shard_size: int, optional, default 50
+        :param concurrency: Commands launched and read at the same time
+        :type concurrency: int, optional, default 4
+        :param credential: Id of the machine credential
+        :type credential: int, optional
+        :param timeout: Seconds to wait for the commands, see :meth:`wait`
+        :type timeout: float, optional
+        :param options: Other fields of :class:`pyawx.models.adhoc.AdHocCommand`
+        :return: :class:`pyawx.fanout.FanoutResult`
+        """
+        inventory_id, endpoint = inventory_hosts_endpoint(inventory)
+        pages = self._iter_pages(endpoint, {"page_size": 200})
+        hosts = [item["name"] async for page in pages for item in page["results"]]
+        result = FanoutResult(hosts)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def launch(shard):
+            command = shard_command(inventory_id, shard, module_name, module_args, credential, options)
+
+            try:
+                async with semaphore:
+                    await self._post(command)
+            except Exception as error:
+                result.launch_failed(shard, error)
+                return None
+
+            return command
+
+        async def read_events(command):
+            async with semaphore:
+                return [event async for event in self.stream_events(command)]
+
+        commands = await asyncio.gather(*[launch(shard) for shard in shard_hosts(hosts, shard_size)])
+        result.commands = [command for command in commands if command is not None]
+
+        async for _ in self.wait(result.commands, timeout=timeout):
+            pass
+
+        events = await asyncio.gather(*[read_events(command) for command in result.commands])
+
+        for command, command_events in zip(result.commands, events):
+            result.add_events(command, command_events)
+
+        return result
+
+    async def get_object(self, model, object_id):
+        """
+        Load a single record by its id, see :meth:`pyawx.api.Client.get_object`
+
+        :param model: The model class, e.g. :class:`pyawx.models.inventories.Inventory`
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :param object_id: The id of the record
+        :type object_id: int
+        :return: model
+        """
+        return self._load(model, await self._get_page(self.url.endpoint(f"{model.__endpoint__}/{object_id}")))
+
+    async def count(self, model, filters=None, *, ttl=None):
+        """
+        Number of records matching the filters, see :meth:`pyawx.api.Client.count`
+
+        :param model: The model object that is being counted
+        :param filters: AWX query filters, e.g. ``{"status": "pending"}``
+        :type filters: dict, optional
+        :param ttl: Seconds the answer is reused for the same model and filters, not cached when not set
+        :type ttl: float, optional
+        :return: int
+        """
+        params = self._count_params(filters)
+        count = self._cached_count(model, params, ttl)
+
+        if count is None:
+            count = (await self._get_page(self.url.endpoint(model.__endpoint__), params=params))["count"]
+            self._store_count(model, params, count, ttl)
+
+        return count
+
+    async def exists(self, model, filters=None, *, ttl=None):
+        """
+        Check if any record matches the filters, see :meth:`pyawx.api.Client.count`
+
+        :param model: The model object that is being looked for
+        :param filters: AWX query filters, e.g. ``{"name": "web1"}``
+        :type filters: dict, optional
+        :param ttl: Seconds the answer is reused for the same model and filters, not cached when not set
+        :type ttl: float, optional
+        :return: bool
+        """
+        return await self.count(model, filters, ttl=ttl) > 0
+
+    async def _commit_one(self, model):
+        action = get_action(model)
+
+        try:
+            if action == "delete":
+                await self._delete(model)
+            elif action == "update":
+                await self._patch(model)
+                flush(model)
+            else:
+                await self._post(model)
+                flush(model)
+        except Exception as error:
+            return CommitResult(model, action, error)
+
+        return CommitResult(model, action)
+
+    async def commit(self, workers=None):
+        """
+        Commits all queued records back to AWX, see :meth:`pyawx.api.Client.commit`
+
+        :param workers: Save independent models concurrently with up to this many requests in flight. Models are
+            saved one after the other when not set
+        :type workers: int, optional
+        :return: :class:`pyawx.commit.CommitReport`
+        """
+
+        results = dict()
+        semaphore = asyncio.Semaphore(workers or 1)
+
+        async def save(model):
+            async with semaphore:
+                return await self._commit_one(model)
+
+        for wave in plan_commit(self._write_back):
+            runnable = list()
+
+            for model in wave:
+                blocked = blocked_by(model, results)
+
+                if blocked:
+                    results[id(model)] = blocked
+                else:
+                    runnable.append(model)
+
+            for result in await asyncio.gather(*[save(model) for model in runnable]):
+                results[id(result.model)] = result
+
+        report = CommitReport(results[id(model)] for model in self._write_back)
+        self._write_back = list()
+
+        return report
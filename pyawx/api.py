@@ -1,8 +1,27 @@
 import requests
+from requests.adapters import HTTPAdapter
 from base64 import b64encode
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from threading import Lock, Thread
+from weakref import WeakValueDictionary
+from time import monotonic, perf_counter, sleep
 from pyawx.models import DataModelMixin
-from pyawx.models.utils import get_endpoint, update, flush
-from pyawx.exceptions import UnauthorizedAccess, UnknownEndpoint
+from pyawx.models.relations import group_by_related_model
+from pyawx.models.utils import get_endpoint, get_changes, update, refresh, attach, bind, flush
+from pyawx.commit import CommitReport, CommitResult, get_action, plan_commit, blocked_by
+from pyawx.query import Query, compile_filters
+from pyawx.resultset import ResultSet
+from pyawx.fanout import FanoutResult, shard_hosts, shard_command, inventory_hosts_endpoint
+from pyawx.launch import LaunchReport, LaunchResult, get_launch_source, validate_launch, launch_body
+from pyawx.events import get_event_source, event_params, get_stdout_source, skip_bytes
+from pyawx.models.unified import UnifiedJob
+from pyawx.polling import PollInterval, pending_jobs, batches, finished_jobs, wait_interval
+from pyawx.cache import cache_identity
+from pyawx.store import stored_since, merge_stored
+from pyawx.sync import SyncResult, start_sync, modified_since, existing_ids_params, diff_sync, store_sync
+from pyawx.exceptions import UnauthorizedAccess, UnknownEndpoint, RequestFailed
 
 
 class _ApiUrl:
@@ -11,6 +30,10 @@ class _ApiUrl:
             url = url.replace("/api/v2", "")
         self._url = url
 
+    @property
+    def base(self):
+        return self._url
+
     def endpoint(self, endpoint):
         endpoint = endpoint.strip()
 
@@ -22,34 +45,106 @@ class _ApiUrl:
 
         return f"{self._url}{endpoint}"
 
+    def resolve(self, link):
+        """
+        Resolve a link handed back by the AWX API, such as the ``next`` page of a listing, into a full URL.
+
+        :param link: Relative path (``/api/v2/jobs/?page=2``) or absolute URL
+        :type link: str
+        :return: str
+        """
+        if link.startswith("http://") or link.startswith("https://"):
+            return link
+        return f"{self._url}{link}"
+
+
+PageTiming = namedtuple("PageTiming", ["url", "params", "elapsed"])
 
-class Client:
+
+def _raise_for_status(status_code, body):
     """
-    Client object for connecting to an AWX instance
+    Raise :class:`pyawx.exceptions.RequestFailed` for anything but a 2xx status. AWX puts the reason in
+    ``detail``, validation errors come back as a dict of field names instead.
+    """
+    if 200 <= status_code < 300:
+        return
+
+    if isinstance(body, dict) and "detail" in body:
+        body = body["detail"]
+
+    raise RequestFailed(body, status_code)
+
+
+class _Stats:
+    """
+    Running counters for the requests made by a Client. Safe to update from several threads.
     """
 
-    def __init__(self, url, username=None, password=None, token=None):
+    def __init__(self, history=1000):
+        self._lock = Lock()
+        self.requests = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.not_modified = 0
+        self.page_latency = deque(maxlen=history)
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_cache_hit(self, not_modified=False):
         """
-        Main client API object for connecting to an AWX instance.
+        Count a response served from the response cache
 
-        If an OAuth token is provided, it will be used before the username and password
+        :param not_modified: AWX was asked and answered with a 304, otherwise no request was made at all
+        :type not_modified: bool
+        """
+        with self._lock:
+            if not_modified:
+                self.not_modified += 1
+            else:
+                self.cache_hits += 1
 
-        :param url: The base URL of the AWX instance
-        :type url: str, required
-        :param username: Your AWX username
-        :type username: str, optional if token not provided
-        :param password: Your AWX password
-        :type password: str, optional if token not provided
-        :param token: OAuth token
-        :type token: str, optional if username and password supplied
+    def record_page(self, url, params, elapsed):
+        """
+        Keep track of how long a single listing page took to come back
+
+        :param url: The page URL
+        :type url: str
+        :param params: Query parameters sent along with the URL
+        :type params: dict or None
+        :param elapsed: Seconds spent on the request
+        :type elapsed: float
         """
+        with self._lock:
+            self.page_latency.append(PageTiming(url, params, elapsed))
+
+
+class _BaseClient:
+    """
+    Shared plumbing for the blocking and asyncio clients: credentials, the write back queue and loading of models
+    """
 
+    def __init__(self, url, username=None, password=None, token=None, headers=None, identity_map=True, store=None):
         self.url = _ApiUrl(url)
+        self.store = store
         self._write_back = list()
+        self.stats = _Stats()
 
-        self._session = requests.Session()
+        # Every AWX object is materialized once per client, keyed by (endpoint, id). Weak references let objects
+        # the caller no longer holds on to be garbage collected
+        self._identity_map = WeakValueDictionary() if identity_map else None
+        self._identity_lock = Lock()
 
-        if token:
+        if headers and "Authorization" in headers:
+            self._headers = {
+                "Authorization": headers["Authorization"]
+            }
+        elif token:
             self._headers = {
                 "Authorization": "Bearer {0}".format(token)
             }
@@ -60,126 +155,1040 @@ class Client:
         else:
             raise ValueError("No username and password or token was supplied")
 
-        self._session.headers.update(self._headers)
-        self._session.headers.update(
-            {
-                "Content-Type": "application/json"
-            }
+        self._headers["Content-Type"] = "application/json"
+
+        self._counts = dict()
+        self._counts_lock = Lock()
+
+    @staticmethod
+    def _page_numbers(first):
+        """
+        Work out which pages are left to fetch from the first page of a listing. The page size is taken from the
+        first page, AWX caps ``page_size`` at 200 no matter what was asked for
+
+        :param first: The first page as returned by AWX
+        :type first: dict
+        :return: range of page numbers
+        """
+        per_page = len(first["results"])
+
+        if not first.get("next") or not per_page:
+            return range(0)
+
+        return range(2, ceil(first["count"] / per_page) + 1)
+
+    @staticmethod
+    def _list_params(page_size=None, filters=None):
+        params = compile_filters(**(filters or dict()))
+
+        if page_size:
+            params["page_size"] = page_size
+
+        return params
+
+    @staticmethod
+    def _count_params(filters):
+        params = compile_filters(**(filters or dict()))
+        params["page_size"] = 1
+        return params
+
+    def _cached_count(self, model, params, ttl):
+        """
+        A cached answer is only used when the caller accepts one by passing a ``ttl``
+        """
+        if not ttl:
+            return None
+
+        with self._counts_lock:
+            cached = self._counts.get((model.__endpoint__, frozenset(params.items())))
+
+        if cached and cached[0] > monotonic():
+            return cached[1]
+        return None
+
+    def _store_count(self, model, params, count, ttl):
+        if not ttl:
+            return
+
+        now = monotonic()
+
+        with self._counts_lock:
+            # Drop expired answers so polling with ever changing filters does not grow the cache forever
+            for key in [key for key, cached in self._counts.items() if cached[0] <= now]:
+                del self._counts[key]
+
+            self._counts[(model.__endpoint__, frozenset(params.items()))] = (now + ttl, count)
+
+    def _load(self, model, data):
+        if self._identity_map is None or data.get("id") is None:
+            instance = model(internal_=True, **data)
+            bind(instance, self)
+            return instance
+
+        key = (model.__endpoint__, data["id"])
+
+        with self._identity_lock:
+            instance = self._identity_map.get(key)
+
+            if instance is not None:
+                refresh(instance, data)
+            else:
+                instance = model(internal_=True, **data)
+                bind(instance, self)
+                self._identity_map[key] = instance
+
+        return instance
+
+    @staticmethod
+    def _prefetch_batches(models, field, batch_size):
+        """
+        Distinct ids behind a foreign key field split into batches for ``id__in`` lookups
+        """
+        ids = {model._data.get(field) for model in models if isinstance(model._data.get(field), int)}
+        return batches(ids, batch_size)
+
+    @staticmethod
+    def _attach_related(models, field, related):
+        by_id = {item.id: item for item in related}
+
+        for model in models:
+            attach(model, field, by_id.get(model._data.get(field)))
+
+    def _remember(self, model):
+        """
+        Put a model that was just created in AWX into the identity map
+        """
+        bind(model, self)
+
+        if self._identity_map is not None and model.id is not None:
+            with self._identity_lock:
+                self._identity_map.setdefault((model.__endpoint__, model.id), model)
+
+    def _forget(self, model):
+        """
+        Drop a model that was deleted in AWX from the identity map
+        """
+        if self._identity_map is not None:
+            with self._identity_lock:
+                if self._identity_map.get((model.__endpoint__, model.id)) is model:
+                    del self._identity_map[(model.__endpoint__, model.id)]
+
+    def add(self, model):
+        if not isinstance(model, DataModelMixin):
+            raise ValueError("Model is not a valid pyawx model")
+        self._write_back.append(model)
+
+    def add_all(self, models):
+        """
+        Queue a list of stored models prepared for saving.
+
+        :param models: A list of Data Models
+        :type models: list
+        :return: None
+        """
+
+        if not isinstance(models, list):
+            raise ValueError("Object not of type list")
+
+        for model in models:
+            self.add(model)
+
+    def delete(self, model):
+        """
+        Marks a record as deleted
+
+        :param model: The model
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :return: model
+        """
+
+        model.__delete_record__()
+        self.add(model)
+
+
+class Client(_BaseClient):
+    """
+    Client object for connecting to an AWX instance
+    """
+
+    def __init__(self, url, username=None, password=None, token=None, handshake="eager", session=None,
+                 pool_connections=10, pool_maxsize=10, pool_block=False, max_retries=0, timeout=None,
+                 keep_alive=True, retry=None, rate_limiter=None, response_cache=None, identity_map=True,
+                 store=None):
+        """
+        Main client API object for connecting to an AWX instance.
+
+        If an OAuth token is provided, it will be used before the username and password
+
+        :param url: The base URL of the AWX instance
+        :type url: str, required
+        :param username: Your AWX username
+        :type username: str, optional if token not provided
+        :param password: Your AWX password
+        :type password: str, optional if token not provided
+        :param token: OAuth token
+        :type token: str, optional if username and password supplied
+        :param handshake: When the credentials are checked against ``/api/v2/me``
+            | eager: Before the client is returned
+            | lazy: On the first request made by the client
+            | background: In a background thread, the first request waits for it to finish
+        :type handshake: str, optional, default "eager"
+        :param session: An authenticated session to reuse, e.g. one shared by many clients in the same process.
+            Credentials can be left out when the session already sends an Authorization header, otherwise they
+            are added to the session. The pool settings are not applied to a session that is passed in
+        :type session: :class:`requests.Session`, optional
+        :param pool_connections: Number of hosts connection pools are kept for
+        :type pool_connections: int, optional, default 10
+        :param pool_maxsize: Connections kept open per host, raise it to at least the number of ``workers`` used
+            with :meth:`get_data` and :meth:`commit` to avoid opening and discarding connections
+        :type pool_maxsize: int, optional, default 10
+        :param pool_block: Wait for a free connection instead of opening one that is thrown away afterwards
+        :type pool_block: bool, optional, default False
+        :param max_retries: Retries for failed connections, handed to urllib3
+        :type max_retries: int, optional, default 0
+        :param timeout: Seconds to wait for AWX on every request, a ``(connect, read)`` tuple sets both
+            separately. Waits forever when not set
+        :type timeout: float or tuple, optional
+        :param keep_alive: Keep connections open between requests
+        :type keep_alive: bool, optional, default True
+        :param retry: Retry requests that fail with a transient error such as a 502 from the AWX front end or a
+            reset connection. Retries are counted in ``Client.stats.retries``
+        :type retry: :class:`pyawx.retry.RetryPolicy`, optional
+        :param rate_limiter: Limits the requests per second and in flight, can be shared with other clients
+        :type rate_limiter: :class:`pyawx.ratelimit.RateLimiter`, optional
+        :param response_cache: Reuse GET responses that AWX confirms are unchanged with a 304, can be shared with
+            other clients, responses are only reused for the same credentials. Hits are counted in ``Client.stats.cache_hits`` and ``Client.stats.not_modified``
+        :type response_cache: :class:`pyawx.cache.ResponseCache`, optional
+        :param identity_map: Hand out the same object every time a record is loaded, refreshing it with the newest
+            data while keeping changes that were not committed yet. Otherwise every load creates new objects
+        :type identity_map: bool, optional, default True
+        :param store: Keep loaded records on disk for :meth:`get_stored`, can be shared with other clients
+        :type store: :class:`pyawx.store.ModelStore`, optional
+        """
+
+        super().__init__(
+            url,
+            username=username,
+            password=password,
+            token=token,
+            headers=session.headers if session else None,
+            identity_map=identity_map,
+            store=store
         )
 
-        _me = self._session.get(self.url.endpoint("/api/v2/me"))
+        self.timeout = timeout
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries,
+                pool_block=pool_block
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+        elif "Authorization" not in session.headers:
+            session.headers.update(self._headers)
+
+        self._session = session
+        self._cache_identity = cache_identity(session.headers.get("Authorization"))
+
+        self._validated = False
+        self._handshake_error = None
+        self._handshake_lock = Lock()
+        self._handshake_thread = None
+
+        if handshake == "eager":
+            self._handshake()
+        elif handshake == "background":
+            self._handshake_thread = Thread(target=self._background_handshake, daemon=True)
+            self._handshake_thread.start()
+        elif handshake != "lazy":
+            raise ValueError(f"Unknown handshake {handshake!r}, expected eager, lazy or background")
+
+    def _handshake(self):
+        _me = self._session.get(self.url.endpoint("/api/v2/me"), timeout=self.timeout)
 
         if _me.status_code in [401, 403]:
             raise UnauthorizedAccess
         elif _me.status_code == 404:
             raise UnknownEndpoint
 
-    def _get(self, model):
-        result = self._session.get(
-            self.url.endpoint(get_endpoint(model))
+        self._validated = True
+
+    def _background_handshake(self):
+        try:
+            self._handshake()
+        except Exception as error:
+            self._handshake_error = error
+
+    def _ensure_handshake(self):
+        if self._validated:
+            return
+
+        if self._handshake_thread is not None:
+            self._handshake_thread.join()
+
+        with self._handshake_lock:
+            if self._handshake_error is not None:
+                raise self._handshake_error
+            elif not self._validated:
+                self._handshake()
+
+    def share(self):
+        """
+        Create another client on the same authenticated session without repeating the handshake. The new client
+        has its own write back queue and stats, the connection pool is shared.
+
+        :return: :class:`Client`
+        """
+        self._ensure_handshake()
+        client = self.__class__(
+            self.url.base,
+            session=self._session,
+            handshake="lazy",
+            timeout=self.timeout,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            response_cache=self.response_cache,
+            store=self.store
         )
+        client._validated = True
+        return client
+
+    def _request(self, method, url, **kwargs):
+        self._ensure_handshake()
+
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+
+        attempt = 0
+
+        while True:
+            self.stats.record_request()
+            token = self.rate_limiter.acquire(url) if self.rate_limiter else None
+
+            try:
+                result = getattr(self._session, method)(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if self.retry is None or not self.retry.should_retry(method, attempt, error=error):
+                    raise
+                wait = self.retry.delay(attempt)
+            else:
+                if self.retry is None or not self.retry.should_retry(method, attempt, status_code=result.status_code):
+                    return result
+                wait = self.retry.delay(attempt, result.headers.get("Retry-After"))
+                # A streamed response keeps its connection until it is closed, hand it back to the pool
+                result.close()
+            finally:
+                if token is not None:
+                    self.rate_limiter.release(token)
+
+            self.stats.record_retry()
+            attempt += 1
+            sleep(wait)
+
+    def _get(self, model):
+        result = self._request("get", self.url.endpoint(get_endpoint(model)))
         return result
 
+    def _check(self, result):
+        if 200 <= result.status_code < 300:
+            return
+
+        try:
+            body = result.json()
+        except ValueError:
+            body = result.text
+
+        _raise_for_status(result.status_code, body)
+
     def _post(self, model):
-        result = self._session.post(
+        result = self._request(
+            "post",
             self.url.endpoint(f"{model.__endpoint__}"),
             json=model.export()
         )
-        status_code = result.status_code
-        result = result.json()
+        self._check(result)
 
-        if status_code == 201:
-            update(model, result)
+        if result.status_code == 201:
+            update(model, result.json())
+            self._remember(model)
 
-        # TODO: Error handling. Errors come as result["detail"]
+    def _patch(self, model):
+        result = self._request(
+            "patch",
+            self.url.endpoint(get_endpoint(model)),
+            json=get_changes(model)
+        )
+        self._check(result)
 
-    def _put(self, model):
-        result = self._session.put(self.url.endpoint(get_endpoint(model)))
+        if result.status_code == 200:
+            update(model, result.json())
 
-        if result.status_code != 201:
-            pass
+    def _delete(self, model):
+        result = self._request("delete", self.url.endpoint(get_endpoint(model)))
+        self._check(result)
+        self._forget(model)
 
-        # TODO: Error handling. Errors come as result["detail"]
+    def _get_page(self, url, params=None, revalidate=False):
+        """
+        GET a page through the response cache
 
-    def _delete(self, model):
-        result = self._session.delete(self.url.endpoint(get_endpoint(model)))
+        :param revalidate: Ask AWX even when the cached response is within its ttl, used when polling for changes
+        :type revalidate: bool, optional
+        """
+        started = perf_counter()
+        cached = None
 
-        if result.status_code != 201:
-            pass
+        if self.response_cache is not None:
+            cached = self.response_cache.get(url, params, identity=self._cache_identity)
 
-        # TODO: Error handling. Errors come as result["detail"]
+        if cached is not None and cached.fresh and not revalidate:
+            self.stats.record_cache_hit()
+            return cached.body
 
-    def get_data(self, model):
+        if cached is not None and cached.validators:
+            result = self._request("get", url, params=params, headers=cached.validators)
+        else:
+            result = self._request("get", url, params=params)
+
+        if cached is not None and result.status_code == 304:
+            self.response_cache.refresh(url, cached)
+            self.stats.record_cache_hit(not_modified=True)
+            return cached.body
+
+        self._check(result)
+
+        page = result.json()
+        self.stats.record_page(url, params, perf_counter() - started)
+
+        if self.response_cache is not None:
+            self.response_cache.store(
+                url, params, result.headers.get("ETag"), result.headers.get("Last-Modified"), page,
+                identity=self._cache_identity
+            )
+
+        return page
+
+    def _iter_pages(self, endpoint, params=None, revalidate=False):
+        """
+        Walk a collection endpoint page by page, following the ``next`` link AWX hands back until it runs out
+
+        :param endpoint: The collection endpoint, e.g. ``/api/v2/jobs``
+        :type endpoint: str
+        :param params: Query parameters for the first page
+        :type params: dict, optional
+        :param revalidate: Skip cached responses that are within their ttl, see :meth:`_get_page`
+        :type revalidate: bool, optional
+        :return: generator of raw page dicts
+        """
+        url = self.url.endpoint(endpoint)
+        params = params or None
+
+        while url:
+            page = self._get_page(url, params=params, revalidate=revalidate)
+            yield page
+
+            # The next link already carries the page_size and any other query parameters
+            url = self.url.resolve(page["next"]) if page.get("next") else None
+            params = None
+
+    def _fetch_pages(self, endpoint, params=None, workers=4):
+        """
+        Fetch every page of a collection concurrently. The first page is requested on its own to learn the
+        ``count``, the remaining page numbers are then handed to a bounded thread pool and put back in order.
+
+        Records created or removed while the pages are being fetched can shift rows between pages, so use
+        :meth:`iter_data` when an exact snapshot matters more than speed.
+
+        :param endpoint: The collection endpoint, e.g. ``/api/v2/jobs``
+        :type endpoint: str
+        :param params: Query parameters sent with every page
+        :type params: dict, optional
+        :param workers: Maximum number of pages requested at the same time
+        :type workers: int
+        :return: list of raw page dicts
+        """
+        url = self.url.endpoint(endpoint)
+        params = params or dict()
+
+        first = self._get_page(url, params=params or None)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pages = pool.map(
+                lambda number: self._get_page(url, params={**params, "page": number}),
+                self._page_numbers(first)
+            )
+            return [first] + list(pages)
+
+    def iter_data(self, model, page_size=None, filters=None):
+        """
+        Lazily load model objects one at a time. Pages are only requested from AWX as the previous one has been
+        consumed, so memory stays flat no matter how large the collection is.
+
+        :param model: The model object that is being requested
+        :type model: class of
+            | :class:`pyawx.models.projects.Project`
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :param filters: AWX query filters, e.g. ``{"status": "failed", "order_by": "-id"}``.
+            See :meth:`query` for a friendlier way to build them
+        :type filters: dict, optional
+        :return: generator of requested objects
+        """
+
+        for page in self._iter_pages(model.__endpoint__, self._list_params(page_size, filters)):
+            for item in page["results"]:
+                yield self._load(model, item)
+
+    def get_data(self, model, page_size=None, workers=None, as_columns=False, fields=None, filters=None,
+                 prefetch=None):
         """
         Load model object
         :param model: The model object that is being requested
         :type model: class of
             | :class:`pyawx.models.projects.Project`
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :param workers: Fetch the pages concurrently with up to this many requests in flight. Pages are
+            followed one after the other when not set. Per page latency is kept in ``Client.stats.page_latency``
+        :type workers: int, optional
+        :param as_columns: Return a column oriented :class:`pyawx.resultset.ResultSet` instead of model objects
+        :type as_columns: bool, optional
+        :param fields: Fields kept in the result set, all fields when not set. Only used with ``as_columns``
+        :type fields: list, optional
+        :param filters: AWX query filters, e.g. ``{"status": "failed", "order_by": "-id"}``.
+            See :meth:`query` for a friendlier way to build them
+        :type filters: dict, optional
+        :param prefetch: Foreign key fields whose objects are loaded along with the results, see :meth:`prefetch`
+        :type prefetch: list, optional
         :return: List of requested objects
         """
 
-        items = list()
+        params = self._list_params(page_size, filters)
 
-        results = self._session.get(
-            self.url.endpoint(get_endpoint(model))
-        )
+        if workers:
+            pages = self._fetch_pages(model.__endpoint__, params, workers=workers)
+        else:
+            pages = self._iter_pages(model.__endpoint__, params)
 
-        if results.status_code != 200:
-            raise Exception(results.json()["detail"])
+        if as_columns:
+            return ResultSet.from_pages(model, pages, fields=fields)
 
-        results = results.json()
+        items = [self._load(model, item) for page in pages for item in page["results"]]
 
-        for item in results["results"]:
-            items.append(model(internal_=True, **item))
+        if prefetch:
+            self.prefetch(items, prefetch, workers=workers or 4)
 
         return items
 
-    def add(self, model):
-        if not isinstance(model, DataModelMixin):
-            raise ValueError("Model is not a valid pyawx model")
-        self._write_back.append(model)
-
-    def add_all(self, models):
+    def prefetch(self, models, fields, batch_size=100, workers=4):
         """
-        Queue a list of stored models prepared for saving.
+        Load the objects behind foreign key fields for a list of models in bulk. The distinct ids are requested
+        with ``id__in`` lookups in batches, so 1,000 jobs need a handful of requests instead of one per job::
 
-        :param models: A list of Data Models
+            jobs = client.get_data(Job)
+            client.prefetch(jobs, ["job_template", "inventory"])
+            jobs[0].related_object("inventory").name
+
+        :param models: The models to load related objects for
         :type models: list
+        :param fields: Foreign key fields, e.g. ``["job_template", "inventory"]``
+        :type fields: list
+        :param batch_size: Number of ids per request
+        :type batch_size: int, optional, default 100
+        :param workers: Batches requested at the same time
+        :type workers: int, optional, default 4
         :return: None
         """
 
-        if not isinstance(models, list):
-            raise ValueError("Object not of type list")
+        for field in fields:
+            for related_model, owners in group_by_related_model(models, field).items():
+                id_batches = self._prefetch_batches(owners, field, batch_size)
 
-        for model in models:
-            self.add(model)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = pool.map(
+                        lambda batch: self.get_data(related_model, page_size=len(batch), filters={"id__in": batch}),
+                        id_batches
+                    )
+                    related = [item for result in results for item in result]
+
+                self._attach_related(owners, field, related)
 
-    def commit(self):
+    def get_stored(self, model, page_size=None, workers=None):
         """
-        Commits all queued records back to AWX
+        Load every record of a model from the client's store and only request the ones modified since the
+        newest stored record. The answer is saved back, so a restart after a full load only transfers what
+        changed in the meantime::
 
-        :return: None
+            client = Client("https://awx.mycompany.com", token="abc", store=ModelStore("awx.sqlite3"))
+            hosts = client.get_stored(Host)
+
+        :param model: The model object that is being requested
+        :type model: class of
+            | :class:`pyawx.models.inventories.Host`
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :param workers: Fetch the pages concurrently, see :meth:`get_data`
+        :type workers: int, optional
+        :return: List of requested objects ordered by id
+        """
+        stored, filters = stored_since(self.store, model)
+        params = self._list_params(page_size, filters)
+
+        if workers:
+            pages = self._fetch_pages(model.__endpoint__, params, workers=workers)
+        else:
+            pages = self._iter_pages(model.__endpoint__, params)
+
+        fresh = [item for page in pages for item in page["results"]]
+
+        return [self._load(model, item) for item in merge_stored(self.store, model, stored, fresh)]
+
+    def sync(self, model, since=None, page_size=None):
         """
+        Load only the records created or changed since the previous sync, ordered by ``modified``. Records
+        that were deleted are found by comparing the number of records AWX reports with the number of known ids,
+        only when they differ are the ids listed. Poll with the cursor of the previous result::
+
+            result = client.sync(Host)
+
+            while True:
+                sleep(30)
+                result = client.sync(Host, since=result.cursor)
+
+                for host in result.models:
+                    mirror.save(host)
+                mirror.delete(result.removed)
+
+        When the client has a store the records are saved to it and removed records are deleted from it.
+
+        :param model: The model object that is being synced, it needs a ``modified`` field
+        :type model: class of
+            | :class:`pyawx.models.inventories.Host`
+        :param since: Cursor of the previous sync, all records are loaded when not set
+        :type since: :class:`pyawx.sync.SyncCursor`, optional
+        :param page_size: Number of records per page, the server default is used when not set
+        :type page_size: int, optional
+        :return: :class:`pyawx.sync.SyncResult`
+        """
+        since = start_sync(model, since)
+        params = self._list_params(page_size, modified_since(since.modified))
+
+        pages = self._iter_pages(model.__endpoint__, params, revalidate=True)
+        fresh, added, changed, cursor = diff_sync(since, [item for page in pages for item in page["results"]])
+        removed = set()
+
+        if self.count(model) != len(cursor.ids):
+            pages = self._iter_pages(model.__endpoint__, existing_ids_params(), revalidate=True)
+            removed = cursor.ids - {item["id"] for page in pages for item in page["results"]}
+            cursor.ids -= removed
+
+        store_sync(self.store, model, fresh, removed)
+
+        return SyncResult([self._load(model, item) for item in fresh], added, changed, removed, cursor)
+
+    def refresh(self, model):
+        """
+        Load the current state of a saved model from AWX, values with pending changes are kept
+
+        :param model: The model
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :return: The same model
+        """
+        refresh(model, self._get_page(self.url.endpoint(get_endpoint(model)), revalidate=True))
+        return model
+
+    def stream_events(self, job, since_counter=0, page_size=200, min_interval=0.5, max_interval=5.0):
+        """
+        Follow the events of a running job as they come in. Only the events after the last ``counter`` seen are
+        requested, the interval between polls grows while the job is quiet. The generator ends once AWX has
+        processed every event of the job::
+
+            for event in client.stream_events(job):
+                print(event.stdout)
+
+        ``job`` is refreshed along the way, after the stream ended it holds the final state of the job.
+
+        :param job: The job to follow
+        :type job: :class:`pyawx.models.jobs.Job` or :class:`pyawx.models.adhoc.AdHocCommand`
+        :param since_counter: Skip the events up to and including this counter, e.g. to resume a stream
+        :type since_counter: int, optional
+        :param page_size: Number of events per request
+        :type page_size: int, optional, default 200
+        :param min_interval: Shortest wait in seconds between polls
+        :type min_interval: float, optional, default 0.5
+        :param max_interval: Longest wait in seconds between polls
+        :type max_interval: float, optional, default 5.0
+        :return: generator of :class:`pyawx.models.jobs.JobEvent` or :class:`pyawx.models.adhoc.AdHocCommandEvent`
+        """
+        endpoint, event_model = get_event_source(job)
+        interval = PollInterval(min_interval, max_interval)
+        counter = since_counter
+
+        while True:
+            # Check the job before asking for events, once processing finished the events below are the last ones
+            finished = self.refresh(job).event_processing_finished
+            found = 0
+
+            for page in self._iter_pages(endpoint, event_params(counter, page_size), revalidate=True):
+                for item in page["results"]:
+                    counter = max(counter, item["counter"])
+                    found += 1
+                    yield self._load(event_model, item)
+
+            if finished:
+                return
+
+            sleep(interval.next(found > 0))
+
+    def stdout(self, job, fmt="txt", chunk_size=65536, file=None, max_resumes=3):
+        """
+        Download the output of a job in chunks, memory use does not depend on the size of the output. A download
+        that breaks off is resumed from the last byte received with a ``Range`` request::
+
+            with open("job-42.log", "wb") as log_fp:
+                client.stdout(job, file=log_fp)
+
+            for chunk in client.stdout(job, fmt="ansi"):
+                sys.stdout.buffer.write(chunk)
+
+        :param job: The job
+        :type job: :class:`pyawx.models.jobs.Job`, :class:`pyawx.models.adhoc.AdHocCommand`,
+            :class:`pyawx.models.projects.ProjectUpdate`, :class:`pyawx.models.inventories.InventoryUpdate` or
+            :class:`pyawx.models.jobs.SystemJob`
+        :param fmt: ``txt`` for plain text or ``ansi`` to keep the colors
+        :type fmt: str, optional, default "txt"
+        :param chunk_size: Bytes read at a time
+        :type chunk_size: int, optional, default 65536
+        :param file: Binary file object the output is written to, chunks are returned as an iterator when not set
+        :type file: file, optional
+        :param max_resumes: Number of times a broken download is resumed before the error is raised
+        :type max_resumes: int, optional, default 3
+        :return: Number of bytes written to ``file``, otherwise a generator of bytes
+        """
+        endpoint, params = get_stdout_source(job, fmt)
+        chunks = self._stream(self.url.endpoint(endpoint), params, chunk_size, max_resumes)
+
+        if file is None:
+            return chunks
+
+        written = 0
+
+        for chunk in chunks:
+            file.write(chunk)
+            written += len(chunk)
+
+        return written
+
+    def _stream(self, url, params, chunk_size, max_resumes):
+        offset = 0
+        resumes = 0
+
+        while True:
+            headers = {"Range": f"bytes={offset}-"} if offset else dict()
+            result = self._request("get", url, params=params, headers=headers, stream=True)
+
+            try:
+                if offset and result.status_code == 416:
+                    # Everything was received before the connection broke
+                    return
+
+                self._check(result)
+
+                # AWX may ignore the range and send everything again
+                skip = offset if offset and result.status_code != 206 else 0
+
+                for chunk in result.iter_content(chunk_size=chunk_size):
+                    if skip:
+                        chunk, skip = skip_bytes(chunk, skip)
 
-        for model in self._write_back:
-            if model.is_deleted:
+                    if chunk:
+                        offset += len(chunk)
+                        yield chunk
+
+                return
+            except (requests.exceptions.ChunkedEncodingError, requests.ConnectionError):
+                if resumes >= max_resumes:
+                    raise
+                resumes += 1
+            finally:
+                result.close()
+
+    def wait(self, jobs, timeout=None, min_interval=1.0, max_interval=30.0, batch_size=100):
+        """
+        Wait for jobs to finish and yield them as they do. Every poll asks for all unfinished jobs at once on
+        ``/api/v2/unified_jobs``, so it does not matter how many jobs are waited for. The wait between polls is a
+        tenth of how long the youngest job has been running, bounded by ``min_interval`` and ``max_interval``::
+
+            for job in client.wait(jobs, timeout=3600):
+                print(job.id, job.status)
+
+        The jobs are updated in place with every poll.
+
+        :param jobs: The jobs, any mix of :class:`pyawx.models.jobs.Job`, :class:`pyawx.models.workflows.WorkflowJob`,
+            :class:`pyawx.models.projects.ProjectUpdate`, :class:`pyawx.models.inventories.InventoryUpdate` and
+            :class:`pyawx.models.adhoc.AdHocCommand`
+        :type jobs: list
+        :param timeout: Seconds to wait before :class:`pyawx.exceptions.WaitTimeout` is raised with the jobs still
+            running, waits forever when not set
+        :type timeout: float, optional
+        :param min_interval: Shortest wait in seconds between polls
+        :type min_interval: float, optional, default 1.0
+        :param max_interval: Longest wait in seconds between polls
+        :type max_interval: float, optional, default 30.0
+        :param batch_size: Number of ids per request
+        :type batch_size: int, optional, default 100
+        :return: generator of finished jobs
+        """
+        pending = pending_jobs(jobs)
+        started = monotonic()
+        deadline = None if timeout is None else started + timeout
+
+        while pending:
+            for batch in batches(pending, batch_size):
+                params = self._list_params(len(batch), {"id__in": batch})
+
+                for page in self._iter_pages(UnifiedJob.__endpoint__, params, revalidate=True):
+                    yield from finished_jobs(pending, page)
+
+            if pending:
+                sleep(wait_interval(pending, monotonic() - started, min_interval, max_interval, deadline))
+
+    def launch_many(self, template, payloads, concurrency=4):
+        """
+        Launch a template once per payload. What the template asks for on launch is requested once and every
+        payload is checked against it before anything is sent, payloads AWX would reject fail without a request.
+        The launches are sent concurrently::
+
+            report = client.launch_many(template, [{"limit": site} for site in sites], concurrency=10)
+
+            for result in report.failed:
+                print(result.payload, result.error)
+
+            for job in client.wait(report.jobs):
+                print(job.id, job.status)
+
+        Launches are not retried by a :class:`pyawx.retry.RetryPolicy` unless it has ``retry_post``, a launch
+        that timed out may have started a job. Use a :class:`pyawx.ratelimit.RateLimiter` with a rule for
+        ``/api/v2/job_templates/*/launch`` to protect the controller from large fan outs.
+
+        :param template: The template to launch
+        :type template: :class:`pyawx.models.jobs.JobTemplate` or :class:`pyawx.models.workflows.WorkflowJobTemplate`
+        :param payloads: Launch payloads, e.g. ``{"limit": "site1", "extra_vars": {"version": "1.2"}}``
+        :type payloads: list
+        :param concurrency: Launches sent at the same time
+        :type concurrency: int, optional, default 4
+        :return: :class:`pyawx.launch.LaunchReport`
+        """
+        endpoint, job_model = get_launch_source(template)
+        url = self.url.endpoint(endpoint)
+        requirements = self._get_page(url)
+
+        def launch(payload):
+            try:
+                validate_launch(requirements, payload)
+
+                result = self._request("post", url, json=launch_body(payload))
+                self._check(result)
+            except Exception as error:
+                return LaunchResult(payload, error=error)
+
+            return LaunchResult(payload, self._load(job_model, result.json()))
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return LaunchReport(pool.map(launch, payloads))
+
+    def adhoc_fanout(self, module_name, module_args, inventory, shard_size=50, concurrency=4, credential=None,
+                     timeout=None, **options):
+        """
+        Run an ad hoc command on every host of an inventory. The hosts are split into shards of ``shard_size``
+        hosts, one command is launched per shard with the shard as its limit and up to ``concurrency`` commands
+        are launched at the same time. Once all commands finished their events are merged into one result per
+        host::
+
+            result = client.adhoc_fanout("setup", "gather_subset=min", inventory, shard_size=100, credential=3)
+
+            for host in result.failed:
+                print(host, result[host].status, result[host].error)
+
+            print(result["web1"].result["ansible_facts"]["ansible_distribution"])
+
+        :param module_name: The Ansible module, e.g. ``ping``
+        :type module_name: str
+        :param module_args: Arguments of the module
+        :type module_args: str
+        :param inventory: The inventory or its id
+        :type inventory: :class:`pyawx.models.inventories.Inventory` or int
+        :param shard_size: Hosts per command
+        :type shard_size: int, optional, default 50
+        :param concurrency: Commands launched and read at the same time
+        :type concurrency: int, optional, default 4
+        :param credential: Id of the machine credential, AWX needs one unless it can pick a default
+        :type credential: int, optional
+        :param timeout: Seconds to wait for the commands, see :meth:`wait`
+        :type timeout: float, optional
+        :param options: Other fields of :class:`pyawx.models.adhoc.AdHocCommand`, e.g. ``become_enabled=True``
+        :return: :class:`pyawx.fanout.FanoutResult`
+        """
+        inventory_id, endpoint = inventory_hosts_endpoint(inventory)
+        pages = self._iter_pages(endpoint, {"page_size": 200})
+        hosts = [item["name"] for page in pages for item in page["results"]]
+        result = FanoutResult(hosts)
+
+        def launch(shard):
+            command = shard_command(inventory_id, shard, module_name, module_args, credential, options)
+
+            try:
+                self._post(command)
+            except Exception as error:
+                result.launch_failed(shard, error)
+                return None
+
+            return command
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            commands = pool.map(launch, shard_hosts(hosts, shard_size))
+            result.commands = [command for command in commands if command is not None]
+
+            for _ in self.wait(result.commands, timeout=timeout):
+                pass
+
+            events = pool.map(lambda command: list(self.stream_events(command)), result.commands)
+
+            for command, command_events in zip(result.commands, events):
+                result.add_events(command, command_events)
+
+        return result
+
+    def get_object(self, model, object_id):
+        """
+        Load a single record by its id
+
+        :param model: The model class, e.g. :class:`pyawx.models.inventories.Inventory`
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :param object_id: The id of the record
+        :type object_id: int
+        :return: model
+        """
+        return self._load(model, self._get_page(self.url.endpoint(f"{model.__endpoint__}/{object_id}")))
+
+    def count(self, model, filters=None, *, ttl=None):
+        """
+        Number of records matching the filters. Only a single record is requested and only ``count`` is read::
+
+            pending = client.count(Job, {"status": "pending"})
+
+        :param model: The model object that is being counted
+        :type model: class of
+            | :class:`pyawx.models.projects.Project`
+        :param filters: AWX query filters, e.g. ``{"status": "pending"}``
+        :type filters: dict, optional
+        :param ttl: Seconds the answer is reused for the same model and filters, not cached when not set
+        :type ttl: float, optional
+        :return: int
+        """
+        params = self._count_params(filters)
+        count = self._cached_count(model, params, ttl)
+
+        if count is None:
+            url = self.url.endpoint(model.__endpoint__)
+            count = self._get_page(url, params=params, revalidate=True)["count"]
+            self._store_count(model, params, count, ttl)
+
+        return count
+
+    def exists(self, model, filters=None, *, ttl=None):
+        """
+        Check if any record matches the filters, see :meth:`count`
+
+        :param model: The model object that is being looked for
+        :param filters: AWX query filters, e.g. ``{"name": "web1"}``
+        :type filters: dict, optional
+        :param ttl: Seconds the answer is reused for the same model and filters, not cached when not set
+        :type ttl: float, optional
+        :return: bool
+        """
+        return self.count(model, filters, ttl=ttl) > 0
+
+    def query(self, model):
+        """
+        Start a query that is filtered and ordered by AWX before anything is sent back::
+
+            client.query(Job).filter(status="failed", finished__gt=an_hour_ago).order_by("-id").all()
+
+        :param model: The model object that is being requested
+        :type model: class of
+            | :class:`pyawx.models.projects.Project`
+        :return: :class:`pyawx.query.Query`
+        """
+        return Query(self, model)
+
+    def _commit_one(self, model):
+        action = get_action(model)
+
+        try:
+            if action == "delete":
                 self._delete(model)
-            elif model.is_changed:
-                self._put(model)
+            elif action == "update":
+                self._patch(model)
                 flush(model)
             else:
                 self._post(model)
+                flush(model)
+        except Exception as error:
+            return CommitResult(model, action, error)
 
-        self._write_back = list()
+        return CommitResult(model, action)
 
-    def delete(self, model):
+    def commit(self, workers=None):
         """
-        Marks a record as deleted
+        Commits all queued records back to AWX
 
-        :param model: The model
-        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
-        :return: model
+        Models that reference another queued model, e.g. ``Host(name="web1", inventory=new_inventory)``, are
+        saved after the model they reference and are skipped if it fails. A failing model does not stop the
+        rest of the queue, look at the returned report to find out what went wrong.
+
+        :param workers: Save independent models concurrently with up to this many requests in flight. Models are
+            saved one after the other when not set
+        :type workers: int, optional
+        :return: :class:`pyawx.commit.CommitReport`
         """
 
-        model.__delete_record__()
-        self.add(model)
+        results = dict()
+        pool = ThreadPoolExecutor(max_workers=workers) if workers else None
+
+        try:
+            for wave in plan_commit(self._write_back):
+                runnable = list()
+
+                for model in wave:
+                    blocked = blocked_by(model, results)
+
+                    if blocked:
+                        results[id(model)] = blocked
+                    else:
+                        runnable.append(model)
+
+                done = pool.map(self._commit_one, runnable) if pool else map(self._commit_one, runnable)
+
+                for result in done:
+                    results[id(result.model)] = result
+        finally:
+            if pool:
+                pool.shutdown()
+
+        report = CommitReport(results[id(model)] for model in self._write_back)
+        self._write_back = list()
+
+        return report
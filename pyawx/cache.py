@@ -0,0 +1,180 @@
+"""
+cache.py
+Comments: HTTP response cache revalidated with ETag and Last-Modified
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import re
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+from urllib.parse import urlparse
+
+
+class _Entry:
+    __slots__ = ("etag", "last_modified", "body", "expires")
+
+    def __init__(self, etag, last_modified, body, expires):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.expires = expires
+
+    @property
+    def fresh(self):
+        return monotonic() < self.expires
+
+    @property
+    def validators(self):
+        """Headers that ask AWX to answer with a 304 if the resource did not change"""
+        headers = dict()
+
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class ResponseCache:
+    """
+    Keeps parsed GET responses per URL together with their ``ETag`` and ``Last-Modified`` validators. A cached
+    response is revalidated with a conditional GET, a 304 answer reuses the parsed data without downloading or
+    parsing the body again::
+
+        cache = ResponseCache(maxsize=512, model_ttl={JobTemplate: 300, CredentialType: 3600})
+        client = Client("https://awx.mycompany.com", token="abc", response_cache=cache)
+
+    Responses are kept per credential, a client only gets the responses that were sent to the same Authorization
+    header. A cache can be shared by clients logged in as different users without one seeing the other's data.
+
+    Models loaded from a cached response share nested values such as ``related`` with the cache, treat them as
+    read only. Calls that poll for changes, such as ``count``, ``refresh``, ``sync``, ``stream_events`` and
+    ``wait``, always revalidate with AWX and ignore the ttl.
+    """
+
+    def __init__(self, maxsize=256, ttl=0, model_ttl=None):
+        """
+        :param maxsize: Number of responses kept, the least recently used one is dropped first
+        :type maxsize: int, optional, default 256
+        :param ttl: Seconds a cached response is used without asking AWX at all, ``0`` always revalidates
+        :type ttl: float, optional, default 0
+        :param model_ttl: ``ttl`` overrides per model, e.g. ``{JobTemplate: 300}``. They apply to the listing and
+            the records of the model, e.g. ``/api/v2/jobs/`` and ``/api/v2/jobs/7/`` but not ``/api/v2/jobs/7/stdout/``
+        :type model_ttl: dict, optional
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # A model's ttl covers its listing and its records, not sub resources such as /jobs/<id>/job_events/
+        self._model_ttl = [
+            (re.compile(re.escape(model.__endpoint__.rstrip("/")) + r"/(\d+/)?$"), model_ttl)
+            for model, model_ttl in (model_ttl or dict()).items()
+        ]
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _key(url, params, identity):
+        return identity, url, tuple(sorted((params or dict()).items()))
+
+    def ttl_for(self, url):
+        """
+        Seconds a response for this URL is used without revalidation
+
+        :param url: The request URL
+        :type url: str
+        :return: float
+        """
+        path = f"{urlparse(url).path.rstrip('/')}/"
+
+        for pattern, ttl in self._model_ttl:
+            if pattern.search(path):
+                return ttl
+
+        return self.ttl
+
+    def get(self, url, params=None, identity=None):
+        """
+        Look up a cached response
+
+        :param url: The request URL
+        :type url: str
+        :param params: Query parameters sent along with the URL
+        :type params: dict, optional
+        :param identity: Who asked, see :func:`cache_identity`
+        :type identity: str, optional
+        :return: cache entry or None
+        """
+        key = self._key(url, params, identity)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        return entry
+
+    def refresh(self, url, entry):
+        """
+        AWX confirmed the cached response is still current, restart its ttl
+
+        :param url: The request URL
+        :type url: str
+        :param entry: The entry returned by :meth:`get`
+        :return: None
+        """
+        entry.expires = monotonic() + self.ttl_for(url)
+
+    def store(self, url, params, etag, last_modified, body, identity=None):
+        """
+        Cache a response. Responses without validators are only kept when they have a ttl
+
+        :param url: The request URL
+        :type url: str
+        :param params: Query parameters sent along with the URL
+        :type params: dict, optional
+        :param etag: Value of the ``ETag`` header
+        :type etag: str, optional
+        :param last_modified: Value of the ``Last-Modified`` header
+        :type last_modified: str, optional
+        :param body: The parsed response
+        :param identity: Who asked, see :func:`cache_identity`
+        :type identity: str, optional
+        :return: None
+        """
+        ttl = self.ttl_for(url)
+
+        if not (etag or last_modified or ttl):
+            return
+
+        key = self._key(url, params, identity)
+
+        with self._lock:
+            self._entries[key] = _Entry(etag, last_modified, body, monotonic() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def cache_identity(authorization):
+    """
+    Key the responses sent to a set of credentials are cached under, the credentials themselves are not kept
+
+    :param authorization: Value of the ``Authorization`` header
+    :type authorization: str
+    :return: str
+    """
+    return sha256((authorization or "").encode()).hexdigest()
@@ -0,0 +1,138 @@
+"""
+commit.py
+Comments: Ordering and reporting for Client.commit
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from pyawx.models import DataModelMixin
+from pyawx.exceptions import DependencyFailed
+
+
+class CommitResult:
+    """
+    Outcome of saving a single queued model
+    """
+
+    def __init__(self, model, action, error=None):
+        """
+        :param model: The model that was queued
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :param action: What was done with the model, one of ``create``, ``update`` or ``delete``
+        :type action: str
+        :param error: The exception raised while saving, None when the save went through
+        :type error: Exception, optional
+        """
+        self.model = model
+        self.action = action
+        self.error = error
+
+    def __repr__(self):
+        state = "ok" if self.ok else f"failed: {self.error!r}"
+        return f"<{self.__class__.__name__} {self.action} {self.model!r} {state}>"
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class CommitReport(list):
+    """
+    List of :class:`CommitResult` in the order the models were queued
+    """
+
+    @property
+    def succeeded(self):
+        return [result for result in self if result.ok]
+
+    @property
+    def failed(self):
+        return [result for result in self if not result.ok]
+
+    @property
+    def ok(self):
+        return not self.failed
+
+
+def get_action(model):
+    """
+    Work out what commit has to do with a queued model
+
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :return: str
+    """
+    if model.is_deleted:
+        return "delete"
+    elif model.id is None:
+        # Not saved in AWX yet, values set after the model was created are sent along with the rest
+        return "create"
+    elif model.is_changed:
+        return "update"
+    return "create"
+
+
+def get_dependencies(model):
+    """
+    Models referenced by another model, e.g. ``Host(name="web1", inventory=new_inventory)``. The referenced
+    model has to be saved first so its id can be sent in place of the object.
+
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :return: list of models
+    """
+    return [value for value in model._data.values() if isinstance(value, DataModelMixin)]
+
+
+def plan_commit(models):
+    """
+    Split the queued models into waves. Every model in a wave only references models of earlier waves, so all
+    models of one wave can be saved at the same time.
+
+    :param models: The queued models
+    :type models: list
+    :return: list of lists of models
+    """
+    queued = {id(model) for model in models}
+    pending = {
+        id(model): {id(dependency) for dependency in get_dependencies(model) if id(dependency) in queued}
+        for model in models
+    }
+    waves = list()
+
+    while pending:
+        ready = {key for key, dependencies in pending.items() if not dependencies}
+
+        if not ready:
+            raise ValueError("Queued models reference each other in a cycle")
+
+        waves.append([model for model in models if id(model) in ready])
+
+        for key in ready:
+            del pending[key]
+
+        for dependencies in pending.values():
+            dependencies -= ready
+
+    return waves
+
+
+def blocked_by(model, results):
+    """
+    Build the result for a model whose dependency failed to save, None if all dependencies went through
+
+    :param model: The model
+    :param results: Results so far keyed by ``id(model)``
+    :type results: dict
+    :return: :class:`CommitResult` or None
+    """
+    for dependency in get_dependencies(model):
+        result = results.get(id(dependency))
+
+        if result is not None and not result.ok:
+            return CommitResult(
+                model, get_action(model), DependencyFailed(f"{dependency!r} could not be saved")
+            )
+
+    return None
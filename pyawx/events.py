@@ -0,0 +1,89 @@
+"""
+events.py
+Comments: Where the events and the output of a job are found
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from pyawx.models.adhoc import AdHocCommand, AdHocCommandEvent
+from pyawx.models.inventories import InventoryUpdate
+from pyawx.models.jobs import Job, JobEvent, SystemJob
+from pyawx.models.projects import ProjectUpdate
+
+# Job model: (path of its events below the job, event model)
+EVENT_SOURCES = {
+    Job: ("job_events", JobEvent),
+    AdHocCommand: ("events", AdHocCommandEvent)
+}
+
+
+# Unified jobs with a stdout endpoint
+STDOUT_MODELS = (Job, AdHocCommand, ProjectUpdate, InventoryUpdate, SystemJob)
+
+STDOUT_FORMATS = ("txt", "ansi")
+
+
+def _check_saved(job):
+    if job.id is None:
+        raise ValueError("The job has not been saved in AWX yet")
+
+
+def get_event_source(job):
+    """
+    Get the endpoint listing the events of a job and the model of the events
+
+    :param job: The job, it has to be saved in AWX
+    :type job: :class:`pyawx.models.jobs.Job` or :class:`pyawx.models.adhoc.AdHocCommand`
+    :return: tuple of endpoint and event model
+    """
+    try:
+        path, event_model = EVENT_SOURCES[type(job)]
+    except KeyError:
+        raise ValueError(f"{type(job).__name__} has no events that can be streamed") from None
+
+    _check_saved(job)
+
+    return f"{job.__endpoint__}/{job.id}/{path}", event_model
+
+
+def event_params(counter, page_size):
+    """
+    Query parameters for the events after ``counter``, oldest first
+    """
+    return {"counter__gt": counter, "order_by": "counter", "page_size": page_size}
+
+
+def get_stdout_source(job, fmt):
+    """
+    Get the stdout endpoint of a job and the query parameters to download it as plain text or with ANSI colors
+
+    :param job: The job, it has to be saved in AWX
+    :type job: :class:`pyawx.models.jobs.Job`, :class:`pyawx.models.adhoc.AdHocCommand`,
+        :class:`pyawx.models.projects.ProjectUpdate`, :class:`pyawx.models.inventories.InventoryUpdate` or
+        :class:`pyawx.models.jobs.SystemJob`
+    :param fmt: ``txt`` or ``ansi``
+    :type fmt: str
+    :return: tuple of endpoint and query parameters
+    """
+    if not isinstance(job, STDOUT_MODELS):
+        raise ValueError(f"{type(job).__name__} has no stdout")
+
+    if fmt not in STDOUT_FORMATS:
+        raise ValueError(f"fmt has to be one of {', '.join(STDOUT_FORMATS)}")
+
+    _check_saved(job)
+
+    return f"{job.__endpoint__}/{job.id}/stdout", {"format": f"{fmt}_download"}
+
+
+def skip_bytes(chunk, skip):
+    """
+    Drop the part of a chunk that was already received before a download was resumed
+
+    :return: tuple of the rest of the chunk and the bytes still to skip
+    """
+    if len(chunk) <= skip:
+        return b"", skip - len(chunk)
+
+    return chunk[skip:], 0
@@ -21,3 +21,30 @@ class UnauthorizedAccess(Exception):
 
 class UnknownEndpoint(Exception):
     pass
+
+
+class RequestFailed(Exception):
+    """
+    AWX answered a request with an error status
+    """
+
+    def __init__(self, detail, status_code=None):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+class DependencyFailed(Exception):
+    """
+    A queued model was not saved because a model it references failed to save
+    """
+
+
+class WaitTimeout(Exception):
+    """
+    Jobs did not finish in time, they are kept in ``pending``
+    """
+
+    def __init__(self, pending):
+        super().__init__(f"{len(pending)} jobs did not finish in time")
+        self.pending = pending
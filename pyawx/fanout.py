@@ -0,0 +1,158 @@
+"""
+fanout.py
+Comments: Sharding and per host results for Client.adhoc_fanout
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from pyawx.models import DataModelMixin
+from pyawx.models.adhoc import AdHocCommand
+from pyawx.models.inventories import Inventory
+
+# Ad hoc command event: status of the host it reports on
+HOST_EVENTS = {
+    "runner_on_ok": "ok",
+    "runner_on_failed": "failed",
+    "runner_on_unreachable": "unreachable",
+    "runner_on_skipped": "skipped"
+}
+
+
+class HostResult:
+    """
+    Outcome of an ad hoc command on one host
+    """
+    __slots__ = ("host", "status", "result", "command", "error")
+
+    def __init__(self, host, status=None, result=None, command=None, error=None):
+        """
+        :param host: The host name
+        :type host: str
+        :param status: ``ok``, ``failed``, ``unreachable`` or ``skipped``, None when the host did not report back
+        :type status: str, optional
+        :param result: What the module returned, ``event_data["res"]`` of the event
+        :type result: dict, optional
+        :param command: The ad hoc command that ran on the host
+        :type command: :class:`pyawx.models.adhoc.AdHocCommand`, optional
+        :param error: Why the command for the host's shard could not be launched
+        :type error: Exception, optional
+        """
+        self.host = host
+        self.status = status
+        self.result = result
+        self.command = command
+        self.error = error
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.host} {self.status or self.error!r}>"
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+
+class FanoutResult(dict):
+    """
+    :class:`HostResult` keyed by host name
+    """
+
+    def __init__(self, hosts=(), commands=None):
+        super().__init__((host, HostResult(host)) for host in hosts)
+        self.commands = commands or list()
+
+    def with_status(self, status):
+        """
+        Names of the hosts that ended with a status
+
+        :param status: ``ok``, ``failed``, ``unreachable``, ``skipped`` or None for hosts that did not report
+        :type status: str
+        :return: list
+        """
+        return [host for host, result in self.items() if result.status == status]
+
+    @property
+    def failed(self):
+        return [host for host, result in self.items() if not result.ok]
+
+    def launch_failed(self, shard, error):
+        """
+        Mark the hosts of a shard whose command could not be launched
+        """
+        for host in shard:
+            self[host].error = error
+
+    def add_events(self, command, events):
+        """
+        Merge the events of a command, the last event reported for a host wins
+        """
+        for event in events:
+            status = HOST_EVENTS.get(event.event)
+
+            if status is None or event.host_name is None:
+                continue
+
+            result = self.get(event.host_name)
+
+            if result is None:
+                result = self[event.host_name] = HostResult(event.host_name)
+
+            result.status = status
+            result.result = (event.event_data or dict()).get("res")
+            result.command = command
+
+
+def shard_hosts(hosts, shard_size):
+    """
+    Split host names into limits of at most ``shard_size`` hosts
+
+    :param hosts: The host names
+    :type hosts: list
+    :param shard_size: Hosts per shard
+    :type shard_size: int
+    :return: list of host name lists
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size has to be at least 1")
+
+    return [hosts[start:start + shard_size] for start in range(0, len(hosts), shard_size)]
+
+
+def inventory_hosts_endpoint(inventory):
+    """
+    Get the id of an inventory and the endpoint listing its hosts
+
+    :param inventory: The inventory or its id
+    :type inventory: :class:`pyawx.models.inventories.Inventory` or int
+    :return: tuple of id and endpoint
+    """
+    inventory_id = inventory.id if isinstance(inventory, DataModelMixin) else inventory
+    return inventory_id, f"{Inventory.__endpoint__}/{inventory_id}/hosts"
+
+
+def shard_command(inventory_id, shard, module_name, module_args, credential, options):
+    """
+    Build the ad hoc command that runs on one shard, the shard is its limit
+
+    :param inventory_id: Id of the inventory
+    :type inventory_id: int
+    :param shard: The host names
+    :type shard: list
+    :param module_name: The Ansible module
+    :type module_name: str
+    :param module_args: Arguments of the module
+    :type module_args: str
+    :param credential: Id of the machine credential
+    :type credential: int, optional
+    :param options: Other fields of :class:`pyawx.models.adhoc.AdHocCommand`
+    :type options: dict
+    :return: :class:`pyawx.models.adhoc.AdHocCommand`
+    """
+    command = dict(options, inventory=inventory_id, limit=",".join(shard), module_name=module_name)
+
+    if module_args:
+        command["module_args"] = module_args
+    if credential is not None:
+        command["credential"] = credential
+
+    return AdHocCommand(**command)
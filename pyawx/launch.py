@@ -0,0 +1,160 @@
+"""
+launch.py
+Comments: Validation and reporting for Client.launch_many
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from pyawx.exceptions import ValueNotAllowed
+from pyawx.models import DataModelMixin
+from pyawx.models.jobs import JobTemplate, Job
+from pyawx.models.workflows import WorkflowJobTemplate, WorkflowJob
+
+# Launch payload field: flag of the launch endpoint that has to be set to send it
+LAUNCH_FIELDS = {
+    "extra_vars": "ask_variables_on_launch",
+    "limit": "ask_limit_on_launch",
+    "inventory": "ask_inventory_on_launch",
+    "credentials": "ask_credential_on_launch",
+    "job_type": "ask_job_type_on_launch",
+    "job_tags": "ask_tags_on_launch",
+    "skip_tags": "ask_skip_tags_on_launch",
+    "verbosity": "ask_verbosity_on_launch",
+    "diff_mode": "ask_diff_mode_on_launch",
+    "scm_branch": "ask_scm_branch_on_launch"
+}
+
+LAUNCHED_MODELS = {
+    JobTemplate: Job,
+    WorkflowJobTemplate: WorkflowJob
+}
+
+
+class LaunchResult:
+    """
+    Outcome of launching a template with one payload
+    """
+
+    def __init__(self, payload, job=None, error=None):
+        """
+        :param payload: The launch payload
+        :type payload: dict
+        :param job: The job that was created
+        :type job: :class:`pyawx.models.jobs.Job` or :class:`pyawx.models.workflows.WorkflowJob`, optional
+        :param error: Why the payload was rejected or the launch failed
+        :type error: Exception, optional
+        """
+        self.payload = payload
+        self.job = job
+        self.error = error
+
+    def __repr__(self):
+        state = f"ok {self.job!r}" if self.ok else f"failed: {self.error!r}"
+        return f"<{self.__class__.__name__} {state}>"
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class LaunchReport(list):
+    """
+    List of :class:`LaunchResult` in the order of the payloads
+    """
+
+    @property
+    def succeeded(self):
+        return [result for result in self if result.ok]
+
+    @property
+    def failed(self):
+        return [result for result in self if not result.ok]
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    @property
+    def jobs(self):
+        return [result.job for result in self if result.ok]
+
+
+def get_launch_source(template):
+    """
+    Get the launch endpoint of a template and the model of the jobs it creates
+
+    :param template: The template, it has to be saved in AWX
+    :type template: :class:`pyawx.models.jobs.JobTemplate` or :class:`pyawx.models.workflows.WorkflowJobTemplate`
+    :return: tuple of endpoint and job model
+    """
+    try:
+        job_model = LAUNCHED_MODELS[type(template)]
+    except KeyError:
+        raise ValueError(f"{type(template).__name__} can not be launched") from None
+
+    if template.id is None:
+        raise ValueError("The template has not been saved in AWX yet")
+
+    return f"{template.__endpoint__}/{template.id}/launch", job_model
+
+
+def validate_launch(requirements, payload):
+    """
+    Check a launch payload against what the launch endpoint of the template asks for, so a payload AWX would
+    reject is not sent at all
+
+    :param requirements: The answer of a GET on the launch endpoint
+    :type requirements: dict
+    :param payload: The launch payload
+    :type payload: dict
+    :return: None
+    :raises: :class:`pyawx.exceptions.ValueNotAllowed`
+    """
+    for field in payload:
+        flag = LAUNCH_FIELDS.get(field)
+
+        if flag is None:
+            raise ValueNotAllowed(f"{field} can not be set on launch")
+
+        # Survey answers are sent as extra_vars as well
+        allowed = requirements.get(flag) or (field == "extra_vars" and requirements.get("survey_enabled"))
+
+        if not allowed:
+            raise ValueNotAllowed(f"The template does not ask for {field} on launch")
+
+    if requirements.get("inventory_needed_to_start") and not payload.get("inventory"):
+        raise ValueNotAllowed("The template needs an inventory to start")
+
+    if requirements.get("credential_needed_to_start") and not payload.get("credentials"):
+        raise ValueNotAllowed("The template needs credentials to start")
+
+    extra_vars = payload.get("extra_vars")
+    needed = requirements.get("variables_needed_to_start") or list()
+
+    # extra_vars sent as a YAML or JSON string are left for AWX to check
+    if needed and not isinstance(extra_vars, str):
+        missing = [name for name in needed if name not in (extra_vars or dict())]
+
+        if missing:
+            raise ValueNotAllowed(f"extra_vars is missing {', '.join(missing)}")
+
+
+def launch_body(payload):
+    """
+    Launch payload as sent to AWX, models such as an :class:`pyawx.models.inventories.Inventory` are sent as their id
+
+    :param payload: The launch payload
+    :type payload: dict
+    :return: dict
+    """
+    body = dict()
+
+    for field, value in payload.items():
+        if isinstance(value, DataModelMixin):
+            value = value.id
+        elif isinstance(value, (list, tuple)):
+            value = [item.id if isinstance(item, DataModelMixin) else item for item in value]
+        body[field] = value
+
+    return body
@@ -4,30 +4,69 @@ from copy import deepcopy
 class DataModelMixin:
     """
     Base data model structure
+
+    Models are slotted to keep the per object overhead low when loading large result sets. ``_changes`` and
+    ``_cache`` stay None until something is stored in them. Subclasses have to declare ``__slots__ = ()`` as well,
+    otherwise every instance grows a ``__dict__`` again.
     """
-    __deleted__ = False
+    __slots__ = ("_data", "_changes", "_cache", "_internal", "_deleted", "_client", "__weakref__")
 
     def __init__(self, **kwargs):
-        self._data = deepcopy(kwargs)
-        self._changes = dict()
-        self._cache = dict()
+        self._internal = kwargs.pop("internal_", False)
+
+        if self._internal:
+            # Created by the Client from freshly parsed JSON that nothing else holds on to, so the model takes
+            # ownership of it instead of paying for a copy
+            self._data = kwargs
+        else:
+            # Other models are kept by reference so Client.commit can save them first and send their id
+            self._data = {
+                key: value if isinstance(value, DataModelMixin) else deepcopy(value) for key, value in kwargs.items()
+            }
+
+        self._changes = None
+        self._cache = None
+        self._deleted = False
+        self._client = None
 
     def __repr__(self):
         return f"<{self.__class__.__name__} object at {id(self)}>"
 
+    def __deepcopy__(self, memo):
+        """
+        Models nested in the values of another model, e.g. ``credentials=[credential]``, are kept by reference just
+        like a model passed on its own. A loaded model holds the client that loaded it, which can not be copied
+        """
+        return self
+
     def __flush__(self):
         """
         Flush the object to reset any saved changes. Since its now saved to the server it should be reflected
         in the model as well
         """
-        self._changes = dict()
+        self._changes = None
 
     def __export__(self):
         """
-        Export of the model ojbect as a dict. This is a copy of the internal
-        tracking dict as to prevent model changes
+        Export of the model ojbect as a dict. This is a new top level dict so keys can be set or removed
+        without touching the model, nested values such as ``related`` are shared with the model and have to be
+        copied before changing them in place. Referenced models are exported as their id
+        """
+        return {
+            key: value.id if isinstance(value, DataModelMixin) else value for key, value in self._data.items()
+        }
+
+    def __export_changes__(self):
+        """
+        Export only the values that were changed since the model was loaded or last saved
         """
-        return deepcopy(self._data)
+        if not self._changes:
+            return dict()
+
+        return {
+            key: value.id if isinstance(value, DataModelMixin) else value
+            for key, value in self._data.items() if key in self._changes
+        }
 
     def __update__(self, **data):
         """
@@ -37,18 +76,30 @@ class DataModelMixin:
         """
         self._data.update(data)
 
+    def __refresh__(self, **data):
+        """
+        Updates a model object with newer data from the AWX API, values with pending changes are kept
+        :param data: data payload from the AWX API
+        :return: None
+        """
+        if self._changes:
+            data = {key: value for key, value in data.items() if key not in self._changes}
+        self._data.update(data)
+
     def __set_value__(self, key, value):
         self._data[key] = value
+
+        if self._changes is None:
+            self._changes = dict()
         self._changes[key] = [value]
 
-    # TODO: need a cleaner way to define an internally created object vs a user created object
     @property
     def __internal__(self):
         """Flag to indicate this was internally created object"""
-        return self._data.get("internal_", False)
+        return self._internal
 
     def __delete_record__(self):
-        self.__deleted__ = True
+        self._deleted = True
 
     @property
     def is_changed(self):
@@ -56,7 +107,7 @@ class DataModelMixin:
 
     @property
     def is_deleted(self):
-        return self.__deleted__
+        return self._deleted
 
     def revert(self, attribute):
         """
@@ -66,10 +117,44 @@ class DataModelMixin:
         :type attribute: str
         :return: None
         """
-        if attribute in self._changes:
+        if self._changes and attribute in self._changes:
             self._data[attribute] = self._changes.get(attribute)
             del self._changes[attribute]
 
+    def __bind__(self, client):
+        """
+        Remember the client that loaded this model, used to load related objects on demand
+        """
+        self._client = client
+
+    def __attach__(self, field, related):
+        """
+        Attach a loaded related object, e.g. the :class:`pyawx.models.inventories.Inventory` behind ``inventory``
+        """
+        if self._cache is None:
+            self._cache = dict()
+        self._cache[field] = related
+
+    def related_object(self, field):
+        """
+        Get a related object that was loaded along with this one, see the ``prefetch`` option of
+        :meth:`pyawx.api.Client.get_data`
+
+        :param field: The foreign key field, e.g. ``inventory``
+        :type field: str
+        :return: model or None
+        """
+        return self._cache.get(field) if self._cache else None
+
+    @property
+    def related_obj(self):
+        """
+        Related objects built from ``summary_fields`` without another request, e.g.
+        ``job.related_obj.inventory.name``. See :class:`pyawx.models.summary.RelatedObjects`
+        """
+        from pyawx.models.summary import RelatedObjects
+        return RelatedObjects(self)
+
     def export(self):
         """
         Exports the data from the model as a dict
@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class AdHocCommand(DataModelMixin):
     __endpoint__ = "/api/v2/ad_hoc_commands"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -487,6 +488,7 @@ class AdHocCommand(DataModelMixin):
 
 class AdHocCommandEvent(DataModelMixin):
     __endpoint__ = "/api/v2/ad_hoc_command_events"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class Application(DataModelMixin):
     __endpoint__ = "/api/v2/applications"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -214,6 +215,7 @@ class Application(DataModelMixin):
 
 class Token(DataModelMixin):
     __endpoint__ = "/api/v2/tokens"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class Credential(DataModelMixin):
     __endpoint__ = "/api/v2/credentials"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -202,6 +203,7 @@ class Credential(DataModelMixin):
 
 class CredentialType(DataModelMixin):
     __endpoint__ = "/api/v2/credential_types"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -391,6 +393,7 @@ class CredentialType(DataModelMixin):
 
 class CredentialInputSource(DataModelMixin):
     __endpoint__ = "/api/v2/credential_input_sources"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
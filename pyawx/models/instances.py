@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class Instance(DataModelMixin):
     __endpoint__ = "/api/v2/instances"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -252,6 +253,7 @@ class Instance(DataModelMixin):
 
 class InstanceGroup(DataModelMixin):
     __endpoint__ = "/api/v2/instance_groups"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class Inventory(DataModelMixin):
     __endpoint__ = "/api/v2/inventories"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -283,6 +284,7 @@ class Inventory(DataModelMixin):
 
 class InventoryScript(DataModelMixin):
     __endpoint__ = "/api/v2/inventory_scripts"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -422,6 +424,7 @@ class InventoryScript(DataModelMixin):
 
 class InventorySource(DataModelMixin):
     __endpoint__ = "/api/v2/inventory_sources"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -857,6 +860,7 @@ class InventorySource(DataModelMixin):
 
 class InventoryUpdate(DataModelMixin):
     __endpoint__ = "/api/v2/inventory_updates"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -1391,6 +1395,7 @@ class InventoryUpdate(DataModelMixin):
 
 class Group(DataModelMixin):
     __endpoint__ = "/api/v2/groups"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -1529,6 +1534,7 @@ class Group(DataModelMixin):
 
 class Host(DataModelMixin):
     __endpoint__ = "/api/v2/hosts"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
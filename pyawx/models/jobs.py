@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class JobTemplate(DataModelMixin):
     __endpoint__ = "/api/v2/job_templates"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -597,6 +598,7 @@ class JobTemplate(DataModelMixin):
 
 class Job(DataModelMixin):
     __endpoint__ = "/api/v2/jobs"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -1272,6 +1274,7 @@ class Job(DataModelMixin):
 
 class JobEvent(DataModelMixin):
     __endpoint__ = "/api/v2/job_events"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -1617,6 +1620,7 @@ class JobEvent(DataModelMixin):
 
 class SystemJob(DataModelMixin):
     __endpoint__ = "/api/v2/system_jobs"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -1964,6 +1968,7 @@ class SystemJob(DataModelMixin):
 
 class SystemJobTemplate(DataModelMixin):
     __endpoint__ = "/api/v2/system_job_templates"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -2151,6 +2156,7 @@ class SystemJobTemplate(DataModelMixin):
 
 class Schedule(DataModelMixin):
     __endpoint__ = "/api/v2/schedules"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -2483,6 +2489,7 @@ class Schedule(DataModelMixin):
 
 class ActivityStream(DataModelMixin):
     __endpoint__ = "/api/v2/activity_stream"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
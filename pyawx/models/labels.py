@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class Label(DataModelMixin):
     __endpoint__ = "/api/v2/labels"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class NotificationTemplate(DataModelMixin):
     __endpoint__ = "/api/v2/notification_templates"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -186,6 +187,7 @@ class NotificationTemplate(DataModelMixin):
 
 class Notification(DataModelMixin):
     __endpoint__ = "/api/v2/notifications"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
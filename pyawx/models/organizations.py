@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class Organization(DataModelMixin):
     __endpoint__ = "/api/v2/organizations"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
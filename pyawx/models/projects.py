@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class Project(DataModelMixin):
     __endpoint__ = "/api/v2/projects"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -385,6 +386,7 @@ class Project(DataModelMixin):
 
 class ProjectUpdate(DataModelMixin):
     __endpoint__ = "/api/v2/project_updates"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -0,0 +1,134 @@
+"""
+models/relations.py
+Comments: Maps the foreign key fields AWX sends as an id to the model they point at
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from pyawx.models.adhoc import AdHocCommand
+from pyawx.models.applications import Application
+from pyawx.models.credentials import Credential, CredentialType
+from pyawx.models.instances import InstanceGroup
+from pyawx.models.inventories import Inventory, InventoryScript, InventorySource, InventoryUpdate, Host
+from pyawx.models.jobs import JobTemplate, Job, SystemJobTemplate, SystemJob
+from pyawx.models.notifications import NotificationTemplate
+from pyawx.models.organizations import Organization
+from pyawx.models.projects import Project, ProjectUpdate
+from pyawx.models.unified import UnifiedJobTemplate, UnifiedJob
+from pyawx.models.users import User
+from pyawx.models.workflows import WorkflowJobTemplate, WorkflowJob, WorkflowJobNode
+
+RELATED_MODELS = {
+    "ad_hoc_command": AdHocCommand,
+    "application": Application,
+    "credential": Credential,
+    "credential_type": CredentialType,
+    "host": Host,
+    "instance_group": InstanceGroup,
+    "inventory": Inventory,
+    "inventory_source": InventorySource,
+    "job": Job,
+    "job_template": JobTemplate,
+    "last_job": UnifiedJob,
+    "notification_template": NotificationTemplate,
+    "organization": Organization,
+    "project": Project,
+    "source_credential": Credential,
+    "source_project": Project,
+    "source_script": InventoryScript,
+    "system_job_template": SystemJobTemplate,
+    "target_credential": Credential,
+    "unified_job_template": UnifiedJobTemplate,
+    "user": User,
+    "workflow_job": WorkflowJob,
+    "workflow_job_template": WorkflowJobTemplate
+}
+
+# Fields whose model depends on the model holding them, e.g. the last_job of a Project is a ProjectUpdate. Owners
+# that are not listed get the unified job, which covers every kind of job
+OWNER_RELATED_MODELS = {
+    (Host, "last_job"): Job,
+    (InventorySource, "last_job"): InventoryUpdate,
+    (JobTemplate, "last_job"): Job,
+    (Project, "last_job"): ProjectUpdate,
+    (SystemJobTemplate, "last_job"): SystemJob,
+    (WorkflowJobTemplate, "last_job"): WorkflowJob,
+    (WorkflowJobNode, "job"): UnifiedJob
+}
+
+# The type AWX embeds in the summary of a unified job
+UNIFIED_JOB_TYPES = {
+    "ad_hoc_command": AdHocCommand,
+    "inventory_update": InventoryUpdate,
+    "job": Job,
+    "project_update": ProjectUpdate,
+    "system_job": SystemJob,
+    "workflow_job": WorkflowJob
+}
+
+
+# summary_fields also names the users behind a change and lists some relations, e.g. ``credentials``
+SUMMARY_MODELS = dict(
+    RELATED_MODELS,
+    created_by=User,
+    modified_by=User,
+    credentials=Credential
+)
+
+
+def get_related_model(field, owner=None):
+    """
+    Get the model a foreign key field points at
+
+    :param field: The field name, e.g. ``inventory``
+    :type field: str
+    :param owner: The model holding the field, e.g. :class:`pyawx.models.projects.Project` for ``last_job``
+    :type owner: subclass of :class:`pyawx.models.mixins.DataModelMixin`, optional
+    :return: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    """
+    model = OWNER_RELATED_MODELS.get((owner, field)) or RELATED_MODELS.get(field)
+
+    if model is None:
+        raise ValueError(f"{field} is not a known related field")
+
+    return model
+
+
+def get_summary_model(field, owner, value=None):
+    """
+    Get the model an entry of ``summary_fields`` describes, unified jobs are narrowed down by their ``type``
+
+    :param field: The key in ``summary_fields``
+    :type field: str
+    :param owner: The model holding the summary
+    :type owner: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :param value: The embedded values
+    :type value: dict, optional
+    :return: subclass of :class:`pyawx.models.mixins.DataModelMixin` or None when there is no matching model
+    """
+    model = OWNER_RELATED_MODELS.get((owner, field)) or SUMMARY_MODELS.get(field)
+
+    if model is UnifiedJob and isinstance(value, dict):
+        return UNIFIED_JOB_TYPES.get(value.get("type"), model)
+
+    return model
+
+
+def group_by_related_model(models, field):
+    """
+    Split models by the model their foreign key field points at, a list can hold e.g. Projects and JobTemplates
+
+    :param models: The models holding the field
+    :type models: list
+    :param field: The foreign key field, e.g. ``last_job``
+    :type field: str
+    :return: dict of related model and the models pointing at it
+    """
+    # Unknown fields raise for an empty list as well
+    groups = {get_related_model(field): list()} if not models else dict()
+
+    for model in models:
+        groups.setdefault(get_related_model(field, type(model)), list()).append(model)
+
+    return groups
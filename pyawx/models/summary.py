@@ -0,0 +1,125 @@
+"""
+models/summary.py
+Comments: Typed access to the related objects AWX embeds in summary_fields
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from inspect import iscoroutinefunction
+
+from pyawx.models.relations import get_summary_model
+from pyawx.models.utils import attach
+
+
+class SummaryObject:
+    """
+    Partial model built from one entry of ``summary_fields``. Attributes AWX embedded, usually ``id``, ``name``
+    and ``description``, are read without a request. Any other attribute of the model loads the full object
+    once through the client that loaded the parent and the result is kept on the parent, see
+    :meth:`pyawx.models.mixins.DataModelMixin.related_object`.
+
+    The full object can only be loaded on demand for models loaded by :class:`pyawx.api.Client`. Without one,
+    attributes that were not embedded return None just like an unset value of a model. With
+    :class:`pyawx.aio.AsyncClient` use ``await client.get_object(Inventory, job.related_obj.inventory.id)``
+    """
+    __slots__ = ("_parent", "_field", "_partial")
+
+    def __init__(self, parent, field, model, data):
+        """
+        :param parent: The model the summary belongs to
+        :type parent: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :param field: The key in ``summary_fields``
+        :type field: str
+        :param model: The model the summary describes
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :param data: The embedded values
+        :type data: dict
+        """
+        self._parent = parent
+        self._field = field
+        self._partial = model(internal_=True, **data)
+
+    def __repr__(self):
+        return f"<Partial {self._partial.__class__.__name__} object at {id(self)}>"
+
+    def __getattr__(self, name):
+        model = type(self._partial)
+
+        if not isinstance(getattr(model, name, None), property):
+            raise AttributeError(f"{model.__name__} has no attribute {name}")
+
+        if name in self._partial._data:
+            return getattr(self._partial, name)
+
+        full = self.load()
+        return getattr(self._partial if full is None else full, name)
+
+    @property
+    def is_partial(self):
+        """True until the full object was loaded"""
+        return self._parent.related_object(self._field) is None
+
+    def load(self):
+        """
+        Load the full object, only one request is made for the parent
+
+        :return: model or None when there is no client to load it with
+        """
+        full = self._parent.related_object(self._field)
+
+        if full is not None:
+            return full
+
+        client = self._parent._client
+        object_id = self._partial._data.get("id")
+
+        if client is None or object_id is None or iscoroutinefunction(client.get_object):
+            return None
+
+        full = client.get_object(type(self._partial), object_id)
+        attach(self._parent, self._field, full)
+
+        return full
+
+
+class RelatedObjects:
+    """
+    Accessor for the related objects of a model, ``job.related_obj.inventory`` returns the prefetched
+    :class:`pyawx.models.inventories.Inventory` when there is one, otherwise a :class:`SummaryObject` built
+    from ``summary_fields``. Lists such as ``credentials`` return a list of :class:`SummaryObject`. Values
+    without a matching model are returned as AWX sent them, missing relations return None
+    """
+    __slots__ = ("_model",)
+
+    def __init__(self, model):
+        self._model = model
+
+    def __dir__(self):
+        return list(self._model._data.get("summary_fields") or dict())
+
+    def __getattr__(self, field):
+        related = self._model.related_object(field)
+
+        if related is not None:
+            return related
+
+        summary = self._model._data.get("summary_fields") or dict()
+        model = get_summary_model(field, type(self._model), summary.get(field))
+
+        if field not in summary:
+            if model is not None and isinstance(self._model._data.get(field), int):
+                # Not embedded, only the id is known and everything else is loaded on demand
+                return SummaryObject(self._model, field, model, {"id": self._model._data[field]})
+            elif model is not None:
+                return None
+            raise AttributeError(f"{self._model.__class__.__name__} has no related object {field}")
+
+        value = summary[field]
+
+        if model is None:
+            return value
+        elif isinstance(value, list):
+            return [SummaryObject(self._model, f"{field}:{item.get('id')}", model, item) for item in value]
+
+        return SummaryObject(self._model, field, model, value)
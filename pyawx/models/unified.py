@@ -4,6 +4,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class UnifiedJobTemplate(DataModelMixin):
     __endpoint__ = "/api/v2/unified_job_templates"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -179,6 +180,7 @@ class UnifiedJobTemplate(DataModelMixin):
 
 class UnifiedJob(DataModelMixin):
     __endpoint__ = "/api/v2/unified_jobs"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class User(DataModelMixin):
     __endpoint__ = "/api/v2/users"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -189,6 +190,7 @@ class User(DataModelMixin):
 
 class Team(DataModelMixin):
     __endpoint__ = "/api/v2/teams"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -316,6 +318,7 @@ class Team(DataModelMixin):
 
 class Role(DataModelMixin):
     __endpoint__ = "/api/v2/roles"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -51,6 +51,17 @@ def get_endpoint(model):
     return model.__endpoint__ if not model.id else f"{model.__endpoint__}/{model.id}"
 
 
+def get_changes(model):
+    """
+    Get the changed values of a model object, used to send a partial update to AWX
+
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :return: dict
+    """
+    return model.__export_changes__()
+
+
 def update(model, data):
     """
     Updates a mode with the data provided. Usually comes from the AWX API
@@ -64,6 +75,45 @@ def update(model, data):
     model.__update__(**data)
 
 
+def refresh(model, data):
+    """
+    Refreshes a model with newer data from AWX without overwriting values that were changed but not saved yet
+
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :param data: The dict of data to refresh the object with
+    :type data: dict
+    :return: None
+    """
+    model.__refresh__(**data)
+
+
+def bind(model, client):
+    """
+    Binds a model to the client that loaded it
+
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :param client: The client
+    :return: None
+    """
+    model.__bind__(client)
+
+
+def attach(model, field, related):
+    """
+    Attaches a loaded related object to a model
+
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :param field: The foreign key field the related object belongs to
+    :type field: str
+    :param related: The related model, None when it could not be found
+    :return: None
+    """
+    model.__attach__(field, related)
+
+
 def flush(model):
     """
     Flushes the model object to reset any flags after a change has been made to it
@@ -5,6 +5,7 @@ from pyawx.exceptions import ValueReadOnly
 
 class WorkflowJobTemplate(DataModelMixin):
     __endpoint__ = "/api/v2/workflow_job_templates"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -332,6 +333,7 @@ class WorkflowJobTemplate(DataModelMixin):
 
 class WorkflowJob(DataModelMixin):
     __endpoint__ = "/api/v2/workflow_jobs"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -734,6 +736,7 @@ class WorkflowJob(DataModelMixin):
 
 class WorkflowApproval(DataModelMixin):
     __endpoint__ = "/api/v2/workflow_approvals"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -1056,6 +1059,7 @@ class WorkflowApproval(DataModelMixin):
 
 class WorkflowJobTemplateNode(DataModelMixin):
     __endpoint__ = "/api/v2/workflow_job_template_nodes"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
@@ -1358,6 +1362,7 @@ class WorkflowJobTemplateNode(DataModelMixin):
 
 class WorkflowJobNode(DataModelMixin):
     __endpoint__ = "/api/v2/workflow_job_nodes"
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         """
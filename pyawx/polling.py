@@ -0,0 +1,185 @@
+"""
+polling.py
+Comments: Adaptive intervals for polling AWX while something runs
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from datetime import datetime, timezone
+from time import monotonic
+
+from pyawx.exceptions import WaitTimeout
+from pyawx.models.utils import update
+
+FINISHED_STATUSES = frozenset(("successful", "failed", "error", "canceled"))
+
+
+def _parse_timestamp(value):
+    """
+    Parse an AWX timestamp such as ``2021-03-01T12:00:00.123456Z``. ``datetime.fromisoformat`` is not available
+    on Python 3.6 and ``%z`` only takes ``+00:00`` from 3.7 on, so the offset is normalised first
+    """
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+0000"
+    elif value[-3:-2] == ":" and value[-6:-5] in "+-":
+        value = f"{value[:-3]}{value[-2:]}"
+
+    for timestamp_format in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, timestamp_format)
+        except ValueError:
+            pass
+
+    return None
+
+
+def running_for(job, waited):
+    """
+    Seconds a job has been running, from its ``started`` timestamp or else the time spent waiting for it
+
+    :param job: The job
+    :param waited: Seconds spent waiting for the job so far
+    :type waited: float
+    :return: float
+    """
+    started = getattr(job, "started", None)
+    started = _parse_timestamp(started) if isinstance(started, str) else None
+
+    if started is None:
+        return waited
+
+    return max(waited, (datetime.now(timezone.utc) - started).total_seconds())
+
+
+def elapsed_interval(elapsed, minimum=1.0, maximum=30.0, ratio=0.1):
+    """
+    Seconds to wait before polling jobs again. A job that ran for ten minutes will hardly finish in the next
+    second, so the wait is a fraction of how long the youngest job has been running
+
+    :param elapsed: Seconds the jobs have been running
+    :type elapsed: list
+    :param minimum: Shortest wait in seconds
+    :type minimum: float, optional, default 1.0
+    :param maximum: Longest wait in seconds
+    :type maximum: float, optional, default 30.0
+    :param ratio: Fraction of the running time that is waited
+    :type ratio: float, optional, default 0.1
+    :return: float
+    """
+    return min(maximum, max(minimum, ratio * min(elapsed, default=0)))
+
+
+def pending_jobs(jobs):
+    """
+    Index jobs to wait for by id, they are all unified jobs so the ids do not overlap
+
+    :param jobs: The jobs
+    :type jobs: list
+    :return: dict
+    """
+    pending = dict()
+
+    for job in jobs:
+        if job.id is None:
+            raise ValueError("The job has not been saved in AWX yet")
+        pending[job.id] = job
+
+    return pending
+
+
+def batches(ids, size):
+    ids = sorted(ids)
+    return [ids[start:start + size] for start in range(0, len(ids), size)]
+
+
+def finished_jobs(pending, page):
+    """
+    Update the pending jobs from a page of unified jobs and take out the ones that finished
+
+    :param pending: The jobs still running keyed by id, see :func:`pending_jobs`
+    :type pending: dict
+    :param page: A page of ``/api/v2/unified_jobs``
+    :type page: dict
+    :return: list of finished jobs
+    """
+    finished = list()
+
+    for item in page["results"]:
+        job = pending.get(item["id"])
+
+        if job is not None:
+            update(job, item)
+
+            if item.get("status") in FINISHED_STATUSES:
+                finished.append(pending.pop(item["id"]))
+
+    return finished
+
+
+def wait_interval(pending, waited, minimum, maximum, deadline):
+    """
+    Seconds until the next poll for the pending jobs
+
+    :param pending: The jobs still running keyed by id
+    :type pending: dict
+    :param waited: Seconds spent waiting so far
+    :type waited: float
+    :param minimum: Shortest wait in seconds
+    :type minimum: float
+    :param maximum: Longest wait in seconds
+    :type maximum: float
+    :param deadline: ``time.monotonic()`` value to give up at, None to wait forever
+    :type deadline: float
+    :return: float
+    :raises: :class:`pyawx.exceptions.WaitTimeout` once the deadline passed
+    """
+    now = monotonic()
+
+    if deadline is not None and now >= deadline:
+        raise WaitTimeout(list(pending.values()))
+
+    interval = elapsed_interval([running_for(job, waited) for job in pending.values()], minimum, maximum)
+
+    return interval if deadline is None else min(interval, deadline - now)
+
+
+class PollInterval:
+    """
+    Seconds to wait between polls. Starts at ``minimum`` and grows by ``factor`` every time a poll found nothing
+    new, up to ``maximum``. A poll that found something drops it back to ``minimum``, so busy jobs are followed
+    closely and idle ones cost few requests
+    """
+    __slots__ = ("minimum", "maximum", "factor", "current")
+
+    def __init__(self, minimum=0.5, maximum=5.0, factor=2.0):
+        """
+        :param minimum: Shortest wait in seconds
+        :type minimum: float, optional, default 0.5
+        :param maximum: Longest wait in seconds
+        :type maximum: float, optional, default 5.0
+        :param factor: Growth of the wait after a poll that found nothing new
+        :type factor: float, optional, default 2.0
+        """
+        if minimum <= 0 or maximum < minimum:
+            raise ValueError("minimum has to be positive and not larger than maximum")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.current = minimum
+
+    def next(self, progress):
+        """
+        Seconds to wait before the next poll
+
+        :param progress: True when the last poll found something new
+        :type progress: bool
+        :return: float
+        """
+        if progress:
+            self.current = self.minimum
+        else:
+            self.current = min(self.maximum, self.current * self.factor)
+
+        return self.current
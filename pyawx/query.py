@@ -0,0 +1,209 @@
+"""
+query.py
+Comments: Builder for the filter, search and ordering query parameters of the AWX API
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from datetime import date, datetime
+
+from pyawx.models import DataModelMixin
+
+
+def _to_param(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, (datetime, date)):
+        return value.isoformat()
+    elif isinstance(value, DataModelMixin):
+        return value.id
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(str(_to_param(item)) for item in value)
+    return value
+
+
+def compile_filters(**filters):
+    """
+    Turn filter keyword arguments into AWX query parameters. Lookups use the AWX (Django) syntax, e.g.
+    ``status="failed"``, ``finished__gt=datetime(...)``, ``id__in=[1, 2, 3]`` or ``inventory__name="Web"``.
+
+    Booleans become ``true``/``false``, dates are sent in ISO 8601, lists are comma separated, models are sent
+    as their id and ``None`` becomes an ``__isnull`` lookup.
+
+    :return: dict
+    """
+    params = dict()
+
+    for key, value in filters.items():
+        if value is None and not key.endswith("__isnull"):
+            key, value = f"{key}__isnull", True
+
+        params[key] = _to_param(value)
+
+    return params
+
+
+class Query:
+    """
+    Chainable query against a collection. Every method returns a new query, nothing is sent to AWX until the
+    query is iterated or :meth:`all`, :meth:`first`, :meth:`count`, :meth:`exists` or :meth:`columns` is called::
+
+        failed = client.query(Job).filter(status="failed", finished__gt=an_hour_ago).order_by("-id")
+
+        for job in failed:
+            print(job.name)
+    """
+
+    def __init__(self, client, model, filters=None, order=None, fields=None, page_size=None):
+        """
+        :param client: The client to run the query with
+        :type client: :class:`pyawx.api.Client`
+        :param model: The model object that is being requested
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        """
+        self._client = client
+        self.model = model
+        self._filters = filters or dict()
+        self._order = order or tuple()
+        self._fields = fields
+        self._page_size = page_size
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.model.__name__} {self.params}>"
+
+    def __iter__(self):
+        return self._client.iter_data(self.model, page_size=self._page_size, filters=self.params)
+
+    def _clone(self, **changes):
+        state = {
+            "filters": self._filters,
+            "order": self._order,
+            "fields": self._fields,
+            "page_size": self._page_size
+        }
+        state.update(changes)
+        return self.__class__(self._client, self.model, **state)
+
+    @property
+    def params(self):
+        """
+        The query parameters that are sent to AWX
+
+        :return: dict
+        """
+        params = compile_filters(**self._filters)
+
+        if self._order:
+            params["order_by"] = ",".join(self._order)
+
+        return params
+
+    def filter(self, **filters):
+        """
+        Only return records matching all filters, see :func:`compile_filters` for the lookup syntax
+
+        :return: :class:`Query`
+        """
+        return self._clone(filters={**self._filters, **filters})
+
+    def exclude(self, **filters):
+        """
+        Leave out records matching the filters
+
+        :return: :class:`Query`
+        """
+        return self.filter(**{f"not__{key}": value for key, value in filters.items()})
+
+    def search(self, term):
+        """
+        Full text search over the fields AWX makes searchable for the model, mostly name and description
+
+        :param term: The text to look for
+        :type term: str
+        :return: :class:`Query`
+        """
+        return self.filter(search=term)
+
+    def order_by(self, *fields):
+        """
+        Order the records, prefix a field with ``-`` for descending order
+
+        :return: :class:`Query`
+        """
+        return self._clone(order=self._order + fields)
+
+    def only(self, *fields):
+        """
+        Fields kept by :meth:`columns`. AWX always sends whole records, so this keeps memory down on the client side
+
+        :return: :class:`Query`
+        """
+        return self._clone(fields=list(fields))
+
+    def page_size(self, page_size):
+        """
+        Number of records requested per page
+
+        :param page_size: Records per page
+        :type page_size: int
+        :return: :class:`Query`
+        """
+        return self._clone(page_size=page_size)
+
+    def all(self, workers=None):
+        """
+        Load all matching records
+
+        :param workers: Fetch the pages concurrently with up to this many requests in flight
+        :type workers: int, optional
+        :return: list of models
+        """
+        return self._client.get_data(self.model, page_size=self._page_size, workers=workers, filters=self.params)
+
+    def first(self):
+        """
+        Load the first matching record, only a single record is requested
+
+        :return: model or None
+        """
+        for item in self._client.iter_data(self.model, page_size=1, filters=self.params):
+            return item
+        return None
+
+    def count(self, ttl=None):
+        """
+        Number of matching records, see :meth:`pyawx.api.Client.count`
+
+        :param ttl: Seconds the answer is reused, not cached when not set
+        :type ttl: float, optional
+        :return: int
+        """
+        return self._client.count(self.model, self._filters, ttl=ttl)
+
+    def exists(self, ttl=None):
+        """
+        Check if any record matches, see :meth:`pyawx.api.Client.count`
+
+        :param ttl: Seconds the answer is reused, not cached when not set
+        :type ttl: float, optional
+        :return: bool
+        """
+        return self._client.exists(self.model, self._filters, ttl=ttl)
+
+    def columns(self, workers=None):
+        """
+        Load all matching records as a :class:`pyawx.resultset.ResultSet` holding the fields from :meth:`only`
+
+        :param workers: Fetch the pages concurrently with up to this many requests in flight
+        :type workers: int, optional
+        :return: :class:`pyawx.resultset.ResultSet`
+        """
+        return self._client.get_data(
+            self.model,
+            page_size=self._page_size,
+            workers=workers,
+            as_columns=True,
+            fields=self._fields,
+            filters=self.params
+        )
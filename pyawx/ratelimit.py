@@ -0,0 +1,168 @@
+"""
+ratelimit.py
+Comments: Client side rate limiting to protect shared AWX controllers
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import asyncio
+from fnmatch import fnmatchcase
+from threading import Condition
+from time import monotonic
+from urllib.parse import urlparse
+
+
+class _Bucket:
+    """
+    Token bucket for the request rate combined with a counter for requests in flight
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        self.rate = rate
+        self.capacity = burst or max(1, rate or 1)
+        self.max_in_flight = max_in_flight
+        self.tokens = self.capacity
+        self.in_flight = 0
+        self.updated = monotonic()
+
+    def wait_time(self, now):
+        """
+        Seconds until a request may go out, None when it has to wait for a request in flight to finish
+        """
+        if self.rate:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return None
+        elif self.rate and self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+
+        return 0
+
+    def take(self):
+        if self.rate:
+            self.tokens -= 1
+        self.in_flight += 1
+
+    def give_back(self):
+        self.in_flight -= 1
+
+
+class RateLimiter:
+    """
+    Limits the requests per second and the requests in flight for a client. Extra limits can be set for
+    endpoints matching a pattern, e.g. job launches::
+
+        limiter = RateLimiter(
+            rate=20,
+            max_in_flight=10,
+            per_endpoint={
+                "/api/v2/job_templates/*/launch": {"rate": 1, "max_in_flight": 2}
+            }
+        )
+        client = Client("https://awx.mycompany.com", token="abc", rate_limiter=limiter)
+
+    One limiter can be shared by many clients, threads and :class:`pyawx.aio.AsyncClient` instances
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None, per_endpoint=None, poll_interval=0.05):
+        """
+        :param rate: Requests per second, not limited when not set
+        :type rate: float, optional
+        :param burst: Requests that may go out at once after a quiet period, defaults to ``rate``
+        :type burst: int, optional
+        :param max_in_flight: Requests waiting for an answer at the same time, not limited when not set
+        :type max_in_flight: int, optional
+        :param per_endpoint: Extra limits keyed by a glob pattern on the URL path, the values take ``rate``,
+            ``burst`` and ``max_in_flight``. Trailing slashes are ignored
+        :type per_endpoint: dict, optional
+        :param poll_interval: Seconds the asyncio client sleeps between checks while the in flight limit is reached
+        :type poll_interval: float, optional
+        """
+        self._released = Condition()
+        self._poll_interval = poll_interval
+        self._default = _Bucket(rate, burst, max_in_flight) if rate or max_in_flight else None
+        self._rules = [
+            (pattern.rstrip("/"), _Bucket(**limits)) for pattern, limits in (per_endpoint or dict()).items()
+        ]
+
+    def _buckets(self, url):
+        path = urlparse(url).path.rstrip("/")
+        buckets = [bucket for pattern, bucket in self._rules if fnmatchcase(path, pattern)]
+
+        if self._default is not None:
+            buckets.append(self._default)
+
+        return buckets
+
+    def _try_acquire(self, buckets):
+        """
+        Take a slot from every bucket or none at all. Has to be called with the lock held
+
+        :return: 0 when acquired, otherwise the seconds to wait or None to wait for a release
+        """
+        now = monotonic()
+        waits = [bucket.wait_time(now) for bucket in buckets]
+
+        if None in waits:
+            return None
+
+        wait = max(waits, default=0)
+
+        if wait == 0:
+            for bucket in buckets:
+                bucket.take()
+
+        return wait
+
+    def acquire(self, url):
+        """
+        Block until a request to the URL may go out
+
+        :param url: The request URL
+        :type url: str
+        :return: Token to hand to :meth:`release` once the request is done
+        """
+        buckets = self._buckets(url)
+
+        with self._released:
+            while True:
+                wait = self._try_acquire(buckets)
+
+                if wait == 0:
+                    return buckets
+
+                self._released.wait(timeout=wait)
+
+    async def acquire_async(self, url):
+        """
+        Wait without blocking the event loop until a request to the URL may go out
+
+        :param url: The request URL
+        :type url: str
+        :return: Token to hand to :meth:`release` once the request is done
+        """
+        buckets = self._buckets(url)
+
+        while True:
+            with self._released:
+                wait = self._try_acquire(buckets)
+
+            if wait == 0:
+                return buckets
+
+            await asyncio.sleep(self._poll_interval if wait is None else wait)
+
+    def release(self, token):
+        """
+        Mark a request as done
+
+        :param token: The value returned by :meth:`acquire` or :meth:`acquire_async`
+        :return: None
+        """
+        with self._released:
+            for bucket in token:
+                bucket.give_back()
+            self._released.notify_all()
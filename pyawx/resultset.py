@@ -0,0 +1,190 @@
+"""
+resultset.py
+Comments: Column oriented storage for large listings
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+from array import array
+from sys import intern
+
+
+def _compact(values):
+    """
+    Store a column in the smallest container that fits: ``array`` for ints and floats, interned strings for text.
+    Columns with missing values or mixed types are kept as a plain list.
+    """
+    kinds = {type(value) for value in values}
+
+    if kinds == {int}:
+        return array("q", values)
+    elif kinds and kinds <= {int, float}:
+        return array("d", values)
+    elif kinds == {str}:
+        return [intern(value) for value in values]
+
+    return values
+
+
+def _take(column, indexes):
+    if isinstance(column, array):
+        return array(column.typecode, (column[index] for index in indexes))
+    return [column[index] for index in indexes]
+
+
+class ResultSet:
+    """
+    Columnar result of a listing. Each field is stored as one contiguous column instead of one model per row,
+    which keeps reports over tens of thousands of records cheap. Use :meth:`to_models` to get model objects back
+    """
+
+    def __init__(self, model, columns, length):
+        """
+        :param model: The model the rows belong to
+        :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+        :param columns: Field name to column of values
+        :type columns: dict
+        :param length: Number of rows
+        :type length: int
+        """
+        self.model = model
+        self._columns = columns
+        self._length = length
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} of {self.model.__name__} rows={self._length} fields={self.fields}>"
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return self.rows()
+
+    def __getitem__(self, field):
+        return self._columns[field]
+
+    @classmethod
+    def from_rows(cls, model, rows, fields=None):
+        """
+        Build a result set from raw AWX records
+
+        :param model: The model the rows belong to
+        :param rows: Iterable of record dicts
+        :param fields: Fields to keep, every top level field of the first record when not set
+        :type fields: list, optional
+        :return: :class:`ResultSet`
+        """
+        columns = {field: list() for field in fields} if fields else None
+        length = 0
+
+        for row in rows:
+            if columns is None:
+                columns = {field: list() for field in row}
+
+            for field, column in columns.items():
+                column.append(row.get(field))
+
+            length += 1
+
+        columns = {field: _compact(column) for field, column in (columns or dict()).items()}
+
+        return cls(model, columns, length)
+
+    @classmethod
+    def from_pages(cls, model, pages, fields=None):
+        """
+        Build a result set from listing pages as handed back by AWX
+
+        :param model: The model the rows belong to
+        :param pages: Iterable of page dicts
+        :param fields: Fields to keep, every top level field of the first record when not set
+        :type fields: list, optional
+        :return: :class:`ResultSet`
+        """
+        return cls.from_rows(model, (item for page in pages for item in page["results"]), fields=fields)
+
+    @property
+    def fields(self):
+        return list(self._columns)
+
+    def column(self, field):
+        """
+        Get all values of a single field
+
+        :param field: The field name
+        :type field: str
+        :return: array or list
+        """
+        return self._columns[field]
+
+    def row(self, index):
+        """
+        Get a single row as a dict
+
+        :param index: Position of the row
+        :type index: int
+        :return: dict
+        """
+        return {field: column[index] for field, column in self._columns.items()}
+
+    def rows(self):
+        """
+        Iterate over the rows as dicts
+
+        :return: generator of dict
+        """
+        for index in range(self._length):
+            yield self.row(index)
+
+    def _select(self, indexes):
+        return self.__class__(
+            self.model,
+            {field: _take(column, indexes) for field, column in self._columns.items()},
+            len(indexes)
+        )
+
+    def filter(self, predicate=None, **values):
+        """
+        Keep the rows that match. Keyword arguments are compared for equality, a predicate gets every row as a dict::
+
+            failed = result_set.filter(status="failed")
+            slow = result_set.filter(lambda row: row["elapsed"] > 600)
+
+        :param predicate: Called with each row, rows are kept when it returns True
+        :type predicate: callable, optional
+        :return: :class:`ResultSet`
+        """
+        indexes = range(self._length)
+
+        for field, value in values.items():
+            column = self._columns[field]
+            indexes = [index for index in indexes if column[index] == value]
+
+        if predicate is not None:
+            indexes = [index for index in indexes if predicate(self.row(index))]
+
+        return self._select(list(indexes))
+
+    def group_by(self, field):
+        """
+        Split the rows on the value of a field
+
+        :param field: The field name
+        :type field: str
+        :return: dict of value to :class:`ResultSet`
+        """
+        groups = dict()
+
+        for index, value in enumerate(self._columns[field]):
+            groups.setdefault(value, list()).append(index)
+
+        return {value: self._select(indexes) for value, indexes in groups.items()}
+
+    def to_models(self):
+        """
+        Turn the rows into model objects. Only the fields kept in the result set are available on them
+
+        :return: list of models
+        """
+        return [self.model(internal_=True, **row) for row in self.rows()]
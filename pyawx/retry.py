@@ -0,0 +1,125 @@
+"""
+retry.py
+Comments: Retry policy for transient AWX errors
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    Decides if and when a failed request is sent again. Waits grow exponentially with full jitter, a
+    ``Retry-After`` header sent by AWX takes precedence.
+
+    Only requests that are safe to repeat are retried: GET, HEAD, OPTIONS, PUT, DELETE and PATCH (the client
+    only sends absolute values in a PATCH). POST, e.g. creating objects or launching jobs, is only retried when
+    ``retry_post`` is set, because a request that timed out may still have been carried out by AWX.
+    """
+
+    IDEMPOTENT_METHODS = frozenset(["get", "head", "options", "put", "delete", "patch"])
+
+    def __init__(self, total=3, backoff_factor=0.5, max_backoff=30.0, statuses=(429, 502, 503, 504),
+                 retry_post=False, jitter=True, respect_retry_after=True):
+        """
+        :param total: Number of retries after the first attempt
+        :type total: int, optional, default 3
+        :param backoff_factor: Base wait in seconds, attempt ``n`` waits up to ``backoff_factor * 2 ** n``
+        :type backoff_factor: float, optional, default 0.5
+        :param max_backoff: Upper limit for a single wait in seconds
+        :type max_backoff: float, optional, default 30
+        :param statuses: HTTP status codes that are retried
+        :type statuses: tuple, optional, default (429, 502, 503, 504)
+        :param retry_post: Also retry POST requests
+        :type retry_post: bool, optional, default False
+        :param jitter: Pick a random wait between 0 and the backoff so many clients do not retry in lock step
+        :type jitter: bool, optional, default True
+        :param respect_retry_after: Wait as long as the ``Retry-After`` header asks, capped by ``max_backoff``
+        :type respect_retry_after: bool, optional, default True
+        """
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.retry_post = retry_post
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} total={self.total} statuses={sorted(self.statuses)}>"
+
+    def allows(self, method):
+        """
+        Check if requests with this HTTP method may be retried at all
+
+        :param method: The HTTP method
+        :type method: str
+        :return: bool
+        """
+        method = method.lower()
+        return method in self.IDEMPOTENT_METHODS or (method == "post" and self.retry_post)
+
+    def should_retry(self, method, attempt, status_code=None, error=None):
+        """
+        Check if a request should be sent again
+
+        :param method: The HTTP method
+        :type method: str
+        :param attempt: Number of retries done so far
+        :type attempt: int
+        :param status_code: Status code AWX answered with
+        :type status_code: int, optional
+        :param error: Transient connection error raised instead of a response
+        :type error: Exception, optional
+        :return: bool
+        """
+        if attempt >= self.total or not self.allows(method):
+            return False
+
+        return error is not None or status_code in self.statuses
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Seconds to wait before the next attempt
+
+        :param attempt: Number of retries done so far
+        :type attempt: int
+        :param retry_after: Value of the ``Retry-After`` header, seconds or an HTTP date
+        :type retry_after: str, optional
+        :return: float
+        """
+        if self.respect_retry_after and retry_after:
+            wait = self._parse_retry_after(retry_after)
+
+            if wait is not None:
+                return min(wait, self.max_backoff)
+
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def _parse_retry_after(value):
+        if not isinstance(value, str):
+            return None
+
+        value = value.strip()
+
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at is None:
+            return None
+        elif retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,188 @@
+"""
+store.py
+Comments: Persistent SQLite store of model payloads for fast warm starts
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+import json
+import sqlite3
+from threading import Lock
+
+from pyawx.sync import modified_since
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    endpoint TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    modified TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (endpoint, id)
+);
+CREATE INDEX IF NOT EXISTS objects_modified ON objects (endpoint, modified);
+"""
+
+
+class ModelStore:
+    """
+    Keeps the payloads of loaded records in a local SQLite file, keyed by endpoint and id together with their
+    ``modified`` timestamp. After a restart :meth:`pyawx.api.Client.get_stored` reads the records from disk and
+    only asks AWX for the ones modified since::
+
+        store = ModelStore("/var/cache/reporting/awx.sqlite3")
+        client = Client("https://awx.mycompany.com", token="abc", store=store)
+
+        hosts = client.get_stored(Host)
+
+    A store can be shared by clients in several threads. Records deleted in AWX are kept until they are removed
+    with :meth:`delete` or :meth:`clear`
+    """
+
+    def __init__(self, path):
+        """
+        :param path: The SQLite file, ``:memory:`` keeps the store in memory
+        :type path: str
+        """
+        self.path = str(path)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+    def load(self, endpoint):
+        """
+        Read every record stored for an endpoint
+
+        :param endpoint: The model endpoint, e.g. ``/api/v2/hosts``
+        :type endpoint: str
+        :return: list of payloads
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM objects WHERE endpoint = ? ORDER BY id", (endpoint,)
+            ).fetchall()
+
+        return [json.loads(payload) for payload, in rows]
+
+    def ids(self, endpoint):
+        """
+        Ids of the records stored for an endpoint
+
+        :param endpoint: The model endpoint
+        :type endpoint: str
+        :return: set of ids
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT id FROM objects WHERE endpoint = ?", (endpoint,)).fetchall()
+
+        return {object_id for object_id, in rows}
+
+    def latest(self, endpoint):
+        """
+        The newest ``modified`` timestamp stored for an endpoint
+
+        :param endpoint: The model endpoint
+        :type endpoint: str
+        :return: str or None when nothing is stored
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT MAX(modified) FROM objects WHERE endpoint = ?", (endpoint,)
+            ).fetchone()[0]
+
+    def save(self, endpoint, payloads):
+        """
+        Insert or replace records, payloads without an id are skipped
+
+        :param endpoint: The model endpoint
+        :type endpoint: str
+        :param payloads: Records as returned by AWX
+        :type payloads: list
+        :return: None
+        """
+        rows = [
+            (endpoint, payload["id"], payload.get("modified"), json.dumps(payload))
+            for payload in payloads if payload.get("id") is not None
+        ]
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO objects (endpoint, id, modified, payload) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def delete(self, endpoint, ids):
+        """
+        Remove records
+
+        :param endpoint: The model endpoint
+        :type endpoint: str
+        :param ids: Ids of the records
+        :type ids: list
+        :return: None
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM objects WHERE endpoint = ? AND id = ?", [(endpoint, object_id) for object_id in ids]
+            )
+
+    def clear(self, endpoint=None):
+        """
+        Remove every record, or only the ones of an endpoint
+
+        :param endpoint: The model endpoint
+        :type endpoint: str, optional
+        :return: None
+        """
+        with self._lock, self._connection:
+            if endpoint is None:
+                self._connection.execute("DELETE FROM objects")
+            else:
+                self._connection.execute("DELETE FROM objects WHERE endpoint = ?", (endpoint,))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def stored_since(store, model):
+    """
+    Read the stored records of a model and the filters to ask AWX for the ones modified since
+
+    :param store: The client's store
+    :type store: :class:`ModelStore`
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :return: tuple of stored payloads and filters
+    """
+    if store is None:
+        raise ValueError("The client was created without a store")
+
+    return store.load(model.__endpoint__), modified_since(store.latest(model.__endpoint__))
+
+
+def merge_stored(store, model, stored, fresh):
+    """
+    Save the records AWX sent and lay them over the stored ones
+
+    :param store: The client's store
+    :type store: :class:`ModelStore`
+    :param model: The model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :param stored: Payloads read with :func:`stored_since`
+    :type stored: list
+    :param fresh: Payloads AWX sent
+    :type fresh: list
+    :return: list of payloads ordered by id
+    """
+    store.save(model.__endpoint__, fresh)
+
+    merged = {item["id"]: item for item in stored}
+    merged.update((item["id"], item) for item in fresh if item.get("id") is not None)
+
+    return [merged[object_id] for object_id in sorted(merged)]
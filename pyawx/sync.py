@@ -0,0 +1,186 @@
+"""
+sync.py
+Comments: Cursor and result of an incremental sync, see Client.sync
+Author: Dennis Whitney
+Email: dennis@runasroot.com
+Copyright (c) 2021, iRunAsRoot
+"""
+
+
+class SyncCursor:
+    """
+    Where the last sync of a model stopped: the newest ``modified`` timestamp seen, the records seen with it and
+    the ids known to exist. Save it with :meth:`to_dict` and hand it back to the next sync, e.g. after a restart::
+
+        with open("hosts.cursor", "w") as cursor_fp:
+            json.dump(result.cursor.to_dict(), cursor_fp)
+
+        with open("hosts.cursor") as cursor_fp:
+            cursor = SyncCursor.from_dict(json.load(cursor_fp))
+    """
+    __slots__ = ("endpoint", "modified", "ids", "boundary")
+
+    def __init__(self, endpoint, modified=None, ids=None, boundary=None):
+        """
+        :param endpoint: The endpoint of the synced model
+        :type endpoint: str
+        :param modified: The newest ``modified`` timestamp seen
+        :type modified: str, optional
+        :param ids: Ids of the records known to exist
+        :type ids: set, optional
+        :param boundary: Ids of the records seen with the ``modified`` timestamp
+        :type boundary: set, optional
+        """
+        self.endpoint = endpoint
+        self.modified = modified
+        self.ids = set(ids or ())
+        self.boundary = set(boundary or ())
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.endpoint} modified={self.modified} ids={len(self.ids)}>"
+
+    def __eq__(self, other):
+        return isinstance(other, SyncCursor) and self.to_dict() == other.to_dict()
+
+    def to_dict(self):
+        """
+        Export the cursor as a JSON serializable dict
+
+        :return: dict
+        """
+        return {
+            "endpoint": self.endpoint,
+            "modified": self.modified,
+            "ids": sorted(self.ids),
+            "boundary": sorted(self.boundary)
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a cursor from the output of :meth:`to_dict`
+
+        :param data: The exported cursor
+        :type data: dict
+        :return: :class:`SyncCursor`
+        """
+        return cls(data["endpoint"], modified=data.get("modified"), ids=data.get("ids"), boundary=data.get("boundary"))
+
+
+class SyncResult:
+    """
+    Records that changed since the previous sync
+    """
+    __slots__ = ("models", "added", "changed", "removed", "cursor")
+
+    def __init__(self, models, added, changed, removed, cursor):
+        """
+        :param models: The created and changed records, oldest change first
+        :type models: list
+        :param added: Ids of the records that are new since the previous sync
+        :type added: set
+        :param changed: Ids of known records that were changed
+        :type changed: set
+        :param removed: Ids of known records that no longer exist
+        :type removed: set
+        :param cursor: Cursor to pass to the next sync
+        :type cursor: :class:`SyncCursor`
+        """
+        self.models = models
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.cursor = cursor
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} added={len(self.added)} changed={len(self.changed)} "
+            f"removed={len(self.removed)}>"
+        )
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+
+def start_sync(model, since):
+    """
+    Check the cursor belongs to the model, a missing cursor starts a full sync
+
+    :param model: The synced model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :param since: Cursor of the previous sync
+    :type since: :class:`SyncCursor`, optional
+    :return: :class:`SyncCursor`
+    """
+    if since is None:
+        return SyncCursor(model.__endpoint__)
+
+    if since.endpoint != model.__endpoint__:
+        raise ValueError(f"Cursor is for {since.endpoint}, not {model.__endpoint__}")
+
+    return since
+
+
+def modified_since(modified):
+    """
+    Filters for the records modified at or after a ``modified`` timestamp, oldest change first. Records saved in
+    the same instant as the newest one seen may only have been committed after it was read, so the timestamp
+    itself is asked for again
+
+    :param modified: The newest ``modified`` timestamp seen, all records are asked for when not set
+    :type modified: str
+    :return: dict
+    """
+    return {"modified__gte": modified, "order_by": "modified"} if modified else {"order_by": "modified"}
+
+
+def existing_ids_params():
+    """
+    Walk every record of a listing with as few requests as AWX allows, used to find removed records
+
+    :return: dict
+    """
+    return {"page_size": 200, "order_by": "id"}
+
+
+def diff_sync(since, fresh):
+    """
+    Split the records modified since the cursor into added and changed ones and move the cursor past them. The
+    records :func:`modified_since` returns again for the cursor's own timestamp are dropped when they were seen
+    with it before
+
+    :param since: Cursor of the previous sync
+    :type since: :class:`SyncCursor`
+    :param fresh: Records AWX returned as modified since the cursor, oldest change first
+    :type fresh: list
+    :return: tuple of the new and changed records, added ids, changed ids and the next :class:`SyncCursor`
+    """
+    fresh = [item for item in fresh if item.get("modified") != since.modified or item["id"] not in since.boundary]
+    fresh_ids = {item["id"] for item in fresh}
+    added = fresh_ids - since.ids
+    modified = max((item["modified"] for item in fresh if item.get("modified")), default=since.modified)
+    boundary = {item["id"] for item in fresh if item.get("modified") == modified}
+
+    if modified == since.modified:
+        boundary |= since.boundary
+
+    return fresh, added, fresh_ids & since.ids, SyncCursor(since.endpoint, modified, since.ids | added, boundary)
+
+
+def store_sync(store, model, fresh, removed):
+    """
+    Save the records a sync returned and delete the removed ones
+
+    :param store: The client's store, nothing is done without one
+    :type store: :class:`pyawx.store.ModelStore`
+    :param model: The synced model
+    :type model: subclass of :class:`pyawx.models.mixins.DataModelMixin`
+    :param fresh: The new and changed records
+    :type fresh: list
+    :param removed: Ids of the records that no longer exist
+    :type removed: set
+    :return: None
+    """
+    if store is not None:
+        store.save(model.__endpoint__, fresh)
+        store.delete(model.__endpoint__, removed)
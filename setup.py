@@ -21,6 +21,9 @@ setup(
     install_requires=[
         "requests"
     ],
+    extras_require={
+        "async": ["aiohttp"]
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
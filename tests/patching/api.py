@@ -1,4 +1,6 @@
 import json
+import re
+from threading import Lock
 from unittest.mock import patch, Mock
 from pathlib import Path
 from requests import Session
@@ -32,3 +34,155 @@ def load_model(model):
     with BASE_PATH.joinpath(f"mock_data/{model_name}.json").open("r") as model_fp:
         model_data = json.load(model_fp)
     return model_data
+
+
+def mock_response(body, status_code=200):
+    """Response of a patched Session call that answers with a JSON body"""
+    return Mock(status_code=status_code, json=Mock(return_value=body))
+
+
+def mock_page(results, count=None):
+    """Single page of a listing, ``count`` defaults to the number of results"""
+    return mock_response({"count": len(results) if count is None else count, "next": None, "results": results})
+
+
+def get_async_client(**kwargs):
+    """AsyncClient that is never opened, answer its requests with :func:`async_request`"""
+    from pyawx.aio import AsyncClient
+    return AsyncClient("https://", token="123", **kwargs)
+
+
+def async_request(get=None, post=None):
+    """Stand in for AsyncClient._request that answers with the same fakes the blocking tests patch Session with"""
+    handlers = {"get": get, "post": post}
+
+    async def request(method, url, **kwargs):
+        response = handlers[method](url, **kwargs)
+        return response.status_code, response.json()
+
+    return request
+
+
+class FakeHosts:
+    """Serves hosts filtered on ``modified__gte``, a page of one record is a count request"""
+
+    def __init__(self, hosts):
+        self.hosts = hosts
+        self.requests = list()
+
+    def __call__(self, url, params=None, **kwargs):
+        params = params or dict()
+        self.requests.append(params)
+
+        if params.get("page_size") == 1:
+            return mock_page(self.hosts[:1], count=len(self.hosts))
+
+        hosts = [host for host in self.hosts if host["modified"] >= params.get("modified__gte", "")]
+        return mock_page(sorted(hosts, key=lambda host: host[params.get("order_by", "id")]))
+
+
+class FakeJob:
+    """Serves a job that emits events in batches and finishes processing after the last one"""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.polls = 0
+        self.event_params = list()
+
+    def __call__(self, url, params=None, **kwargs):
+        if url.endswith("/jobs/7/"):
+            self.polls += 1
+            return mock_response({"id": 7, "event_processing_finished": self.polls >= len(self.batches)})
+
+        self.event_params.append(params)
+        events = [event for event in self.batches[self.polls - 1] if event["counter"] > params["counter__gt"]]
+        return mock_response({"count": len(events), "next": None, "results": events})
+
+
+class FakeUnifiedJobs:
+    """Answers unified job polls, every job finishes after the given number of polls"""
+
+    def __init__(self, polls_to_finish):
+        self.polls_to_finish = polls_to_finish
+        self.polls = 0
+        self.requests = list()
+
+    def __call__(self, url, params=None, **kwargs):
+        self.requests.append((url, params))
+        self.polls += 1
+
+        results = [
+            {"id": job_id, "status": "successful" if self.polls >= self.polls_to_finish[job_id] else "running"}
+            for job_id in map(int, params["id__in"].split(","))
+        ]
+        return mock_page(results)
+
+
+class FakeLaunches:
+    """Launch endpoint of a template that asks for a limit, an inventory and a survey, ``broken`` limits fail"""
+    requirements = {
+        "ask_limit_on_launch": True,
+        "ask_variables_on_launch": False,
+        "ask_inventory_on_launch": True,
+        "survey_enabled": True,
+        "variables_needed_to_start": ["version"]
+    }
+
+    def __init__(self):
+        self.posted = list()
+        self.lock = Lock()
+
+    def get(self, url, params=None, **kwargs):
+        return mock_response(self.requirements)
+
+    def post(self, url, json=None, **kwargs):
+        with self.lock:
+            self.posted.append(json)
+            job_id = 100 + len(self.posted)
+
+        if json["limit"] == "broken":
+            return mock_response({"limit": ["Bad limit"]}, status_code=400)
+        return mock_response(dict(json, id=job_id, job=job_id, status="pending"), status_code=201)
+
+
+class FakeAdHocCommands:
+    """Runs ad hoc commands instantly, ``db1`` is unreachable and commands limited to ``db2`` are rejected"""
+    hosts = ["web1", "web2", "web3", "db1", "db2"]
+
+    def __init__(self):
+        self.commands = dict()
+        self.lock = Lock()
+
+    def post(self, url, json=None, **kwargs):
+        if json["limit"] == "db2":
+            return mock_response({"limit": ["Rejected"]}, status_code=400)
+
+        with self.lock:
+            command_id = len(self.commands) + 1
+            self.commands[command_id] = json
+
+        return mock_response(dict(json, id=command_id, status="pending"), status_code=201)
+
+    def get(self, url, params=None, **kwargs):
+        if url.endswith("/inventories/3/hosts/"):
+            return mock_page([{"id": number, "name": name} for number, name in enumerate(self.hosts)])
+
+        if url.endswith("/unified_jobs/"):
+            return mock_page([{"id": int(item), "status": "successful"} for item in params["id__in"].split(",")])
+
+        command_id = int(re.search(r"/ad_hoc_commands/(\d+)/", url).group(1))
+
+        if url.endswith("/events/"):
+            hosts = self.commands[command_id]["limit"].split(",")
+            return mock_page([
+                {
+                    "id": command_id * 100 + number,
+                    "counter": number + 1,
+                    "event": "runner_on_unreachable" if host == "db1" else "runner_on_ok",
+                    "host_name": host,
+                    "event_data": {"res": {"ping": "pong"}}
+                }
+                for number, host in enumerate(hosts)
+            ])
+
+        return mock_response({"id": command_id, "event_processing_finished": True})
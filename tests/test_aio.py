@@ -0,0 +1,263 @@
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+try:
+    from aiohttp import web
+except ImportError:  # pragma: no cover
+    web = None
+
+from tests.patching.api import (
+    load_model, get_async_client, async_request, mock_page, FakeHosts, FakeJob, FakeUnifiedJobs, FakeLaunches,
+    FakeAdHocCommands
+)
+
+from pyawx.exceptions import RequestFailed, ValueNotAllowed, WaitTimeout
+from pyawx.models.inventories import Host, Inventory
+from pyawx.ratelimit import RateLimiter
+from pyawx.store import ModelStore
+from pyawx.models.jobs import Job, JobTemplate, JobEvent
+from pyawx.models.projects import Project, ProjectUpdate
+
+OUTPUT = b"".join(f"line {number}\n".encode() for number in range(1000))
+
+
+# IsolatedAsyncioTestCase is new in Python 3.8
+AsyncTestCase = getattr(unittest, "IsolatedAsyncioTestCase", unittest.TestCase)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+@unittest.skipIf(AsyncTestCase is unittest.TestCase, "Python 3.8 or newer is needed to run asyncio tests")
+class TestAsyncClient(AsyncTestCase):
+    async def asyncSetUp(self):
+        from pyawx.aio import AsyncClient
+
+        self.project = load_model(Project)
+        self.posted = list()
+
+        async def me(request):
+            return web.json_response({"results": []})
+
+        async def projects(request):
+            page = int(request.query.get("page", 1))
+            return web.json_response(
+                {
+                    "count": 3,
+                    "next": None if page == 2 else "/api/v2/projects/?page=2",
+                    "results": [dict(self.project, id=page * 10 + offset) for offset in range(2 if page == 1 else 1)]
+                }
+            )
+
+        async def create_project(request):
+            self.posted.append(await request.json())
+            return web.json_response(dict(self.project, id=99), status=201)
+
+        async def stdout(request):
+            if request.headers.get("Range"):
+                start = int(request.headers["Range"][6:-1])
+                return web.Response(body=OUTPUT[start:], status=206)
+            return web.Response(body=OUTPUT)
+
+        async def bad_gateway(request):
+            return web.Response(text="<html><body><h1>502 Bad Gateway</h1></body></html>", status=502,
+                                content_type="text/html")
+
+        app = web.Application()
+        app.router.add_get("/api/v2/me/", me)
+        app.router.add_get("/api/v2/projects/", projects)
+        app.router.add_post("/api/v2/projects/", create_project)
+        app.router.add_get("/api/v2/jobs/7/stdout/", stdout)
+        app.router.add_get("/api/v2/jobs/", bad_gateway)
+        app.router.add_get("/api/v2/jobs/8/stdout/", bad_gateway)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+
+        self.client = AsyncClient(f"http://127.0.0.1:{port}", token="123")
+        await self.client.open()
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.runner.cleanup()
+
+    async def test_get_data(self):
+        data = await self.client.get_data(Project)
+
+        self.assertEqual([project.id for project in data], [10, 11, 20])
+        self.assertTrue(data[0].__internal__)
+
+        data = await self.client.get_data(Project, page_size=2, workers=2)
+        self.assertEqual([project.id for project in data], [10, 11, 20])
+
+    async def test_commit(self):
+        new_project = Project(name="New Project")
+        self.client.add(new_project)
+        await self.client.commit()
+
+        self.assertEqual(self.posted[0]["name"], "New Project")
+        self.assertEqual(new_project.id, 99)
+        self.assertEqual(len(self.client._write_back), 0)
+
+    async def test_stdout(self):
+        chunks = [chunk async for chunk in self.client.stdout(Job(internal_=True, id=7), chunk_size=1024)]
+
+        self.assertEqual(b"".join(chunks), OUTPUT)
+        self.assertTrue(all(len(chunk) <= 1024 for chunk in chunks))
+
+    async def test_stdout_gives_back_rate_limit_slot(self):
+        self.client.rate_limiter = RateLimiter(max_in_flight=1)
+        chunks = self.client.stdout(Job(internal_=True, id=7), chunk_size=1024)
+
+        await chunks.__anext__()
+        data = await asyncio.wait_for(self.client.get_data(Project), 5)
+        await chunks.aclose()
+
+        self.assertEqual(len(data), 3)
+
+    async def test_non_json_error(self):
+        with self.assertRaises(RequestFailed) as raised:
+            await self.client.get_data(Job)
+
+        self.assertEqual(raised.exception.status_code, 502)
+        self.assertIn("502 Bad Gateway", raised.exception.detail)
+
+        with self.assertRaises(RequestFailed):
+            [chunk async for chunk in self.client.stdout(Job(internal_=True, id=8))]
+
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+@unittest.skipIf(AsyncTestCase is unittest.TestCase, "Python 3.8 or newer is needed to run asyncio tests")
+class TestAsyncClientFeatures(AsyncTestCase):
+    """The AsyncClient counterparts of the blocking client tests, answered by the same fakes"""
+
+    async def test_count_and_exists(self):
+        client = get_async_client()
+        get = Mock(return_value=mock_page([{"id": 1}], count=42))
+        client._request = async_request(get=get)
+
+        self.assertEqual(await client.count(Job, {"status": "pending"}), 42)
+        self.assertEqual(get.call_args[1]["params"], {"status": "pending", "page_size": 1})
+
+        self.assertTrue(await client.exists(Job, {"status": "pending"}, ttl=30))
+        self.assertTrue(await client.exists(Job, {"status": "pending"}, ttl=30))
+        self.assertEqual(get.call_count, 2)
+
+    async def test_prefetch(self):
+        client = get_async_client()
+        models = [Project(internal_=True, id=1, last_job=30), JobTemplate(internal_=True, id=2, last_job=40)]
+
+        def get(url, params=None, **kwargs):
+            if url.endswith("/project_updates/"):
+                return mock_page([{"id": 30, "status": "successful"}])
+            if url.endswith("/jobs/"):
+                return mock_page([{"id": 40, "status": "failed"}])
+            raise AssertionError(url)
+
+        client._request = async_request(get=get)
+        await client.prefetch(models, ["last_job"])
+
+        self.assertIsInstance(models[0].related_object("last_job"), ProjectUpdate)
+        self.assertIsInstance(models[1].related_object("last_job"), Job)
+        self.assertEqual(models[1].related_object("last_job").status, "failed")
+
+    async def test_get_stored(self):
+        store = ModelStore(":memory:")
+        store.save(Host.__endpoint__, [{"id": 1, "name": "a", "modified": "2021-03-01T00:00:00Z"}])
+        client = get_async_client(store=store)
+        get = Mock(return_value=mock_page([{"id": 2, "name": "b", "modified": "2021-03-02T00:00:00Z"}]))
+        client._request = async_request(get=get)
+
+        hosts = await client.get_stored(Host)
+
+        self.assertEqual(get.call_args[1]["params"], {"modified__gte": "2021-03-01T00:00:00Z", "order_by": "modified"})
+        self.assertEqual([host.name for host in hosts], ["a", "b"])
+        self.assertEqual(store.ids(Host.__endpoint__), {1, 2})
+
+    async def test_sync(self):
+        client = get_async_client()
+        server = FakeHosts([
+            {"id": 1, "name": "a", "modified": "2021-03-01T00:00:00Z"},
+            {"id": 2, "name": "b", "modified": "2021-03-02T00:00:00Z"}
+        ])
+        client._request = async_request(get=server)
+
+        first = await client.sync(Host)
+        self.assertEqual(first.added, {1, 2})
+
+        server.hosts[0] = {"id": 1, "name": "a2", "modified": "2021-03-03T00:00:00Z"}
+        del server.hosts[1]
+        second = await client.sync(Host, since=first.cursor)
+
+        self.assertEqual(second.changed, {1})
+        self.assertEqual(second.removed, {2})
+        self.assertEqual([host.name for host in second.models], ["a2"])
+        self.assertEqual(second.cursor.ids, {1})
+        self.assertEqual(server.requests[-3]["modified__gte"], "2021-03-02T00:00:00Z")
+
+    async def test_stream_events(self):
+        client = get_async_client()
+        job = Job(internal_=True, id=7)
+        server = FakeJob([[{"id": 1, "counter": 1}, {"id": 2, "counter": 2}], [], [{"id": 3, "counter": 3}]])
+        client._request = async_request(get=server)
+
+        events = [event async for event in client.stream_events(job, min_interval=0.01, max_interval=0.02)]
+
+        self.assertTrue(all(isinstance(event, JobEvent) for event in events))
+        self.assertEqual([event.counter for event in events], [1, 2, 3])
+        self.assertEqual([params["counter__gt"] for params in server.event_params], [0, 2, 2])
+        self.assertTrue(job.event_processing_finished)
+
+    async def test_wait(self):
+        client = get_async_client()
+        jobs = [Job(internal_=True, id=1), ProjectUpdate(internal_=True, id=2)]
+        server = FakeUnifiedJobs({1: 2, 2: 1})
+        client._request = async_request(get=server)
+
+        finished = [job async for job in client.wait(jobs, min_interval=0.01)]
+
+        self.assertEqual([job.id for job in finished], [2, 1])
+        self.assertEqual([params["id__in"] for _, params in server.requests], ["1,2", "1"])
+        self.assertTrue(server.requests[0][0].endswith("/api/v2/unified_jobs/"))
+
+        client._request = async_request(get=FakeUnifiedJobs({3: 100}))
+
+        with self.assertRaises(WaitTimeout):
+            [job async for job in client.wait([Job(internal_=True, id=3)], timeout=0)]
+
+    async def test_launch_many(self):
+        client = get_async_client()
+        awx = FakeLaunches()
+        client._request = async_request(get=awx.get, post=awx.post)
+
+        report = await client.launch_many(JobTemplate(internal_=True, id=7), [
+            {"limit": "site1", "extra_vars": {"version": "1.2"}},
+            {"limit": "site2"},
+            {"limit": "broken", "extra_vars": {"version": "1.2"}}
+        ], concurrency=2)
+
+        self.assertEqual(len(awx.posted), 2)
+        self.assertEqual([result.ok for result in report], [True, False, False])
+        self.assertIsInstance(report.jobs[0], Job)
+        self.assertIsInstance(report[1].error, ValueNotAllowed)
+        self.assertIsInstance(report[2].error, RequestFailed)
+
+    async def test_adhoc_fanout(self):
+        client = get_async_client()
+        awx = FakeAdHocCommands()
+        client._request = async_request(get=awx.get, post=awx.post)
+
+        result = await client.adhoc_fanout("ping", "", Inventory(internal_=True, id=3), shard_size=2, credential=4)
+
+        self.assertEqual(sorted(command["limit"] for command in awx.commands.values()), ["web1,web2", "web3,db1"])
+        self.assertEqual(sorted(result.with_status("ok")), ["web1", "web2", "web3"])
+        self.assertEqual(result.with_status("unreachable"), ["db1"])
+        self.assertEqual(result["web1"].result, {"ping": "pong"})
+        self.assertIsInstance(result["db2"].error, RequestFailed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,8 @@ from requests import Session
 
 from tests.patching.api import get_api_client, load_model
 
+from pyawx import Client
+from pyawx.exceptions import UnauthorizedAccess
 from pyawx.models.projects import Project
 
 
@@ -29,9 +31,12 @@ class TestApi(unittest.TestCase):
             self.assertIsInstance(project, Project)
             self.assertTrue(project.__internal__)
 
-        with patch.object(Session, "put") as mock_put:
-            mock_put.return_value = Mock(
-                status_code=200
+        with patch.object(Session, "patch") as mock_patch:
+            mock_patch.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value=dict(mock_model, name="New Name", modified="2021-03-01T00:00:00Z")
+                )
             )
 
             project.name = "New Name"
@@ -40,6 +45,8 @@ class TestApi(unittest.TestCase):
             api.add(project)
             api.commit()
 
+            self.assertEqual(mock_patch.call_args[1]["json"], {"name": "New Name"})
+            self.assertEqual(project.modified, "2021-03-01T00:00:00Z")
             self.assertFalse(project.is_changed)
             self.assertEqual(len(api._write_back), 0)
 
@@ -61,6 +68,214 @@ class TestApi(unittest.TestCase):
             self.assertTrue(new_project.is_deleted)
             api.commit()
 
+    def test_get_data_pagination(self):
+        api = get_api_client()
+        mock_model = load_model(Project)
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.side_effect = [
+                Mock(
+                    status_code=200,
+                    json=Mock(
+                        return_value={
+                            "count": 3,
+                            "next": "/api/v2/projects/?page=2&page_size=2",
+                            "results": [mock_model, mock_model]
+                        }
+                    )
+                ),
+                Mock(
+                    status_code=200,
+                    json=Mock(
+                        return_value={
+                            "count": 3,
+                            "next": None,
+                            "results": [mock_model]
+                        }
+                    )
+                )
+            ]
+
+            data = api.get_data(Project, page_size=2)
+
+            self.assertEqual(len(data), 3)
+            self.assertEqual(mock_get.call_count, 2)
+            self.assertEqual(mock_get.call_args_list[0][1]["params"], {"page_size": 2})
+            self.assertEqual(mock_get.call_args_list[1][0][0], "https:///api/v2/projects/?page=2&page_size=2")
+
+    def test_iter_data_is_lazy(self):
+        api = get_api_client()
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "next": "/api/v2/projects/?page=2",
+                        "results": [load_model(Project)]
+                    }
+                )
+            )
+
+            projects = api.iter_data(Project)
+            self.assertEqual(mock_get.call_count, 0)
+
+            self.assertIsInstance(next(projects), Project)
+            self.assertEqual(mock_get.call_count, 1)
+
+    def test_get_data_parallel_pages(self):
+        api = get_api_client()
+        mock_model = load_model(Project)
+
+        def page(url, params=None):
+            number = (params or dict()).get("page", 1)
+            return Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "count": 5,
+                        "next": None if number == 3 else f"/api/v2/projects/?page={number + 1}",
+                        "results": [dict(mock_model, id=number * 10 + offset) for offset in range(2 if number < 3 else 1)]
+                    }
+                )
+            )
+
+        with patch.object(Session, "get", side_effect=page) as mock_get:
+            data = api.get_data(Project, page_size=2, workers=2)
+
+            self.assertEqual([project.id for project in data], [10, 11, 20, 21, 30])
+            self.assertEqual(mock_get.call_count, 3)
+            self.assertEqual(len(api.stats.page_latency), 3)
+
+    def test_get_data_parallel_pages_clamped(self):
+        api = get_api_client()
+
+        def page(url, params=None):
+            # AWX answers with at most 200 records per page whatever page_size asks for
+            params = params or dict()
+            per_page = min(params.get("page_size", 25), 200)
+            number = params.get("page", 1)
+            ids = range((number - 1) * per_page + 1, min(number * per_page, 1000) + 1)
+
+            return Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "count": 1000,
+                        "next": None if number * per_page >= 1000 else f"/api/v2/projects/?page={number + 1}",
+                        "results": [{"id": item} for item in ids]
+                    }
+                )
+            )
+
+        with patch.object(Session, "get", side_effect=page) as mock_get:
+            data = api.get_data(Project, page_size=500, workers=4)
+
+            self.assertEqual([project.id for project in data], list(range(1, 1001)))
+            self.assertEqual(mock_get.call_count, 5)
+
+    def test_session_without_authorization(self):
+        session = Session()
+        api = Client("https://", token="abc", session=session, handshake="lazy")
+
+        self.assertIs(api._session, session)
+        self.assertEqual(session.headers["Authorization"], "Bearer abc")
+
+        with self.assertRaises(ValueError):
+            Client("https://", session=Session(), handshake="lazy")
+
+        authenticated = Session()
+        authenticated.headers["Authorization"] = "Bearer shared"
+        Client("https://", session=authenticated, handshake="lazy")
+        self.assertEqual(authenticated.headers["Authorization"], "Bearer shared")
+
+    def test_lazy_handshake(self):
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "next": None,
+                        "results": [load_model(Project)]
+                    }
+                )
+            )
+
+            api = Client("https://", token="123", handshake="lazy")
+            self.assertEqual(mock_get.call_count, 0)
+
+            api.get_data(Project)
+            api.get_data(Project)
+            self.assertEqual(mock_get.call_args_list[0][0][0], "https:///api/v2/me/")
+            self.assertEqual(mock_get.call_count, 3)
+
+            shared = api.share()
+            self.assertIs(shared._session, api._session)
+            shared.get_data(Project)
+            self.assertEqual(mock_get.call_count, 4)
+
+    def test_background_handshake_failure(self):
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(status_code=401)
+
+            api = Client("https://", token="123", handshake="background")
+
+            with self.assertRaises(UnauthorizedAccess):
+                api.get_data(Project)
+
+    def test_pool_and_timeout(self):
+        with patch.object(Session, "get") as mock_get:
+            api = Client("https://", token="123", pool_maxsize=32, pool_block=True, timeout=(3, 30), keep_alive=False)
+
+            adapter = api._session.get_adapter("https://awx.example.com")
+            self.assertEqual(adapter._pool_maxsize, 32)
+            self.assertTrue(adapter._pool_block)
+            self.assertEqual(api._session.headers["Connection"], "close")
+
+            mock_get.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "next": None,
+                        "results": []
+                    }
+                )
+            )
+            api.get_data(Project)
+            self.assertEqual(mock_get.call_args[1]["timeout"], (3, 30))
+
+    def test_identity_map(self):
+        api = get_api_client()
+        mock_model = load_model(Project)
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "next": None,
+                        "results": [mock_model]
+                    }
+                )
+            )
+
+            project = api.get_data(Project)[0]
+            project.name = "Pending Name"
+
+            mock_get.return_value.json.return_value = {
+                "next": None,
+                "results": [dict(mock_model, description="Changed on the server")]
+            }
+            again = api.get_data(Project)[0]
+
+            self.assertIs(again, project)
+            self.assertEqual(project.description, "Changed on the server")
+            self.assertEqual(project.name, "Pending Name")
+            self.assertTrue(project.is_changed)
+
+            del project, again
+            self.assertEqual(len(api._identity_map), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch, Mock
+from requests import Session
+
+from tests.patching.api import get_api_client, load_model
+
+from pyawx import Client
+from pyawx.cache import ResponseCache
+from pyawx.models.jobs import Job, JobTemplate
+from pyawx.models.projects import Project
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_conditional_get(self):
+        api = get_api_client()
+        api.response_cache = ResponseCache()
+
+        page = {"count": 1, "next": None, "results": [load_model(Project)]}
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                headers={"ETag": '"abc"', "Last-Modified": "Mon, 01 Mar 2021 00:00:00 GMT"},
+                json=Mock(return_value=page)
+            )
+            first = api.get_data(Project)
+
+            mock_get.return_value = Mock(status_code=304, headers={}, json=Mock(side_effect=ValueError))
+            second = api.get_data(Project)
+
+            self.assertEqual(mock_get.call_count, 2)
+            self.assertEqual(
+                mock_get.call_args[1]["headers"],
+                {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Mar 2021 00:00:00 GMT"}
+            )
+            self.assertEqual(second[0].id, first[0].id)
+            self.assertEqual(api.stats.not_modified, 1)
+
+    def test_model_ttl_and_lru(self):
+        cache = ResponseCache(maxsize=2, model_ttl={JobTemplate: 60})
+
+        self.assertEqual(cache.ttl_for("https://awx/api/v2/job_templates/"), 60)
+        self.assertEqual(cache.ttl_for("https://awx/api/v2/job_templates/5/"), 60)
+        self.assertEqual(cache.ttl_for("https://awx/api/v2/jobs/"), 0)
+        self.assertEqual(cache.ttl_for("https://awx/api/v2/job_templates/5/launch/"), 0)
+
+        cache.store("https://awx/api/v2/job_templates/", None, None, None, {"results": []})
+        cache.store("https://awx/api/v2/jobs/", None, None, None, {"results": []})
+        self.assertEqual(len(cache), 1)
+        self.assertTrue(cache.get("https://awx/api/v2/job_templates/").fresh)
+
+        cache.store("https://awx/api/v2/job_templates/1/", None, '"1"', None, {})
+        cache.store("https://awx/api/v2/job_templates/2/", None, '"2"', None, {})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("https://awx/api/v2/job_templates/"))
+
+    def test_fresh_response_skips_request(self):
+        api = get_api_client()
+        api.response_cache = ResponseCache(model_ttl={Project: 60})
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                headers={},
+                json=Mock(return_value={"count": 1, "next": None, "results": [load_model(Project)]})
+            )
+            api.get_data(Project)
+            api.get_data(Project)
+
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(api.stats.cache_hits, 1)
+
+    def test_responses_kept_per_credential(self):
+        cache = ResponseCache(model_ttl={Project: 60})
+        api = get_api_client()
+        api.response_cache = cache
+
+        with patch.object(Session, "get"):
+            other = Client("https://", token="456", response_cache=cache)
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                headers={},
+                json=Mock(return_value={"count": 1, "next": None, "results": [load_model(Project)]})
+            )
+            api.get_data(Project)
+            api.share().get_data(Project)
+            self.assertEqual(mock_get.call_count, 1)
+
+            other.get_data(Project)
+            self.assertEqual(mock_get.call_count, 2)
+
+    def test_polling_ignores_ttl(self):
+        api = get_api_client()
+        api.response_cache = ResponseCache(model_ttl={Job: 60})
+        job = Job(internal_=True, id=7)
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                headers={},
+                json=Mock(return_value={"id": 7, "status": "running"})
+            )
+            api.refresh(job)
+
+            mock_get.return_value.json.return_value = {"id": 7, "status": "successful"}
+            api.refresh(job)
+
+            self.assertEqual(mock_get.call_count, 2)
+            self.assertEqual(job.status, "successful")
+
+
+if __name__ == "__main__":
+    unittest.main()
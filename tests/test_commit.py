@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import patch, Mock
+from requests import Session
+
+from tests.patching.api import get_api_client
+
+from pyawx.commit import plan_commit
+from pyawx.exceptions import RequestFailed, DependencyFailed
+from pyawx.models.inventories import Inventory, Host
+from pyawx.models.jobs import JobTemplate
+
+
+class TestCommit(unittest.TestCase):
+    def test_plan_commit_orders_dependencies(self):
+        inventory = Inventory(name="Inventory")
+        hosts = [Host(name=f"host{number}", inventory=inventory) for number in range(3)]
+
+        waves = plan_commit(hosts + [inventory])
+
+        self.assertEqual(waves, [[inventory], hosts])
+
+    def test_commit_sends_dependency_id(self):
+        api = get_api_client()
+        created = iter(range(1, 10))
+
+        def post(url, json=None):
+            return Mock(status_code=201, json=Mock(return_value=dict(json, id=next(created))))
+
+        with patch.object(Session, "post", side_effect=post) as mock_post:
+            inventory = Inventory(name="Inventory")
+            host = Host(name="host", inventory=inventory)
+
+            api.add_all([host, inventory])
+            report = api.commit(workers=4)
+
+            self.assertTrue(report.ok)
+            self.assertEqual([result.model for result in report], [host, inventory])
+            self.assertEqual(mock_post.call_args_list[0][1]["json"]["name"], "Inventory")
+            self.assertEqual(mock_post.call_args_list[1][1]["json"]["inventory"], inventory.id)
+
+    def test_commit_creates_model_changed_after_construction(self):
+        api = get_api_client()
+
+        def post(url, json=None):
+            return Mock(status_code=201, json=Mock(return_value=dict(json, id=7)))
+
+        with patch.object(Session, "post", side_effect=post) as mock_post, patch.object(Session, "patch") as mock_patch:
+            template = JobTemplate(name="Deploy")
+            template.description = "Deploys the web tier"
+
+            api.add(template)
+            report = api.commit()
+
+            self.assertTrue(report.ok)
+            self.assertEqual(report[0].action, "create")
+            self.assertEqual(mock_post.call_args[0][0], "https:///api/v2/job_templates/")
+            self.assertEqual(mock_post.call_args[1]["json"], {"name": "Deploy", "description": "Deploys the web tier"})
+            self.assertEqual(mock_patch.call_count, 0)
+            self.assertEqual(template.id, 7)
+            self.assertFalse(template.is_changed)
+
+    def test_commit_reports_failures(self):
+        api = get_api_client()
+
+        with patch.object(Session, "post") as mock_post:
+            mock_post.return_value = Mock(
+                status_code=400,
+                json=Mock(
+                    return_value={
+                        "detail": "Bad request"
+                    }
+                )
+            )
+
+            inventory = Inventory(name="Inventory")
+            host = Host(name="host", inventory=inventory)
+
+            api.add_all([inventory, host])
+            report = api.commit()
+
+            self.assertFalse(report.ok)
+            self.assertIsInstance(report[0].error, RequestFailed)
+            self.assertEqual(report[0].error.status_code, 400)
+            self.assertIsInstance(report[1].error, DependencyFailed)
+            self.assertEqual(mock_post.call_count, 1)
+            self.assertEqual(len(api._write_back), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, mock_response, FakeJob
+
+from pyawx.models.adhoc import AdHocCommand, AdHocCommandEvent
+from pyawx.models.jobs import Job, JobEvent
+from pyawx.models.projects import Project
+from pyawx.polling import PollInterval
+
+
+class TestStreamEvents(unittest.TestCase):
+    def test_stream_until_processing_finished(self):
+        api = get_api_client()
+        job = Job(internal_=True, id=7)
+        server = FakeJob([
+            [{"id": 1, "counter": 1}, {"id": 2, "counter": 2}],
+            [],
+            [{"id": 3, "counter": 3}]
+        ])
+
+        with patch.object(Session, "get", side_effect=server), patch("pyawx.api.sleep") as mock_sleep:
+            events = list(api.stream_events(job, min_interval=1, max_interval=3))
+
+        self.assertTrue(all(isinstance(event, JobEvent) for event in events))
+        self.assertEqual([event.counter for event in events], [1, 2, 3])
+        self.assertEqual([params["counter__gt"] for params in server.event_params], [0, 2, 2])
+        self.assertEqual(server.event_params[0]["order_by"], "counter")
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [1, 2])
+        self.assertTrue(job.event_processing_finished)
+
+    def test_adhoc_command_events(self):
+        api = get_api_client()
+        command = AdHocCommand(internal_=True, id=4)
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.side_effect = [
+                mock_response({"id": 4, "event_processing_finished": True}),
+                mock_response({"count": 1, "next": None, "results": [{"id": 9, "counter": 6}]})
+            ]
+            events = list(api.stream_events(command, since_counter=5))
+
+            self.assertTrue(mock_get.call_args[0][0].endswith("/api/v2/ad_hoc_commands/4/events/"))
+
+        self.assertIsInstance(events[0], AdHocCommandEvent)
+
+    def test_not_streamable(self):
+        with self.assertRaises(ValueError):
+            next(get_api_client().stream_events(Project(internal_=True, id=1)))
+
+        with self.assertRaises(ValueError):
+            next(get_api_client().stream_events(Job()))
+
+    def test_poll_interval(self):
+        interval = PollInterval(0.5, 2)
+
+        self.assertEqual([interval.next(False) for _ in range(3)], [1, 2, 2])
+        self.assertEqual(interval.next(True), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
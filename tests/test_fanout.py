@@ -0,0 +1,44 @@
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, FakeAdHocCommands
+
+from pyawx.exceptions import RequestFailed
+from pyawx.fanout import shard_hosts
+from pyawx.models.inventories import Inventory
+
+HOSTS = FakeAdHocCommands.hosts
+
+
+class TestAdhocFanout(unittest.TestCase):
+    def test_fanout(self):
+        api = get_api_client()
+        awx = FakeAdHocCommands()
+
+        with patch.object(Session, "get", side_effect=awx.get), patch.object(Session, "post", side_effect=awx.post):
+            result = api.adhoc_fanout("ping", "", Inventory(internal_=True, id=3), shard_size=2, credential=4,
+                                      become_enabled=True)
+
+        self.assertEqual(sorted(command["limit"] for command in awx.commands.values()), ["web1,web2", "web3,db1"])
+        self.assertTrue(all(command["credential"] == 4 for command in awx.commands.values()))
+        self.assertTrue(all(command["become_enabled"] for command in awx.commands.values()))
+        self.assertEqual(len(result.commands), 2)
+
+        self.assertEqual(sorted(result.with_status("ok")), ["web1", "web2", "web3"])
+        self.assertEqual(result.with_status("unreachable"), ["db1"])
+        self.assertEqual(sorted(result.failed), ["db1", "db2"])
+        self.assertEqual(result["web1"].result, {"ping": "pong"})
+        self.assertEqual(result["db1"].command.limit, "web3,db1")
+        self.assertIsNone(result["db2"].status)
+        self.assertIsInstance(result["db2"].error, RequestFailed)
+
+    def test_shard_hosts(self):
+        self.assertEqual(shard_hosts(HOSTS, 2), [["web1", "web2"], ["web3", "db1"], ["db2"]])
+
+        with self.assertRaises(ValueError):
+            shard_hosts(HOSTS, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
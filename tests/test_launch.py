@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, FakeLaunches
+
+from pyawx.exceptions import ValueNotAllowed, RequestFailed
+from pyawx.launch import validate_launch
+from pyawx.models.inventories import Inventory
+from pyawx.models.jobs import Job, JobTemplate
+from pyawx.models.projects import Project
+
+class TestLaunchMany(unittest.TestCase):
+    def test_launch_many(self):
+        api = get_api_client()
+        template = JobTemplate(internal_=True, id=7)
+        awx = FakeLaunches()
+
+        payloads = [
+            {"limit": "site1", "extra_vars": {"version": "1.2"}},
+            {"limit": "site2", "extra_vars": {"version": "1.2"}, "inventory": Inventory(internal_=True, id=3)},
+            {"limit": "site3"},
+            {"limit": "site4", "extra_vars": {"version": "1.2"}, "job_tags": "deploy"},
+            {"limit": "broken", "extra_vars": {"version": "1.2"}}
+        ]
+
+        with patch.object(Session, "get", side_effect=awx.get) as mock_get, \
+                patch.object(Session, "post", side_effect=awx.post):
+            report = api.launch_many(template, payloads, concurrency=3)
+
+            mock_get.assert_called_once()
+            self.assertTrue(mock_get.call_args[0][0].endswith("/api/v2/job_templates/7/launch/"))
+
+        self.assertEqual(len(awx.posted), 3)
+        self.assertIn(3, [body.get("inventory") for body in awx.posted])
+        self.assertFalse(report.ok)
+        self.assertEqual([result.ok for result in report], [True, True, False, False, False])
+        self.assertTrue(all(isinstance(job, Job) for job in report.jobs))
+        self.assertEqual(report[0].job.status, "pending")
+        self.assertIsInstance(report[2].error, ValueNotAllowed)
+        self.assertIsInstance(report[3].error, ValueNotAllowed)
+        self.assertIsInstance(report[4].error, RequestFailed)
+
+    def test_validate_launch(self):
+        validate_launch(FakeLaunches.requirements, {"extra_vars": "version: 1.2"})
+        validate_launch({"ask_variables_on_launch": True}, {"extra_vars": {"a": 1}})
+
+        with self.assertRaises(ValueNotAllowed):
+            validate_launch({}, {"extra_vars": {"a": 1}})
+
+        with self.assertRaises(ValueNotAllowed):
+            validate_launch(FakeLaunches.requirements, {"nonsense": 1, "extra_vars": {"version": 1}})
+
+        with self.assertRaises(ValueNotAllowed):
+            validate_launch({"inventory_needed_to_start": True}, {})
+
+    def test_not_launchable(self):
+        with self.assertRaises(ValueError):
+            get_api_client().launch_many(Project(internal_=True, id=1), [{}])
+
+        with self.assertRaises(ValueError):
+            get_api_client().launch_many(JobTemplate(), [{}])
+
+
+if __name__ == "__main__":
+    unittest.main()
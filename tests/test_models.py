@@ -0,0 +1,56 @@
+import unittest
+
+from tests.patching.api import get_api_client, load_model
+
+from pyawx.models.credentials import Credential
+from pyawx.models.jobs import JobTemplate
+from pyawx.models.projects import Project
+
+
+class TestModels(unittest.TestCase):
+    def test_internal_model_takes_ownership(self):
+        mock_model = load_model(Project)
+        project = Project(internal_=True, **mock_model)
+
+        self.assertTrue(project.__internal__)
+        self.assertIs(project.related, mock_model["related"])
+        self.assertNotIn("internal_", project.export())
+
+    def test_user_model_is_copied(self):
+        related = {"teams": "/api/v2/projects/10/teams/"}
+        project = Project(name="Project", related=related)
+
+        self.assertFalse(project.__internal__)
+        self.assertIsNot(project.related, related)
+
+    def test_nested_loaded_models_are_not_copied(self):
+        credential = get_api_client()._load(Credential, {"id": 4, "name": "ssh"})
+        template = JobTemplate(name="Deploy", credentials=[credential], extra_vars={"version": "1.2"})
+
+        self.assertIs(template._data["credentials"][0], credential)
+        self.assertIsNot(template._data["credentials"], [credential])
+
+    def test_export_does_not_change_model(self):
+        project = Project(internal_=True, **load_model(Project))
+
+        exported = project.export()
+        exported["name"] = "Changed"
+        del exported["related"]
+
+        self.assertNotEqual(project.name, "Changed")
+        self.assertIsNotNone(project.related)
+
+    def test_models_are_slotted(self):
+        project = Project(internal_=True, **load_model(Project))
+
+        self.assertFalse(hasattr(project, "__dict__"))
+        self.assertIsNone(project._changes)
+        self.assertFalse(project.is_changed)
+
+        project.name = "New Name"
+        self.assertTrue(project.is_changed)
+        self.assertEqual(project.__export_changes__(), {"name": "New Name"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, mock_page
+
+from pyawx.models.jobs import Job, JobTemplate
+from pyawx.models.inventories import Inventory
+from pyawx.models.projects import Project, ProjectUpdate
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_prefetch_batches_related_ids(self):
+        api = get_api_client()
+
+        jobs = [{"id": number, "job_template": 7 + number % 2, "inventory": 3} for number in range(1, 6)]
+        jobs.append({"id": 6, "job_template": None, "inventory": 3})
+
+        def get(url, params=None, **kwargs):
+            if url.endswith("/jobs/"):
+                return mock_page(jobs)
+            if url.endswith("/job_templates/"):
+                return mock_page([{"id": int(item), "name": f"jt{item}"} for item in params["id__in"].split(",")])
+            if url.endswith("/inventories/"):
+                return mock_page([{"id": 3, "name": "prod"}])
+            raise AssertionError(url)
+
+        with patch.object(Session, "get", side_effect=get) as mock_get:
+            result = api.get_data(Job, prefetch=["job_template", "inventory"])
+
+            self.assertEqual(mock_get.call_count, 3)
+
+        self.assertIsInstance(result[0].related_object("job_template"), JobTemplate)
+        self.assertEqual(result[0].related_object("job_template").name, "jt8")
+        self.assertEqual(result[1].related_object("job_template").name, "jt7")
+        self.assertIsInstance(result[0].related_object("inventory"), Inventory)
+        self.assertIs(result[0].related_object("inventory"), result[4].related_object("inventory"))
+        self.assertIsNone(result[5].related_object("job_template"))
+
+    def test_prefetch_batch_size(self):
+        api = get_api_client()
+        jobs = [Job(internal_=True, id=number, inventory=number) for number in range(1, 6)]
+
+        with patch.object(Session, "get", return_value=mock_page([])) as mock_get:
+            api.prefetch(jobs, ["inventory"], batch_size=2)
+
+            batches = sorted(call[1]["params"]["id__in"] for call in mock_get.call_args_list)
+            self.assertEqual(batches, ["1,2", "3,4", "5"])
+
+    def test_prefetch_last_job_by_owner(self):
+        api = get_api_client()
+        models = [Project(internal_=True, id=1, last_job=30), JobTemplate(internal_=True, id=2, last_job=40)]
+
+        def get(url, params=None, **kwargs):
+            if url.endswith("/project_updates/"):
+                return mock_page([{"id": 30, "status": "successful"}])
+            if url.endswith("/jobs/"):
+                return mock_page([{"id": 40, "status": "failed"}])
+            raise AssertionError(url)
+
+        with patch.object(Session, "get", side_effect=get) as mock_get:
+            api.prefetch(models, ["last_job"])
+
+            self.assertEqual(mock_get.call_count, 2)
+
+        self.assertIsInstance(models[0].related_object("last_job"), ProjectUpdate)
+        self.assertEqual(models[0].related_object("last_job").status, "successful")
+        self.assertIsInstance(models[1].related_object("last_job"), Job)
+        self.assertEqual(models[1].related_object("last_job").status, "failed")
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            get_api_client().prefetch([], ["nonsense"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch, Mock
+from requests import Session
+
+from tests.patching.api import get_api_client
+
+from pyawx.models.jobs import Job
+from pyawx.models.inventories import Inventory
+from pyawx.query import compile_filters
+
+
+class TestQuery(unittest.TestCase):
+    def test_compile_filters(self):
+        self.assertEqual(
+            compile_filters(
+                status="failed",
+                failed=True,
+                finished__gt=datetime(2021, 3, 1, 12, 30),
+                id__in=[1, 2, 3],
+                inventory=Inventory(id=5),
+                project=None
+            ),
+            {
+                "status": "failed",
+                "failed": "true",
+                "finished__gt": "2021-03-01T12:30:00",
+                "id__in": "1,2,3",
+                "inventory": 5,
+                "project__isnull": "true"
+            }
+        )
+
+    def test_query_params(self):
+        api = get_api_client()
+
+        query = api.query(Job).filter(status="failed").exclude(launch_type="scheduled").order_by("-id", "name")
+
+        self.assertEqual(
+            query.params,
+            {
+                "status": "failed",
+                "not__launch_type": "scheduled",
+                "order_by": "-id,name"
+            }
+        )
+        self.assertEqual(api.query(Job).search("deploy").params, {"search": "deploy"})
+
+    def test_query_all(self):
+        api = get_api_client()
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "count": 1,
+                        "next": None,
+                        "results": [{"id": 1, "status": "failed"}]
+                    }
+                )
+            )
+
+            jobs = api.query(Job).filter(status="failed").order_by("-id").page_size(50).all()
+
+            self.assertEqual(jobs[0].id, 1)
+            self.assertEqual(
+                mock_get.call_args[1]["params"],
+                {"status": "failed", "order_by": "-id", "page_size": 50}
+            )
+
+            api.query(Job).filter(status="failed").first()
+            self.assertEqual(mock_get.call_args[1]["params"], {"status": "failed", "page_size": 1})
+
+    def test_count_and_exists(self):
+        api = get_api_client()
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "count": 42,
+                        "next": "/api/v2/jobs/?page=2&page_size=1",
+                        "results": [{"id": 1}]
+                    }
+                )
+            )
+
+            self.assertEqual(api.count(Job, {"status": "pending"}), 42)
+            self.assertEqual(mock_get.call_args[1]["params"], {"status": "pending", "page_size": 1})
+
+            self.assertTrue(api.exists(Job, {"status": "pending"}, ttl=30))
+            self.assertTrue(api.query(Job).filter(status="pending").exists(ttl=30))
+            self.assertEqual(mock_get.call_count, 2)
+
+            mock_get.return_value.json.return_value = {"count": 0, "next": None, "results": []}
+            self.assertFalse(api.exists(Job, {"status": "new"}))
+
+            # Without a ttl the cached answer is not used
+            self.assertFalse(api.exists(Job, {"status": "pending"}))
+            self.assertEqual(mock_get.call_count, 4)
+
+            # A field named ttl is a filter like any other
+            api.count(Job, {"ttl": 5})
+            self.assertEqual(mock_get.call_args[1]["params"], {"ttl": 5, "page_size": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
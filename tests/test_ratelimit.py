@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+from threading import Thread
+from time import monotonic
+
+from pyawx.ratelimit import RateLimiter
+
+LAUNCH = "https://awx.example.com/api/v2/job_templates/7/launch/"
+JOBS = "https://awx.example.com/api/v2/jobs/"
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_rate(self):
+        limiter = RateLimiter(rate=50, burst=1)
+
+        started = monotonic()
+        for _ in range(5):
+            limiter.release(limiter.acquire(JOBS))
+
+        self.assertGreaterEqual(monotonic() - started, 0.07)
+
+    def test_max_in_flight(self):
+        limiter = RateLimiter(max_in_flight=2)
+        tokens = [limiter.acquire(JOBS), limiter.acquire(JOBS)]
+        acquired = list()
+
+        waiting = Thread(target=lambda: acquired.append(limiter.acquire(JOBS)))
+        waiting.start()
+        waiting.join(0.1)
+        self.assertEqual(acquired, [])
+
+        limiter.release(tokens.pop())
+        waiting.join(1)
+        self.assertEqual(len(acquired), 1)
+
+    def test_per_endpoint(self):
+        limiter = RateLimiter(per_endpoint={"/api/v2/job_templates/*/launch": {"max_in_flight": 1}})
+
+        token = limiter.acquire(LAUNCH)
+        self.assertEqual(len(token), 1)
+        self.assertEqual(limiter.acquire(JOBS), [])
+
+        async def launch():
+            return await limiter.acquire_async(LAUNCH)
+
+        async def both():
+            waiting = asyncio.ensure_future(launch())
+            await asyncio.sleep(0.1)
+            self.assertFalse(waiting.done())
+
+            limiter.release(token)
+            return await asyncio.wait_for(waiting, 1)
+
+        # asyncio.run is new in Python 3.7
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(len(loop.run_until_complete(both())), 1)
+        finally:
+            loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
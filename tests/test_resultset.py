@@ -0,0 +1,67 @@
+import unittest
+from array import array
+from unittest.mock import patch, Mock
+from requests import Session
+
+from tests.patching.api import get_api_client
+
+from pyawx.models.jobs import Job
+from pyawx.resultset import ResultSet
+
+JOBS = [
+    {"id": 1, "status": "successful", "elapsed": 10.5, "failed": False, "started": "2021-03-01T00:00:00Z"},
+    {"id": 2, "status": "failed", "elapsed": 3, "failed": True, "started": "2021-03-01T00:01:00Z"},
+    {"id": 3, "status": "successful", "elapsed": 7.25, "failed": False, "started": None}
+]
+
+
+class TestResultSet(unittest.TestCase):
+    def test_columns(self):
+        result_set = ResultSet.from_rows(Job, JOBS)
+
+        self.assertEqual(len(result_set), 3)
+        self.assertEqual(result_set["id"], array("q", [1, 2, 3]))
+        self.assertEqual(result_set["elapsed"], array("d", [10.5, 3.0, 7.25]))
+        self.assertEqual(result_set["status"], ["successful", "failed", "successful"])
+        self.assertIs(result_set["status"][0], result_set["status"][2])
+        self.assertEqual(result_set["started"][2], None)
+
+    def test_filter_and_group_by(self):
+        result_set = ResultSet.from_rows(Job, JOBS, fields=["id", "status", "elapsed"])
+
+        self.assertEqual(list(result_set.filter(status="successful")["id"]), [1, 3])
+        self.assertEqual(list(result_set.filter(lambda row: row["elapsed"] > 5)["id"]), [1, 3])
+
+        groups = result_set.group_by("status")
+        self.assertEqual(sum(groups["successful"]["elapsed"]), 17.75)
+        self.assertEqual(len(groups["failed"]), 1)
+
+        jobs = groups["failed"].to_models()
+        self.assertIsInstance(jobs[0], Job)
+        self.assertEqual(jobs[0].id, 2)
+        self.assertIsNone(jobs[0].name)
+
+    def test_get_data_as_columns(self):
+        api = get_api_client()
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.return_value = Mock(
+                status_code=200,
+                json=Mock(
+                    return_value={
+                        "count": 3,
+                        "next": None,
+                        "results": JOBS
+                    }
+                )
+            )
+
+            result_set = api.get_data(Job, as_columns=True, fields=["id", "status"])
+
+            self.assertIsInstance(result_set, ResultSet)
+            self.assertEqual(result_set.fields, ["id", "status"])
+            self.assertEqual(len(result_set), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch, Mock
+from requests import Session, ConnectionError
+
+from tests.patching.api import get_api_client
+
+from pyawx.exceptions import RequestFailed
+from pyawx.models.projects import Project
+from pyawx.retry import RetryPolicy
+
+
+class TestRetry(unittest.TestCase):
+    def test_policy(self):
+        policy = RetryPolicy(total=2, backoff_factor=1, jitter=False)
+
+        self.assertTrue(policy.should_retry("get", 0, status_code=503))
+        self.assertTrue(policy.should_retry("delete", 1, error=ConnectionError()))
+        self.assertFalse(policy.should_retry("get", 2, status_code=503))
+        self.assertFalse(policy.should_retry("get", 0, status_code=400))
+        self.assertFalse(policy.should_retry("post", 0, status_code=503))
+        self.assertTrue(RetryPolicy(retry_post=True).should_retry("post", 0, status_code=503))
+
+        self.assertEqual(policy.delay(0), 1)
+        self.assertEqual(policy.delay(3), 8)
+        self.assertEqual(policy.delay(0, "7"), 7)
+        self.assertEqual(policy.delay(0, "Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+        self.assertLessEqual(RetryPolicy(backoff_factor=1).delay(2), 4)
+
+    @patch("pyawx.api.sleep")
+    def test_client_retries(self, mock_sleep):
+        api = get_api_client()
+        api.retry = RetryPolicy(total=3)
+
+        unavailable = Mock(status_code=503, headers={"Retry-After": "2"})
+        ok = Mock(
+            status_code=200,
+            json=Mock(
+                return_value={
+                    "next": None,
+                    "results": [{"id": 1}]
+                }
+            )
+        )
+
+        with patch.object(Session, "get", side_effect=[ConnectionError(), unavailable, ok]):
+            data = api.get_data(Project)
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(api.stats.retries, 2)
+        self.assertEqual(mock_sleep.call_args_list[1][0][0], 2)
+        unavailable.close.assert_called_once()
+
+        with patch.object(Session, "post") as mock_post:
+            mock_post.return_value = Mock(status_code=503, headers={}, json=Mock(return_value={"detail": "Down"}))
+
+            api.add(Project(name="New Project"))
+            report = api.commit()
+
+            self.assertIsInstance(report[0].error, RequestFailed)
+            self.assertEqual(mock_post.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import io
+import unittest
+from unittest.mock import patch, Mock
+from requests import Session
+from requests.exceptions import ChunkedEncodingError
+
+from tests.patching.api import get_api_client
+
+from pyawx.models.jobs import Job, JobTemplate
+from pyawx.models.projects import ProjectUpdate
+
+OUTPUT = b"".join(f"line {number}\n".encode() for number in range(1000))
+
+
+def stream(status_code, body, chunk_size=None, break_after=None):
+    """Streamed response, ``chunk_size`` overrides the size the client asks for"""
+    fixed_size = chunk_size
+
+    def iter_content(chunk_size=1):
+        chunk_size = fixed_size or chunk_size
+
+        for number, start in enumerate(range(0, len(body), chunk_size)):
+            if break_after is not None and number == break_after:
+                raise ChunkedEncodingError("Connection broken")
+            yield body[start:start + chunk_size]
+
+    return Mock(status_code=status_code, iter_content=iter_content)
+
+
+class TestStdout(unittest.TestCase):
+    def test_write_to_file(self):
+        api = get_api_client()
+        log_fp = io.BytesIO()
+
+        with patch.object(Session, "get", return_value=stream(200, OUTPUT)) as mock_get:
+            written = api.stdout(Job(internal_=True, id=7), file=log_fp, chunk_size=1000)
+
+            self.assertTrue(mock_get.call_args[0][0].endswith("/api/v2/jobs/7/stdout/"))
+            self.assertEqual(mock_get.call_args[1]["params"], {"format": "txt_download"})
+            self.assertTrue(mock_get.call_args[1]["stream"])
+
+        self.assertEqual(written, len(OUTPUT))
+        self.assertEqual(log_fp.getvalue(), OUTPUT)
+
+    def test_resume_with_range(self):
+        api = get_api_client()
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.side_effect = [stream(200, OUTPUT, break_after=3), stream(206, OUTPUT[3000:])]
+            output = b"".join(api.stdout(ProjectUpdate(internal_=True, id=2), fmt="ansi", chunk_size=1000))
+
+            self.assertEqual(mock_get.call_args[1]["headers"], {"Range": "bytes=3000-"})
+
+        self.assertEqual(output, OUTPUT)
+
+    def test_resume_when_range_is_ignored(self):
+        api = get_api_client()
+
+        with patch.object(Session, "get") as mock_get:
+            mock_get.side_effect = [
+                stream(200, OUTPUT, chunk_size=700, break_after=2),
+                stream(200, OUTPUT, chunk_size=1000, break_after=5),
+                stream(200, OUTPUT, chunk_size=300)
+            ]
+            output = b"".join(api.stdout(Job(internal_=True, id=7)))
+
+        self.assertEqual(output, OUTPUT)
+
+    def test_gives_up(self):
+        api = get_api_client()
+
+        with patch.object(Session, "get", side_effect=lambda *args, **kwargs: stream(200, OUTPUT, break_after=0)):
+            with self.assertRaises(ChunkedEncodingError):
+                list(api.stdout(Job(internal_=True, id=7), max_resumes=2))
+
+    def test_invalid(self):
+        api = get_api_client()
+
+        with self.assertRaises(ValueError):
+            api.stdout(JobTemplate(internal_=True, id=1))
+
+        with self.assertRaises(ValueError):
+            api.stdout(Job(internal_=True, id=1), fmt="pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
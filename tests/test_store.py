@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, mock_page
+
+from pyawx.models.inventories import Host
+from pyawx.store import ModelStore
+
+
+class TestModelStore(unittest.TestCase):
+    def test_store(self):
+        store = ModelStore(":memory:")
+        store.save("/api/v2/hosts", [
+            {"id": 2, "name": "b", "modified": "2021-03-02T00:00:00Z"},
+            {"id": 1, "name": "a", "modified": "2021-03-01T00:00:00Z"},
+            {"name": "no id"}
+        ])
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.latest("/api/v2/hosts"), "2021-03-02T00:00:00Z")
+        self.assertIsNone(store.latest("/api/v2/jobs"))
+        self.assertEqual([item["name"] for item in store.load("/api/v2/hosts")], ["a", "b"])
+
+        store.delete("/api/v2/hosts", [1])
+        self.assertEqual(store.ids("/api/v2/hosts"), {2})
+
+        store.clear()
+        self.assertEqual(len(store), 0)
+
+    def test_warm_start_only_requests_changes(self):
+        store = ModelStore(":memory:")
+
+        api = get_api_client()
+        api.store = store
+
+        with patch.object(Session, "get", return_value=mock_page([
+            {"id": 1, "name": "a", "modified": "2021-03-01T00:00:00Z"},
+            {"id": 2, "name": "b", "modified": "2021-03-02T00:00:00Z"}
+        ])) as mock_get:
+            api.get_stored(Host)
+            self.assertEqual(mock_get.call_args[1]["params"], {"order_by": "modified"})
+
+        restarted = get_api_client()
+        restarted.store = store
+
+        with patch.object(Session, "get", return_value=mock_page([
+            {"id": 2, "name": "b2", "modified": "2021-03-05T00:00:00Z"},
+            {"id": 3, "name": "c", "modified": "2021-03-06T00:00:00Z"}
+        ])) as mock_get:
+            hosts = restarted.get_stored(Host)
+
+            self.assertEqual(
+                mock_get.call_args[1]["params"],
+                {"modified__gte": "2021-03-02T00:00:00Z", "order_by": "modified"}
+            )
+
+        self.assertEqual([host.name for host in hosts], ["a", "b2", "c"])
+        self.assertEqual(store.latest(Host.__endpoint__), "2021-03-06T00:00:00Z")
+
+    def test_requires_store(self):
+        with self.assertRaises(ValueError):
+            get_api_client().get_stored(Host)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, mock_response
+
+from pyawx.models.jobs import Job
+from pyawx.models.inventories import Inventory
+from pyawx.models.projects import Project, ProjectUpdate
+from pyawx.models.summary import SummaryObject
+from pyawx.models.workflows import WorkflowJobNode
+
+JOB = {
+    "id": 12,
+    "inventory": 3,
+    "project": 5,
+    "summary_fields": {
+        "inventory": {"id": 3, "name": "prod", "description": "Production"},
+        "credentials": [{"id": 1, "name": "ssh"}, {"id": 2, "name": "vault"}],
+        "user_capabilities": {"delete": True}
+    }
+}
+
+
+class TestSummaryFields(unittest.TestCase):
+    def load_job(self, api):
+        with patch.object(Session, "get", return_value=mock_response({"count": 1, "next": None, "results": [JOB]})):
+            return api.get_data(Job)[0]
+
+    def test_embedded_values_skip_requests(self):
+        job = self.load_job(get_api_client())
+
+        with patch.object(Session, "get") as mock_get:
+            inventory = job.related_obj.inventory
+
+            self.assertIsInstance(inventory, SummaryObject)
+            self.assertEqual(inventory.name, "prod")
+            self.assertEqual(inventory.description, "Production")
+            self.assertEqual([credential.name for credential in job.related_obj.credentials], ["ssh", "vault"])
+            self.assertEqual(job.related_obj.user_capabilities, {"delete": True})
+            self.assertIsNone(job.related_obj.job_template)
+            mock_get.assert_not_called()
+
+        with self.assertRaises(AttributeError):
+            job.related_obj.nonsense
+
+        with self.assertRaises(AttributeError):
+            job.related_obj.inventory.nonsense
+
+    def test_fallback_loads_full_object_once(self):
+        job = self.load_job(get_api_client())
+
+        with patch.object(Session, "get", return_value=mock_response({"id": 3, "name": "prod", "total_hosts": 40})) as get:
+            self.assertTrue(job.related_obj.inventory.is_partial)
+            self.assertEqual(job.related_obj.inventory.total_hosts, 40)
+            self.assertEqual(job.related_obj.inventory.total_hosts, 40)
+
+            get.assert_called_once()
+            self.assertTrue(get.call_args[0][0].endswith("/api/v2/inventories/3/"))
+
+        self.assertIsInstance(job.related_obj.inventory, Inventory)
+        self.assertIs(job.related_object("inventory"), job.related_obj.inventory)
+
+    def test_not_embedded_relation(self):
+        job = self.load_job(get_api_client())
+
+        with patch.object(Session, "get", return_value=mock_response({"id": 5, "name": "playbooks"})) as get:
+            self.assertEqual(job.related_obj.project.id, 5)
+            get.assert_not_called()
+
+            self.assertEqual(job.related_obj.project.name, "playbooks")
+            get.assert_called_once()
+
+    def test_last_job_of_owner(self):
+        api = get_api_client()
+        project = api._load(Project, {"id": 5, "last_job": 30, "summary_fields": {"last_job": {"id": 30}}})
+
+        with patch.object(Session, "get", return_value=mock_response({"id": 30, "scm_revision": "abc"})) as get:
+            self.assertEqual(project.related_obj.last_job.scm_revision, "abc")
+            self.assertTrue(get.call_args[0][0].endswith("/api/v2/project_updates/30/"))
+
+        self.assertIsInstance(project.related_object("last_job"), ProjectUpdate)
+
+    def test_unified_job_narrowed_by_type(self):
+        node = WorkflowJobNode(job=30, summary_fields={"job": {"id": 30, "type": "project_update"}})
+
+        self.assertIsInstance(node.related_obj.job._partial, ProjectUpdate)
+
+    def test_without_client(self):
+        job = Job(**JOB)
+
+        self.assertEqual(job.related_obj.inventory.name, "prod")
+        self.assertIsNone(job.related_obj.inventory.total_hosts)
+
+
+if __name__ == "__main__":
+    unittest.main()
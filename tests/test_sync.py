@@ -0,0 +1,88 @@
+import json
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, FakeHosts
+
+from pyawx.models.inventories import Host
+from pyawx.models.jobs import Job
+from pyawx.store import ModelStore
+from pyawx.sync import SyncCursor
+
+
+class TestSync(unittest.TestCase):
+    def test_incremental_sync(self):
+        api = get_api_client()
+        server = FakeHosts([
+            {"id": 1, "name": "a", "modified": "2021-03-01T00:00:00Z"},
+            {"id": 2, "name": "b", "modified": "2021-03-02T00:00:00Z"},
+            {"id": 3, "name": "c", "modified": "2021-03-03T00:00:00Z"}
+        ])
+
+        with patch.object(Session, "get", side_effect=server):
+            first = api.sync(Host)
+
+            self.assertEqual(first.added, {1, 2, 3})
+            self.assertEqual([host.name for host in first.models], ["a", "b", "c"])
+            self.assertEqual(len(server.requests), 2)
+
+            cursor = SyncCursor.from_dict(json.loads(json.dumps(first.cursor.to_dict())))
+            self.assertEqual(cursor, first.cursor)
+
+            nothing = api.sync(Host, since=cursor)
+            self.assertFalse(nothing)
+            self.assertEqual(server.requests[-2]["modified__gte"], "2021-03-03T00:00:00Z")
+
+            server.hosts[1] = {"id": 2, "name": "b2", "modified": "2021-03-04T00:00:00Z"}
+            server.hosts.append({"id": 4, "name": "d", "modified": "2021-03-05T00:00:00Z"})
+            del server.hosts[0]
+            server.requests.clear()
+
+            second = api.sync(Host, since=nothing.cursor)
+
+        self.assertEqual(second.added, {4})
+        self.assertEqual(second.changed, {2})
+        self.assertEqual(second.removed, {1})
+        self.assertEqual([host.name for host in second.models], ["b2", "d"])
+        self.assertEqual(second.cursor.ids, {2, 3, 4})
+        self.assertEqual(second.cursor.modified, "2021-03-05T00:00:00Z")
+        self.assertEqual(len(server.requests), 3)
+
+    def test_records_sharing_the_cursor_timestamp(self):
+        api = get_api_client()
+        server = FakeHosts([{"id": 1, "name": "a", "modified": "2021-03-01T00:00:00Z"}])
+
+        with patch.object(Session, "get", side_effect=server):
+            first = api.sync(Host)
+
+            # Saved in the same instant as host 1, but only committed after the first sync read the hosts
+            server.hosts.append({"id": 2, "name": "b", "modified": "2021-03-01T00:00:00Z"})
+            second = api.sync(Host, since=first.cursor)
+            third = api.sync(Host, since=second.cursor)
+
+        self.assertEqual(second.added, {2})
+        self.assertEqual(second.changed, set())
+        self.assertEqual(second.cursor.boundary, {1, 2})
+        self.assertFalse(third)
+
+    def test_sync_updates_store(self):
+        api = get_api_client()
+        api.store = ModelStore(":memory:")
+        server = FakeHosts([{"id": 1, "name": "a", "modified": "2021-03-01T00:00:00Z"}])
+
+        with patch.object(Session, "get", side_effect=server):
+            cursor = api.sync(Host).cursor
+            self.assertEqual(api.store.ids(Host.__endpoint__), {1})
+
+            server.hosts.clear()
+            api.sync(Host, since=cursor)
+            self.assertEqual(api.store.ids(Host.__endpoint__), set())
+
+    def test_cursor_for_other_model(self):
+        with self.assertRaises(ValueError):
+            get_api_client().sync(Job, since=SyncCursor(Host.__endpoint__))
+
+
+if __name__ == "__main__":
+    unittest.main()
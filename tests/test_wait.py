@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import patch
+from requests import Session
+
+from tests.patching.api import get_api_client, FakeUnifiedJobs
+
+from pyawx.exceptions import WaitTimeout
+from pyawx.models.adhoc import AdHocCommand
+from pyawx.models.jobs import Job
+from pyawx.models.projects import ProjectUpdate
+from pyawx.polling import elapsed_interval, running_for
+
+
+class TestWait(unittest.TestCase):
+    def test_batched_polls(self):
+        api = get_api_client()
+        jobs = [Job(internal_=True, id=1), ProjectUpdate(internal_=True, id=2), AdHocCommand(internal_=True, id=3)]
+        server = FakeUnifiedJobs({1: 2, 2: 1, 3: 3})
+
+        with patch.object(Session, "get", side_effect=server), patch("pyawx.api.sleep") as mock_sleep:
+            finished = list(api.wait(jobs, min_interval=2))
+
+        self.assertEqual([job.id for job in finished], [2, 1, 3])
+        self.assertEqual(len(server.requests), 3)
+        self.assertTrue(server.requests[0][0].endswith("/api/v2/unified_jobs/"))
+        self.assertEqual(server.requests[0][1]["id__in"], "1,2,3")
+        self.assertEqual(server.requests[1][1]["id__in"], "1,3")
+        self.assertEqual(server.requests[2][1]["id__in"], "3")
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [2, 2])
+        self.assertTrue(all(job.status == "successful" for job in jobs))
+
+    def test_batch_size(self):
+        api = get_api_client()
+        jobs = [Job(internal_=True, id=number) for number in range(1, 6)]
+        server = FakeUnifiedJobs({number: 1 for number in range(1, 6)})
+
+        with patch.object(Session, "get", side_effect=server):
+            self.assertEqual(len(list(api.wait(jobs, batch_size=2))), 5)
+
+        self.assertEqual([params["id__in"] for _, params in server.requests], ["1,2", "3,4", "5"])
+
+    def test_timeout(self):
+        api = get_api_client()
+        job = Job(internal_=True, id=1)
+
+        with patch.object(Session, "get", side_effect=FakeUnifiedJobs({1: 100})), patch("pyawx.api.sleep"):
+            with self.assertRaises(WaitTimeout) as raised:
+                list(api.wait([job], timeout=0))
+
+        self.assertEqual(raised.exception.pending, [job])
+        self.assertEqual(job.status, "running")
+
+    def test_unsaved_job(self):
+        with self.assertRaises(ValueError):
+            list(get_api_client().wait([Job()]))
+
+    def test_elapsed_interval(self):
+        self.assertEqual(elapsed_interval([0.5], minimum=1, maximum=30), 1)
+        self.assertEqual(elapsed_interval([600, 120], minimum=1, maximum=30), 12)
+        self.assertEqual(elapsed_interval([3600], minimum=1, maximum=30), 30)
+
+    def test_running_for(self):
+        self.assertGreater(running_for(Job(internal_=True, started="2021-03-01T12:00:00.123456Z"), 5), 3600)
+        self.assertGreater(running_for(Job(internal_=True, started="2021-03-01T12:00:00+02:00"), 5), 3600)
+        self.assertEqual(running_for(Job(internal_=True, started="not a timestamp"), 5), 5)
+        self.assertEqual(running_for(Job(internal_=True, started=None), 5), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()